@@ -51,3 +51,41 @@ class UptimeDataByTag:
             },
             ensure_ascii=False,
         )
+
+
+@dataclass
+class UptimeSeriesByTag:
+    """区間ごとの稼働実績の時系列を格納するDTO"""
+
+    tag_series_dict: dict[str, list[UptimeData]]
+
+    @classmethod
+    def from_empty(cls) -> "UptimeSeriesByTag":
+        """空の状態で初期化する"""
+        return cls(tag_series_dict={})
+
+    def get_series(self, tag: str) -> list[UptimeData]:
+        """指定したタグの稼働実績の時系列を取得する"""
+        if tag not in self.tag_series_dict:
+            raise ValueError(f"指定したタグ '{tag}' の稼働実績が存在しません。")
+        return self.tag_series_dict[tag]
+
+    def insert_series(self, tag: str, series: list[UptimeData]) -> None:
+        """時系列を追加する"""
+        self.tag_series_dict[tag] = series
+
+    def to_json(self) -> str:
+        """JSON形式で出力する"""
+        return json.dumps(
+            {
+                tag: [
+                    {
+                        "合計工数": f"{data.uptime}h",
+                        "対象期間": f"{data.from_.strftime('%Y/%m/%d')} - {data.to.strftime('%Y/%m/%d')}",
+                    }
+                    for data in series
+                ]
+                for tag, series in self.tag_series_dict.items()
+            },
+            ensure_ascii=False,
+        )
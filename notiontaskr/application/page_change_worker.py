@@ -0,0 +1,65 @@
+import asyncio
+from typing import Awaitable, Callable
+
+from notiontaskr.app_logger import AppLogger
+from notiontaskr.domain.value_objects.page_id import PageId
+
+# 同期の対象とするWebhookのイベント(削除されたページは取得できないため対象外)
+PAGE_CHANGE_EVENT_TYPES = (
+    "page.created",
+    "page.properties_updated",
+    "page.moved",
+    "page.undeleted",
+)
+
+
+class PageChangeWorker:
+    """Webhookで通知されたページの変更をまとめて同期するワーカー
+
+    通知されたページIDを重複を除いて溜め、最初の通知から一定時間後にまとめて同期する。
+    通知がない間はNotionへ問い合わせない。
+    """
+
+    def __init__(
+        self,
+        sync: Callable[[list[PageId]], Awaitable[None]],
+        batch_seconds: float,
+        logger: AppLogger,
+    ):
+        self._sync = sync
+        self._batch_seconds = batch_seconds
+        self.logger = logger
+        self._queue: asyncio.Queue[PageId] = asyncio.Queue()
+
+    @staticmethod
+    def parse_page_id(event: dict) -> PageId | None:
+        """Webhookのイベントから同期するページIDを取得する(対象外のイベントの場合None)"""
+        entity = event.get("entity") or {}
+        if event.get("type") not in PAGE_CHANGE_EVENT_TYPES:
+            return None
+        if entity.get("type") != "page" or not entity.get("id"):
+            return None
+        return PageId(entity["id"])
+
+    def notify(self, page_id: PageId) -> None:
+        """ページの変更を通知する(ワーカーと同じイベントループから呼び出すこと)"""
+        self._queue.put_nowait(page_id)
+
+    async def run(self) -> None:
+        """通知を待ち、まとめて同期することを繰り返す"""
+        while True:
+            await self.run_once()
+
+    async def run_once(self) -> None:
+        """通知を1件待ち、待ち時間中に届いた通知とあわせて同期する"""
+        # 通知順を保ったまま重複を除く
+        page_ids = {await self._queue.get(): None}
+        await asyncio.sleep(self._batch_seconds)
+        while not self._queue.empty():
+            page_ids[self._queue.get_nowait()] = None
+
+        try:
+            await self._sync(list(page_ids))
+        except Exception as e:
+            # 同期できなかった変更は、デイリータスクで反映される
+            self.logger.error(f"ページの同期に失敗。エラー内容: {e}")
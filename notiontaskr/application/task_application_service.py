@@ -1,98 +1,286 @@
 import asyncio
+import os
+import time
 from datetime import datetime, timedelta, timezone
 from typing import List
 
+from notion_client import AsyncClient
+
 import notiontaskr.config as config
 from notiontaskr.util.converter import dt_to_month_start_end, to_isoformat
 from notiontaskr.app_logger import AppLogger
 from notiontaskr.app_timer import AppTimer
-from notiontaskr.gcs_handler import GCSHandler
-from notiontaskr.domain.name_labels.man_hours_label import ManHoursLabel
+from notiontaskr.gcs_handler import GCSHandler, GenerationMismatchError
 from notiontaskr.domain.executed_task_service import ExecutedTaskService
+from notiontaskr.domain.scheduled_task_name_index import ScheduledTaskNameIndex
 from notiontaskr.domain.scheduled_task_service import ScheduledTaskService
+from notiontaskr.domain.scheduled_task_tree_aggregator import (
+    ScheduledTaskTreeAggregator,
+)
 from notiontaskr.domain.executed_task import ExecutedTask
 from notiontaskr.domain.scheduled_task import ScheduledTask
+from notiontaskr.domain.sync_cursor import SyncCursor
+from notiontaskr.domain.task import Task
 from notiontaskr.domain.task_service import TaskService
+from notiontaskr.domain.uptime_rollup import UptimeRollup
+from notiontaskr.domain.uptime_series import UptimeBucket, UptimeSeries
+from notiontaskr.domain.value_objects.notion_id import NotionId
+from notiontaskr.domain.value_objects.page_id import PageId
 from notiontaskr.infrastructure.executed_task_repository import ExecutedTaskRepository
 from notiontaskr.infrastructure.scheduled_task_repository import ScheduledTaskRepository
 from notiontaskr.infrastructure.operator import *
+from notiontaskr.infrastructure.page_update_queue import PageUpdateQueue
+from notiontaskr.infrastructure.task_repository import TaskRepository
 from notiontaskr.infrastructure.task_search_condition import TaskSearchCondition
 from notiontaskr.infrastructure.scheduled_task_cache import ScheduledTaskCache
-from notiontaskr.application.dto.uptime_data import UptimeData, UptimeDataByTag
+from notiontaskr.infrastructure.sync_cursor_cache import SyncCursorCache
+from notiontaskr.infrastructure.uptime_rollup_cache import UptimeRollupCache
+from notiontaskr.infrastructure.notion_request_dispatcher import (
+    BatchResult,
+    NotionRequestDispatcher,
+)
+from notiontaskr.infrastructure.token_bucket import TokenBucket
+from notiontaskr.application.dto.uptime_data import (
+    UptimeData,
+    UptimeDataByTag,
+    UptimeSeriesByTag,
+)
+from notiontaskr.application.uptime_cache import UptimeCache
 
 
 class TaskApplicationService:
     def __init__(self, logger: AppLogger = AppLogger()):
         self.logger = logger
+        # 予定タスクと実績タスクのリポジトリで1つのコネクションプールを共有する
+        self.notion_client = AsyncClient(auth=config.NOTION_TOKEN)
+        # レート制限はトークン単位のため、流量制御も両リポジトリで共有する
+        self.notion_dispatcher = NotionRequestDispatcher(
+            max_in_flight=config.NOTION_MAX_IN_FLIGHT,
+            token_bucket=TokenBucket(
+                rate=config.NOTION_REQUESTS_PER_SECOND,
+                capacity=config.NOTION_REQUEST_BURST,
+            ),
+            max_retries=config.NOTION_MAX_RETRIES,
+        )
         self.executed_task_repo = ExecutedTaskRepository(
             config.NOTION_TOKEN,
             config.TASK_DB_ID,
+            client=self.notion_client,
+            dispatcher=self.notion_dispatcher,
         )
         self.scheduled_task_repo = ScheduledTaskRepository(
             config.NOTION_TOKEN,
             config.TASK_DB_ID,
+            client=self.notion_client,
+            dispatcher=self.notion_dispatcher,
+        )
+        # 予定タスクと実績タスクを1回の問い合わせで取得するためのリポジトリ
+        self.task_repo = TaskRepository(
+            config.NOTION_TOKEN,
+            config.TASK_DB_ID,
+            client=self.notion_client,
+            dispatcher=self.notion_dispatcher,
         )
         self.scheduled_task_cache = ScheduledTaskCache(
-            save_path=config.LOCAL_SCHEDULED_PICKLE_PATH
+            save_path=config.LOCAL_SCHEDULED_PICKLE_PATH,
+            delta_dir=config.LOCAL_SCHEDULED_DELTA_DIR,
         )
+        self.uptime_rollup_cache = UptimeRollupCache(
+            save_path=config.LOCAL_UPTIME_ROLLUP_PATH
+        )
+        self.sync_cursor_cache = SyncCursorCache(
+            save_path=config.LOCAL_SYNC_CURSOR_PATH
+        )
+        # レギュラータスクのページ更新を統合してから書き込むためのキュー
+        self.page_update_queue = PageUpdateQueue(
+            save_path=config.LOCAL_PAGE_UPDATE_QUEUE_PATH
+        )
+        # 常駐時はキャッシュやカーソルをメモリに保持し、GCSへはチェックポイントでまとめて保存する
+        self.keep_warm = False
+        self._gcs_handler: GCSHandler | None = None
+        self._scheduled_tasks_by_id: dict[NotionId, ScheduledTask] | None = None
+        # キャッシュの予定タスクのタスク名の索引(予定タスクのマージに合わせて更新する)
+        self._scheduled_task_name_index: ScheduledTaskNameIndex | None = None
+        # 常駐時に未保存の変更された予定タスク
+        self._dirty_scheduled_tasks: dict[NotionId, ScheduledTask] = {}
+        self._sync_cursor: SyncCursor | None = None
+        self._is_page_update_queue_loaded = False
+        # 読み込んだ書き込み待ちキューのGCS上の世代(0の場合はGCSになかったもの)
+        self._page_update_queue_generation: int | None = None
+        # 書き込み待ちの実績タスク(書き込み後に、その日を含む稼働実績のキャッシュを破棄する)
+        self._executed_tasks_to_invalidate_by_page_id: dict[PageId, ExecutedTask] = {}
+        # 稼働実績のキャッシュ(同じタグ・期間の問い合わせではNotionへ問い合わせない)
+        self.uptime_cache = UptimeCache(
+            maxsize=config.UPTIME_CACHE_MAXSIZE,
+            ttl=config.UPTIME_CACHE_TTL_SECONDS,
+            open_ttl=config.UPTIME_CACHE_OPEN_TTL_SECONDS,
+        )
+        # 読み込み済みの工数集計と、そのGCS上の世代
+        self._uptime_rollup: UptimeRollup | None = None
+        self._uptime_rollup_generation: int | None = None
+
+    async def __aenter__(self) -> "TaskApplicationService":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
+    async def aclose(self):
+        """Notionクライアントのコネクションプールを閉じる
+
+        コネクションはイベントループに紐づくため、asyncio.runを抜ける前に呼び出すこと
+        """
+        await self.notion_client.aclose()
+
+    def _get_gcs_handler(self) -> GCSHandler:
+        """GCSのクライアントを取得する(認証は初回のみ行い、以降は使い回す)"""
+        if self._gcs_handler is not None:
+            return self._gcs_handler
+
+        errors: list[Exception] = []
+        gcs_handler = GCSHandler(bucket_name=config.BUCKET_NAME, on_error=errors.append)
+        if errors:
+            # 失敗した場合は使い回さず、次回に再度初期化する
+            self.logger.error(f"GCSの初期化に失敗。エラー内容: {errors[0]}")
+            return gcs_handler
+        self._gcs_handler = gcs_handler
+        return gcs_handler
+
+    async def run_sync_daemon(
+        self,
+        interval: float,
+        checkpoint_interval: float,
+        max_ticks: int | None = None,
+    ):
+        """常駐してレギュラータスクを一定間隔で実行する
+
+        予定タスクのキャッシュ・カーソル・書き込み待ちキュー・クライアントをメモリに保持するため、
+        1回あたりの処理時間はほぼNotionへの問い合わせ時間になる。
+        GCSへはチェックポイントの間隔ごと、および終了時(キャンセル時を含む)に保存する。
+
+        :param interval: 実行間隔(秒)
+        :param checkpoint_interval: GCSへ保存する間隔(秒)
+        :param max_ticks: 実行回数の上限(Noneの場合は無制限)
+        """
+        self.logger.info("常駐モードを開始します。")
+        self.keep_warm = True
+        gcs_handler = self._get_gcs_handler()
+        last_checkpoint_time = time.monotonic()
+        tick_count = 0
+        try:
+            while max_ticks is None or tick_count < max_ticks:
+                tick_timer = AppTimer.init_and_start()
+                try:
+                    self._load_page_update_queue(gcs_handler=gcs_handler)
+                    try:
+                        await self._sync_edited_tasks(gcs_handler=gcs_handler)
+                    finally:
+                        await self._flush_page_updates(
+                            gcs_handler=gcs_handler,
+                            delay=config.PAGE_UPDATE_FLUSH_DELAY_SECONDS,
+                        )
+                except Exception as e:
+                    self.logger.error(f"同期に失敗。エラー内容: {e}")
+                tick_count += 1
+
+                if time.monotonic() - last_checkpoint_time >= checkpoint_interval:
+                    await self._checkpoint(gcs_handler=gcs_handler)
+                    last_checkpoint_time = time.monotonic()
+
+                await asyncio.sleep(max(0.0, interval - tick_timer.get_elapsed_time()))
+        finally:
+            await self._checkpoint(gcs_handler=gcs_handler)
+
+    async def _checkpoint(self, gcs_handler: GCSHandler):
+        """常駐時にメモリ上の状態をGCSへ保存するメソッド
+
+        予定タスクを保存できなかった場合は、その変更を取り直せるようカーソルを保存しない。
+        """
+        is_saved = await self._save_dirty_scheduled_tasks(gcs_handler=gcs_handler)
+        self._save_page_update_queue(gcs_handler=gcs_handler)
+        if is_saved and self._sync_cursor is not None:
+            self._upload_sync_cursor(cursor=self._sync_cursor, gcs_handler=gcs_handler)
+        self.logger.info("チェックポイントを保存しました。")
 
     async def daily_task(self):
         """毎日0時に実行されるタスク"""
 
-        gcs_handler = GCSHandler(
-            bucket_name=config.BUCKET_NAME,
-            on_error=lambda e: self.logger.error(
-                f"GCSの初期化に失敗。エラー内容: {e}",
-            ),
-        )
+        gcs_handler = self._get_gcs_handler()
 
         # notionから過去一年分の情報を取得し、Pickleに保存する
         self.logger.info("デイリータスクを開始します。")
         main_timer = AppTimer.init_and_start()
 
+        # 書き込み待ちのページ更新を先に書き込み、Notionを最新の状態にしてから取得する
+        self._load_page_update_queue(gcs_handler=gcs_handler)
+        await self._flush_page_updates(gcs_handler=gcs_handler, delay=0)
+
+        # 取得開始前にある差分は、今回のスナップショットに含まれるため最後に削除する
+        compacted_delta_paths = self._list_delta_paths(gcs_handler=gcs_handler)
+
         # 過去一年分のタスクを取得
-        # 条件作成(過去一年~未来)
-        condition = TaskSearchCondition().or_(
-            TaskSearchCondition().where_last_edited_time(
-                operator=DateOperator.PAST_YEAR,
-            ),
-            TaskSearchCondition().where_last_edited_time(
-                date=datetime.now().strftime("%Y-%m-%d"),
-                operator=DateOperator.ON_OR_AFTER,
-            ),
+        # 条件作成(最終更新日時が過去一年~現在。期間を分割して並列に取得する)
+        now = datetime.now(timezone.utc)
+        conditions = TaskSearchCondition.split_last_edited_time(
+            from_=now - timedelta(days=365),
+            to=now,
+            partition_count=config.NOTION_FETCH_PARTITION_COUNT,
         )
 
-        # 予定タスクをすべて取得する
-        scheduled_tasks = await self.scheduled_task_repo.find_all_by_condition(
-            condition=condition,
-            on_error=lambda e, data: self.logger.error(
-                f"予定タスク[{data['properties']['ID']['unique_id']['number']}]の取得に失敗。エラー内容: {e}"
-            ),
+        # 前日までのタグ・日ごとの工数を集計し、稼働実績の取得に使う
+        today = now.date()
+        rollup = UptimeRollup(
+            covered_from=today - timedelta(days=config.UPTIME_ROLLUP_DAYS),
+            closed_until=today,
         )
 
-        # 実績タスクを全て取得する
-        executed_tasks = await self.executed_task_repo.find_all_by_condition(
-            condition=condition,
+        # 予定タスクと実績タスクを1回の問い合わせで取得し、取得したものから順に処理する
+        scheduled_tasks: list[ScheduledTask] = []
+        scheduled_tasks_by_id: dict[NotionId, ScheduledTask] = {}
+        scheduled_task_name_index = ScheduledTaskNameIndex()
+        executed_tasks: list[ExecutedTask] = []
+        # 予定タスクが揃うまで紐づけを待つ実績タスク
+        pending_executed_tasks: list[ExecutedTask] = []
+
+        def link_executed_tasks(tasks: list[ExecutedTask]):
+            # 実績タスクにIDを付与する(未付与のもののみ)
+            _ = ExecutedTaskService.get_tasks_add_id_tag(
+                to=tasks, source=scheduled_task_name_index
+            )
+            # 予定タスクに実績タスクを紐づける
+            _ = ScheduledTaskService.get_tasks_upserted_executed_tasks(
+                scheduled_tasks_by_id=scheduled_tasks_by_id,
+                executed_tasks=tasks,
+                on_error=lambda e, task: self.logger.error(
+                    f"予定タスク[{task.id.number}]と実績タスクの紐づけに失敗。エラー内容: {e}"
+                ),
+            )
+
+        async for task in self.task_repo.iter_all_by_partitioned_conditions(
+            conditions=conditions,
             on_error=lambda e, data: self.logger.error(
-                f"実績タスク[{data['properties']['ID']['unique_id']['number']}]の取得に失敗。エラー内容: {e}"
+                f"タスク[{data['properties']['ID']['unique_id']['number']}]の取得に失敗。エラー内容: {e}"
             ),
-        )
+        ):
+            if isinstance(task, ScheduledTask):
+                scheduled_tasks.append(task)
+                scheduled_tasks_by_id[task.id] = task
+                scheduled_task_name_index.upsert(task)
+            elif isinstance(task, ExecutedTask):
+                executed_tasks.append(task)
+                rollup.add(task)
+                # 紐づく予定タスクが取得済みであれば、結果は変わらないため先に紐づける
+                if task.scheduled_task_id in scheduled_tasks_by_id:
+                    link_executed_tasks([task])
+                else:
+                    pending_executed_tasks.append(task)
 
-        # 実績タスクにIDを付与する(未付与のもののみ)
-        _ = ExecutedTaskService.get_tasks_add_id_tag(
-            to=executed_tasks, source=scheduled_tasks
-        )
+        # 予定タスクが揃ったため、名前での照合が必要な実績タスクを紐づける
+        link_executed_tasks(pending_executed_tasks)
 
-        # 予定タスクに実績タスクを紐づける
-        _ = ScheduledTaskService.get_tasks_upserted_executed_tasks(
-            scheduled_tasks_by_id={
-                scheduled_task.id: scheduled_task for scheduled_task in scheduled_tasks
-            },
-            executed_tasks=executed_tasks,
-            on_error=lambda e, task: self.logger.error(
-                f"予定タスク[{task.id.number}]と実績タスクの紐づけに失敗。エラー内容: {e}"
-            ),
-        )
+        self._save_uptime_rollup(rollup=rollup, gcs_handler=gcs_handler)
+        # 工数集計を作り直したため、稼働実績のキャッシュも破棄する
+        self.uptime_cache.clear()
 
         # 予定タスクにサブアイテムを紐づける
         _ = ScheduledTaskService.get_tasks_appended_sub_tasks(
@@ -106,53 +294,107 @@ class TaskApplicationService:
             ),
         )
 
-        # 予定タスクのプロパティを更新
-        for scheduled_task in scheduled_tasks:
-            self._update_scheduled_task_properties(scheduled_task)
+        # 予定タスクのプロパティを更新(木を一度だけ走査する)
+        _ = ScheduledTaskTreeAggregator.aggregate(scheduled_tasks)
 
         # 更新
+        executed_tasks_to_update = [
+            executed_task
+            for scheduled_task in scheduled_tasks
+            for executed_task in scheduled_task.executed_tasks
+            if scheduled_task.executed_tasks
+        ]
+        written_executed_tasks = TaskService.get_updated_tasks(executed_tasks_to_update)
         tasks = []
         tasks.append(self._update_scheduled_tasks(scheduled_tasks))
-        tasks.append(
-            self._update_executed_tasks(
-                [
-                    executed_task
-                    for scheduled_task in scheduled_tasks
-                    for executed_task in scheduled_task.executed_tasks
-                    if scheduled_task.executed_tasks
-                ]
-            )
-        )
+        tasks.append(self._update_executed_tasks(executed_tasks_to_update))
 
         _ = await asyncio.gather(*tasks)
 
-        # pickleの保存
-        await self._save_pickle(
+        # 書き込み中に古い実績でキャッシュされうるため、書き込んだ実績タスクの日を含むものを破棄する
+        self._invalidate_uptime_cache(executed_tasks=written_executed_tasks)
+
+        # pickleの保存(スナップショットを保存し、差分を集約する)
+        if await self._save_pickle(
             scheduled_tasks=scheduled_tasks, gcs_handler=gcs_handler
-        )
+        ):
+            self._delete_deltas(
+                gcs_handler=gcs_handler, delta_paths=compacted_delta_paths
+            )
 
         self.logger.info("処理時間: " + str(main_timer.get_elapsed_time()) + "秒")
 
     async def regular_task(self):
-        """予定タスクのIDを持つ実績タスクにIDを付与する"""
+        """予定タスクのIDを持つ実績タスクにIDを付与する
+
+        ページの更新は書き込み待ちキューに積み、一定時間が経過したものから書き込む。
+        """
         self.logger.info("レギュラータスクを開始します。")
-        main_timer = AppTimer.init_and_start()
 
-        gcs_handler = GCSHandler(
-            bucket_name=config.BUCKET_NAME,
-            on_error=lambda e: self.logger.error(
-                f"GCSの初期化に失敗。エラー内容: {e}",
-            ),
-        )
+        gcs_handler = self._get_gcs_handler()
+
+        self._load_page_update_queue(gcs_handler=gcs_handler)
+        try:
+            await self._sync_edited_tasks(gcs_handler=gcs_handler)
+        finally:
+            # 取得したタスクがない場合も、待ち時間を過ぎた更新は書き込む
+            await self._flush_page_updates(
+                gcs_handler=gcs_handler,
+                delay=config.PAGE_UPDATE_FLUSH_DELAY_SECONDS,
+            )
+
+    async def sync_pages(self, page_ids: list[PageId]):
+        """指定したページのみを取得し、紐づけと集計の結果を書き込む
+
+        Webhookで変更が通知されたページの同期に使う。
+        """
+        self.logger.info(f"{len(page_ids)}件のページの同期を開始します。")
 
-        # 条件作成(最終更新日が1分前~現在。formatは`2025-05-09T14:40:00.000Z`ISO 8601形式)
+        gcs_handler = self._get_gcs_handler()
+
+        self._load_page_update_queue(gcs_handler=gcs_handler)
+        try:
+            results = await asyncio.gather(
+                *(self.task_repo.find_by_page_id(page_id) for page_id in page_ids),
+                return_exceptions=True,
+            )
+            fetched_tasks = []
+            for page_id, result in zip(page_ids, results):
+                if isinstance(result, Exception):
+                    self.logger.error(
+                        f"ページ[{page_id}]の取得に失敗。エラー内容: {result}"
+                    )
+                    continue
+                fetched_tasks.append(result)
+
+            await self._apply_fetched_tasks(
+                fetched_tasks=fetched_tasks, gcs_handler=gcs_handler
+            )
+        finally:
+            # 通知から反映までの時間を短くするため、待たずに書き込む
+            await self._flush_page_updates(gcs_handler=gcs_handler, delay=0)
+
+    async def _sync_edited_tasks(self, gcs_handler: GCSHandler):
+        """前回処理したページ以降に編集されたタスクを取得し、紐づけと集計の結果を書き込み待ちキューに積む
+
+        前回処理したページの最終更新日時(カーソル)から取得するため、実行が遅れたり失敗したりしても編集を取りこぼさない。
+        """
+        overlap = timedelta(seconds=config.REGULAR_TASK_OVERLAP_SECONDS)
+        cursor = self._load_sync_cursor(gcs_handler=gcs_handler)
+        if cursor is not None:
+            # 最終更新日時は分単位に丸められるため、重なり期間だけ遡って取得する
+            fetch_from = cursor.get_from(overlap)
+        else:
+            fetch_from = datetime.now(timezone.utc) - timedelta(
+                seconds=config.REGULAR_TASK_LOOKBACK_SECONDS
+            )
+
+        # 条件作成(最終更新日がカーソル~現在。formatは`2025-05-09T14:40:00.000Z`ISO 8601形式)
         condition = TaskSearchCondition().and_(
-            # 1分前~
+            # カーソル~
             TaskSearchCondition().where_last_edited_time(
                 operator=DateOperator.ON_OR_AFTER,
-                date=to_isoformat(
-                    datetime.now(timezone.utc) - timedelta(minutes=1, seconds=30)
-                ),
+                date=to_isoformat(fetch_from.astimezone(timezone.utc)),
             ),
             # ~現在
             TaskSearchCondition().where_last_edited_time(
@@ -164,26 +406,53 @@ class TaskApplicationService:
 
         fetch_tasks_timer = AppTimer.init_and_start()
 
-        # 条件にあう予定タスクと実績タスクを並列で取得する
-        results = await asyncio.gather(
-            self.scheduled_task_repo.find_by_condition(
-                condition=condition,
-                on_error=lambda e, data: self.logger.error(
-                    f"予定タスク[{data['properties']['ID']['unique_id']['number']}]の取得に失敗。エラー内容: {e}"
-                ),
-            ),
-            self.executed_task_repo.find_by_condition(
-                condition=condition,
-                on_error=lambda e, data: self.logger.error(
-                    f"実績タスク[{data['properties']['ID']['unique_id']['number']}]の取得に失敗。エラー内容: {e}"
-                ),
+        # 条件にあう予定タスクと実績タスクを1回の問い合わせで取得する
+        fetched_tasks = await self.task_repo.find_all_by_condition(
+            condition=condition,
+            on_error=lambda e, data: self.logger.error(
+                f"タスク[{data['properties']['ID']['unique_id']['number']}]の取得に失敗。エラー内容: {e}"
             ),
         )
-        fetched_scheduled_tasks, fetched_executed_tasks = results[0], results[1]
-
         self.logger.debug(
             f"【処理時間】予定タスクと実績タスクの取得: {fetch_tasks_timer.get_elapsed_time()}秒"
         )
+
+        # 重なり期間に含まれる処理済みのページは除く
+        if cursor is not None:
+            fetched_tasks = [
+                task for task in fetched_tasks if not cursor.is_processed(task)
+            ]
+
+        if not await self._apply_fetched_tasks(
+            fetched_tasks=fetched_tasks, gcs_handler=gcs_handler
+        ):
+            return
+
+        # 処理に成功した場合のみカーソルを進める
+        next_cursor = (
+            cursor.advance(fetched_tasks, overlap=overlap)
+            if cursor is not None
+            else SyncCursor.from_tasks(fetched_tasks, overlap=overlap)
+        )
+        if next_cursor is not None and next_cursor != cursor:
+            self._save_sync_cursor(cursor=next_cursor, gcs_handler=gcs_handler)
+
+    async def _apply_fetched_tasks(
+        self, fetched_tasks: list[Task], gcs_handler: GCSHandler
+    ) -> bool:
+        """取得したタスクをキャッシュの予定タスクと紐づけて集計し、更新を書き込み待ちキューに積む
+
+        :return: 処理を完了した場合True(キャッシュを読み込めなかった場合や保存できなかった場合False)
+        """
+        main_timer = AppTimer.init_and_start()
+
+        fetched_scheduled_tasks = [
+            task for task in fetched_tasks if isinstance(task, ScheduledTask)
+        ]
+        fetched_executed_tasks = [
+            task for task in fetched_tasks if isinstance(task, ExecutedTask)
+        ]
+
         self.logger.info(f"取得した予定タスクの数: {len(fetched_scheduled_tasks)}")
         self.logger.info(f"取得した実績タスクの数: {len(fetched_executed_tasks)}")
 
@@ -192,30 +461,30 @@ class TaskApplicationService:
                 "取得した予定タスクと実績タスクがありません。処理を終了します。"
             )
             self.logger.debug(f"【処理時間】合計: {main_timer.get_elapsed_time()}秒")
-            return
+            return True
 
-        # pickleから予定タスクを取得
-        cache_scheduled_tasks = await self._load_pickle(gcs_handler=gcs_handler)
-        if cache_scheduled_tasks is None:
-            return
+        # キャッシュから予定タスクを取得
+        scheduled_tasks_by_id = await self._get_scheduled_tasks_by_id(
+            gcs_handler=gcs_handler
+        )
+        if scheduled_tasks_by_id is None:
+            return False
 
         add_executed_id_timer = AppTimer.init_and_start()
 
-        # キャッシュの予定タスクを辞書に変換
-        scheduled_tasks_by_id = {
-            scheduled_task.id: scheduled_task
-            for scheduled_task in cache_scheduled_tasks  # type: ignore
-        }
-
         # キャッシュと取得した予定タスクをマージする
+        scheduled_task_name_index = self._get_scheduled_task_name_index(
+            scheduled_tasks_by_id=scheduled_tasks_by_id
+        )
         scheduled_tasks_by_id = ScheduledTaskService.merge_scheduled_tasks(
             scheduled_tasks_by_id=scheduled_tasks_by_id,
             sources=fetched_scheduled_tasks,
+            name_index=scheduled_task_name_index,
         )
 
         # 実績タスクにIDを付与し、付与した予定タスクを取得(未付与のもののみ)
         scheduled_tasks_id_added = ExecutedTaskService.get_tasks_add_id_tag(
-            to=fetched_executed_tasks, source=list(scheduled_tasks_by_id.values())
+            to=fetched_executed_tasks, source=scheduled_task_name_index
         )
 
         self.logger.debug(
@@ -223,6 +492,12 @@ class TaskApplicationService:
         )
         calc_man_hours_timer = AppTimer.init_and_start()
 
+        # 編集前の実績タスク(紐づけで置き換わる前のキャッシュのもの)
+        previous_executed_tasks = self._get_previous_executed_tasks(
+            executed_tasks=fetched_executed_tasks,
+            scheduled_tasks_by_id=scheduled_tasks_by_id,
+        )
+
         # 予定タスクと実績タスクの紐づけ
         scheduled_tasks_upserted_executed = ScheduledTaskService.get_tasks_upserted_executed_tasks(
             scheduled_tasks_by_id=scheduled_tasks_by_id,
@@ -253,9 +528,11 @@ class TaskApplicationService:
             + parent_tasks_appended_child
         }
 
-        # 予定タスクのプロパティを更新
-        for scheduled_task in list(scheduled_tasks_to_update_by_id.values()):
-            self._update_scheduled_task_properties(scheduled_task)
+        # 予定タスクのプロパティを更新し、集計で変更されうるサブアイテムも更新対象にする
+        for scheduled_task in ScheduledTaskTreeAggregator.aggregate(
+            list(scheduled_tasks_to_update_by_id.values())
+        ):
+            scheduled_tasks_to_update_by_id[scheduled_task.id] = scheduled_task
 
         # 既存データを辞書に変換
         update_executed_task_data = {task.id: task for task in fetched_executed_tasks}
@@ -267,27 +544,146 @@ class TaskApplicationService:
                     continue
                 update_executed_task_data[executed_task.id] = executed_task
 
-        # 更新
-        tasks = []
-        tasks.append(
-            self._update_scheduled_tasks(list(scheduled_tasks_to_update_by_id.values()))
-        )
-        tasks.append(
-            self._update_executed_tasks(list(update_executed_task_data.values()))
+        # 更新(書き込み待ちキューに積み、同じページへの更新を統合してから書き込む)
+        self._enqueue_updated_tasks(
+            scheduled_tasks=list(scheduled_tasks_to_update_by_id.values()),
+            executed_tasks=list(update_executed_task_data.values()),
         )
 
-        await asyncio.gather(*tasks)
+        # 編集前後の実績タスクの日を含む稼働実績のキャッシュを破棄する(書き込み待ちのものは書き込み後にも破棄する)
+        self._invalidate_uptime_cache(
+            executed_tasks=previous_executed_tasks
+            + list(update_executed_task_data.values())
+        )
 
         # pickleの保存
-        await self._save_pickle(
-            scheduled_tasks=list(scheduled_tasks_to_update_by_id.values()),
+        if self.keep_warm:
+            # 常駐時はチェックポイントでまとめて保存する
+            self._dirty_scheduled_tasks.update(scheduled_tasks_to_update_by_id)
+        elif not await self._save_scheduled_tasks(
+            scheduled_tasks_by_id=scheduled_tasks_by_id,
+            changed_tasks=list(scheduled_tasks_to_update_by_id.values()),
             gcs_handler=gcs_handler,
-        )
+        ):
+            # 保存できなかった変更を次回に取得し直すため、カーソルは進めない
+            return False
 
         self.logger.debug(
             f"【処理時間】実績タスクの工数計算: {calc_man_hours_timer.get_elapsed_time()}秒"
         )
         self.logger.debug(f"【処理時間】合計: {main_timer.get_elapsed_time()}秒")
+        return True
+
+    async def _get_scheduled_tasks_by_id(
+        self, gcs_handler: GCSHandler
+    ) -> dict[NotionId, ScheduledTask] | None:
+        """キャッシュの予定タスクをIDごとの辞書で取得するメソッド
+
+        常駐時は、GCSのキャッシュが他の処理で更新されていなければメモリ上のものを使う。
+
+        :return: 読み込めなかった場合None
+        """
+        if self.keep_warm and self._scheduled_tasks_by_id is not None:
+            if not self._is_remote_cache_updated(gcs_handler=gcs_handler):
+                return self._scheduled_tasks_by_id
+            # 読み直すと失われるため、未保存の変更を先に保存する(失敗した場合は次回に持ち越す)
+            if not await self._save_dirty_scheduled_tasks(gcs_handler=gcs_handler):
+                return None
+
+        # pickleから予定タスクを取得
+        cache_scheduled_tasks = await self._load_pickle(gcs_handler=gcs_handler)
+        if cache_scheduled_tasks is None:
+            return None
+
+        # キャッシュの予定タスクを辞書に変換
+        self._scheduled_tasks_by_id = {
+            scheduled_task.id: scheduled_task
+            for scheduled_task in cache_scheduled_tasks  # type: ignore
+        }
+        self._scheduled_task_name_index = None
+        return self._scheduled_tasks_by_id
+
+    def _get_scheduled_task_name_index(
+        self, scheduled_tasks_by_id: dict[NotionId, ScheduledTask]
+    ) -> ScheduledTaskNameIndex:
+        """キャッシュの予定タスクのタスク名の索引を取得するメソッド
+
+        キャッシュを読み込み直した後の初回のみ全件から生成し、以降はマージに合わせて更新したものを使う。
+        """
+        if self._scheduled_task_name_index is None:
+            self._scheduled_task_name_index = (
+                ScheduledTaskNameIndex.from_scheduled_tasks(
+                    list(scheduled_tasks_by_id.values())
+                )
+            )
+        return self._scheduled_task_name_index
+
+    def _is_remote_cache_updated(self, gcs_handler: GCSHandler) -> bool:
+        """GCSのキャッシュが読み込み後に他の処理で更新されたかを判定するメソッド
+
+        スナップショットの世代と差分の一覧のみを取得し、ダウンロードはしない。
+        """
+        try:
+            generation = gcs_handler.get_generation(config.BUCKET_SCHEDULED_PICKLE_PATH)
+            remote_delta_names = {
+                os.path.basename(path)
+                for path in self._list_delta_paths(gcs_handler=gcs_handler, strict=True)
+            }
+        except Exception as e:
+            self.logger.warning(f"キャッシュの更新確認に失敗。エラー内容: {e}")
+            return True
+        return generation != self.scheduled_task_cache.get_generation() or (
+            remote_delta_names != set(self.scheduled_task_cache.get_delta_names())
+        )
+
+    async def _save_dirty_scheduled_tasks(self, gcs_handler: GCSHandler) -> bool:
+        """常駐時に未保存の変更された予定タスクを保存するメソッド
+
+        :return: 保存に成功した場合True(保存するものがない場合を含む。失敗した場合は未保存のまま残す)
+        """
+        if not self._dirty_scheduled_tasks or self._scheduled_tasks_by_id is None:
+            return True
+        if not await self._save_scheduled_tasks(
+            scheduled_tasks_by_id=self._scheduled_tasks_by_id,
+            changed_tasks=list(self._dirty_scheduled_tasks.values()),
+            gcs_handler=gcs_handler,
+        ):
+            return False
+        self._dirty_scheduled_tasks = {}
+        return True
+
+    async def _save_scheduled_tasks(
+        self,
+        scheduled_tasks_by_id: dict[NotionId, ScheduledTask],
+        changed_tasks: list[ScheduledTask],
+        gcs_handler: GCSHandler,
+    ) -> bool:
+        """変更された予定タスクを差分として保存するメソッド
+
+        差分が溜まりすぎた場合は、マージ済みの全件をスナップショットとして保存する。
+
+        :return: 保存に成功した場合True
+        """
+        loaded_delta_names = self.scheduled_task_cache.get_delta_names()
+        if len(loaded_delta_names) >= config.MAX_SCHEDULED_DELTA_COUNT:
+            if not await self._save_pickle(
+                scheduled_tasks=list(scheduled_tasks_by_id.values()),
+                gcs_handler=gcs_handler,
+            ):
+                return False
+            self._delete_deltas(
+                gcs_handler=gcs_handler,
+                delta_paths=[
+                    config.BUCKET_SCHEDULED_DELTA_PREFIX + name
+                    for name in loaded_delta_names
+                ],
+            )
+            return True
+        # 変更された予定タスクのみを差分として追記する
+        return await self._save_delta_pickle(
+            scheduled_tasks=changed_tasks,
+            gcs_handler=gcs_handler,
+        )
 
     async def get_uptime(
         self, tags: list[str], from_: datetime, to: datetime
@@ -297,7 +693,175 @@ class TaskApplicationService:
         :param tags: タグのリスト
         :return: 稼働実績DTO
         """
+        if not tags:
+            return UptimeDataByTag.from_empty()
 
+        cached_uptime_data_by_tag = self.uptime_cache.get(tags=tags, from_=from_, to=to)
+        if cached_uptime_data_by_tag is not None:
+            return cached_uptime_data_by_tag
+
+        man_hours_by_tag = {tag: 0.0 for tag in tags}
+
+        # 集計済みの期間は、デイリータスクで作成した工数集計から取得する
+        fetch_from = from_
+        rollup = self._load_uptime_rollup()
+        if rollup is not None and rollup.covers(UptimeRollup.to_day(from_)):
+            for tag in tags:
+                man_hours_by_tag[tag] = rollup.get_total_man_hours(
+                    tag=tag,
+                    from_=UptimeRollup.to_day(from_),
+                    to=UptimeRollup.to_day(to),
+                )
+            fetch_from = rollup.get_open_from(from_)
+
+        # 未集計の期間(当日以降)のみNotionから取得する
+        if fetch_from <= to:
+            executed_tasks_by_tag = await self._fetch_executed_tasks_by_tag(
+                tags=tags, from_=fetch_from, to=to
+            )
+            for tag, tasks in executed_tasks_by_tag.items():
+                man_hours_by_tag[tag] += ExecutedTaskService.get_total_man_hours(tasks)
+
+        # タグごとの稼働実績を作成する
+        uptime_data_by_tag = UptimeDataByTag.from_empty()
+        for tag, man_hours in man_hours_by_tag.items():
+            uptime_data_by_tag.insert_data(
+                data=UptimeData(
+                    tag=tag,
+                    uptime=man_hours,
+                    from_=from_,
+                    to=to,
+                )
+            )
+
+        self.uptime_cache.set(
+            tags=tags, from_=from_, to=to, uptime_data_by_tag=uptime_data_by_tag
+        )
+
+        # DTOを返却
+        return uptime_data_by_tag
+
+    async def get_uptime_series(
+        self, tags: list[str], from_: datetime, to: datetime, bucket: UptimeBucket
+    ) -> "UptimeSeriesByTag":
+        """指定したタグの稼働実績を区間ごとの時系列で取得する
+
+        期間全体の実績タスクを1回で取得し、タグ・区間ごとに1回の走査で振り分ける。
+
+        :param tags: タグのリスト
+        :param bucket: 区間の単位
+        :return: 稼働実績の時系列DTO
+        """
+        if not tags:
+            return UptimeSeriesByTag.from_empty()
+
+        series = UptimeSeries.from_empty(
+            tags=tags,
+            bucket=bucket,
+            from_=UptimeRollup.to_day(from_),
+            to=UptimeRollup.to_day(to),
+        )
+
+        # 集計済みの期間は、デイリータスクで作成した工数集計から取得する
+        fetch_from = from_
+        rollup = self._load_uptime_rollup()
+        if rollup is not None and rollup.covers(UptimeRollup.to_day(from_)):
+            for tag in tags:
+                man_hours_by_day = rollup.get_man_hours_by_day(
+                    tag=tag,
+                    from_=UptimeRollup.to_day(from_),
+                    to=UptimeRollup.to_day(to),
+                )
+                for day, man_hours in man_hours_by_day.items():
+                    series.add(tag=tag, day=day, man_hours=man_hours)
+            fetch_from = rollup.get_open_from(from_)
+
+        # 未集計の期間(当日以降)のみNotionから取得する
+        if fetch_from <= to:
+            executed_tasks_by_tag = await self._fetch_executed_tasks_by_tag(
+                tags=tags, from_=fetch_from, to=to
+            )
+            for tag, tasks in executed_tasks_by_tag.items():
+                for task in tasks:
+                    if task.date is None:
+                        continue
+                    series.add(
+                        tag=tag,
+                        day=UptimeRollup.to_day(task.date.start),
+                        man_hours=float(task.man_hours),
+                    )
+
+        # タグごとの時系列を作成する
+        uptime_series_by_tag = UptimeSeriesByTag.from_empty()
+        for tag in tags:
+            uptime_series_by_tag.insert_series(
+                tag=tag,
+                series=[
+                    UptimeData(
+                        tag=tag,
+                        uptime=man_hours,
+                        from_=datetime.combine(start, datetime.min.time()),
+                        to=datetime.combine(end, datetime.min.time()),
+                    )
+                    for start, end, man_hours in series.get_man_hours(tag)
+                ],
+            )
+
+        # DTOを返却
+        return uptime_series_by_tag
+
+    @staticmethod
+    def _get_previous_executed_tasks(
+        executed_tasks: list[ExecutedTask],
+        scheduled_tasks_by_id: dict[NotionId, ScheduledTask],
+    ) -> list[ExecutedTask]:
+        """編集された実績タスクの編集前のものを、紐づけ前のキャッシュの予定タスクから取得するメソッド"""
+        previous_tasks = []
+        for executed_task in executed_tasks:
+            scheduled_task = (
+                scheduled_tasks_by_id.get(executed_task.scheduled_task_id)
+                if executed_task.scheduled_task_id
+                else None
+            )
+            previous_task = (
+                scheduled_task.executed_tasks.get(executed_task.id)
+                if scheduled_task
+                else None
+            )
+            if previous_task is not None:
+                previous_tasks.append(previous_task)
+        return previous_tasks
+
+    def _invalidate_flushed_uptime_cache(self):
+        """書き込み待ちキューから書き込まれた実績タスクの日を含む稼働実績のキャッシュを破棄するメソッド"""
+        flushed_tasks = [
+            task
+            for page_id, task in self._executed_tasks_to_invalidate_by_page_id.items()
+            if page_id not in self.page_update_queue
+        ]
+        for task in flushed_tasks:
+            del self._executed_tasks_to_invalidate_by_page_id[task.page_id]
+        self._invalidate_uptime_cache(executed_tasks=flushed_tasks)
+
+    def _invalidate_uptime_cache(self, executed_tasks: list[ExecutedTask]):
+        """実績タスクのタグを含み、期間が実績タスクの日を含む稼働実績のキャッシュを破棄するメソッド"""
+        invalidated_count = 0
+        for task in executed_tasks:
+            if task.date is None:
+                continue
+            invalidated_count += self.uptime_cache.invalidate(
+                tags=[str(tag) for tag in task.tags],
+                days=[UptimeRollup.to_day(task.date.start)],
+            )
+        if invalidated_count:
+            self.logger.info(
+                f"稼働実績のキャッシュを{invalidated_count}件破棄しました。"
+            )
+
+    async def _fetch_executed_tasks_by_tag(
+        self, tags: list[str], from_: datetime, to: datetime
+    ) -> dict[str, list[ExecutedTask]]:
+        """指定した期間・タグの実績タスクをNotionから取得し、タグごとに振り分ける"""
         condition = TaskSearchCondition().and_(
             # 日付のフィルター
             TaskSearchCondition().where_date(
@@ -308,60 +872,69 @@ class TaskApplicationService:
                 operator=DateOperator.ON_OR_BEFORE,
                 date=to_isoformat(to),
             ),
+            # 指定タグのいずれかを持つ実績タスクのみを取得する
+            TaskSearchCondition().where_any_tag(tags),
         )
 
-        fetched_executed_tasks = await self.executed_task_repo.find_by_condition(
+        # 100件を超える場合もあるため、ページネーションで全件取得する
+        fetched_executed_tasks = await self.executed_task_repo.find_all_by_condition(
             condition=condition,
             on_error=lambda e, data: self.logger.error(
                 f"実績タスク[{data['properties']['ID']['unique_id']['number']}]の取得に失敗。エラー内容: {e}"
             ),
         )
 
-        # 指定タグ配列に一致する予定タスクを辞書型で取得する
-        executed_tasks_by_tag = ExecutedTaskService.get_executed_tasks_by_tag(
+        # 複数のタグを持つ実績タスクもあるため、タグごとに振り分ける
+        return ExecutedTaskService.get_executed_tasks_by_tag(
             executed_tasks=fetched_executed_tasks,
             tags=tags,
         )
 
-        # タグごとの稼働実績を計算する
-        uptime_data_by_tag = UptimeDataByTag.from_empty()
-        for tag, tasks in executed_tasks_by_tag.items():
-            uptime_data_by_tag.insert_data(
-                data=UptimeData(
-                    tag=tag,
-                    uptime=ExecutedTaskService.get_total_man_hours(tasks),
-                    from_=from_,
-                    to=to,
-                )
-            )
+    def _load_uptime_rollup(self) -> UptimeRollup | None:
+        """GCSから工数集計を読み込むメソッド
 
-        # DTOを返却
-        return uptime_data_by_tag
+        GCS上の世代が読み込み済みのものと同じ場合は、ダウンロードと読み込みを省略する。
+
+        :return: 読み込めなかった場合None
+        """
+        try:
+            gcs_handler = self._get_gcs_handler()
+            generation = gcs_handler.download_if_updated(
+                from_=config.BUCKET_UPTIME_ROLLUP_PATH,
+                to=self.uptime_rollup_cache.save_path,
+                generation=self._uptime_rollup_generation,
+            )
+            if (
+                self._uptime_rollup is None
+                or generation != self._uptime_rollup_generation
+            ):
+                self._uptime_rollup = self.uptime_rollup_cache.load()
+                self._uptime_rollup_generation = generation
+            return self._uptime_rollup
+        except Exception as e:
+            self.logger.warning(
+                f"工数集計の読み込みに失敗したため、Notionから取得します。エラー内容: {e}"
+            )
+            return None
 
-    def _update_scheduled_task_properties(self, scheduled_task: ScheduledTask):
-        """予定タスクのプロパティを更新するメソッド"""
-        # サブアイテムに親IDラベルを付与する
-        scheduled_task.update_sub_tasks_properties()
-        # サブアイテムの工数を集計し、ラベルを更新する
-        scheduled_task.aggregate_man_hours()
-        # 実績タスクのステータスを更新する
-        scheduled_task.update_status_by_checking_properties()
-        # 進捗率を更新する
-        scheduled_task.calc_progress_rate()
-        # 実績人時ラベルを更新する
-        scheduled_task.update_man_hours_label(
-            ManHoursLabel.from_man_hours(
-                executed_man_hours=scheduled_task.executed_man_hours,
-                scheduled_man_hours=scheduled_task.scheduled_man_hours,
-            )
-        )
-        # 予定タスクが持つ実績タスクのプロパティを更新する
-        scheduled_task.update_executed_tasks_properties()
+    def _save_uptime_rollup(self, rollup: UptimeRollup, gcs_handler: GCSHandler):
+        """工数集計を保存し、GCSへアップロードするメソッド"""
+        try:
+            self.uptime_rollup_cache.save(rollup)
+            generation = gcs_handler.upload(
+                from_=self.uptime_rollup_cache.save_path,
+                to=config.BUCKET_UPTIME_ROLLUP_PATH,
+            )
+            self._uptime_rollup = rollup
+            self._uptime_rollup_generation = generation
+            self.logger.info("工数集計のGCSへのアップロードに成功しました。")
+        except Exception as e:
+            self.logger.error(f"工数集計の保存に失敗。エラー内容: {e}")
 
     async def _update_scheduled_tasks(
         self,
         scheduled_tasks: list[ScheduledTask],
-    ):
+    ) -> BatchResult:
         """予定タスクの実績工数を更新するメソッド"""
         updated_scheduled_tasks = TaskService.get_updated_tasks(scheduled_tasks)
         tasks = []
@@ -377,15 +950,199 @@ class TaskApplicationService:
                     ),
                 )
             )
-        await asyncio.gather(*tasks)
+        result = BatchResult.from_results(await asyncio.gather(*tasks))
+        self.logger.info(
+            f"予定タスクの更新結果: 成功{result.success_count}件, 失敗{result.failure_count}件"
+        )
+        return result
+
+    def _load_sync_cursor(self, gcs_handler: GCSHandler) -> SyncCursor | None:
+        """GCSからレギュラータスクのカーソルを読み込むメソッド
+
+        :return: 読み込めなかった場合None(固定の期間を遡って取得する)
+        """
+        if self.keep_warm and self._sync_cursor is not None:
+            return self._sync_cursor
+        try:
+            gcs_handler.download(
+                from_=config.BUCKET_SYNC_CURSOR_PATH,
+                to=self.sync_cursor_cache.save_path,
+            )
+            self._sync_cursor = self.sync_cursor_cache.load()
+            return self._sync_cursor
+        except Exception as e:
+            self.logger.warning(
+                f"カーソルの読み込みに失敗したため、固定の期間を取得します。エラー内容: {e}"
+            )
+            return None
+
+    def _save_sync_cursor(self, cursor: SyncCursor, gcs_handler: GCSHandler):
+        """レギュラータスクのカーソルを保存するメソッド(常駐時はチェックポイントで保存する)"""
+        self._sync_cursor = cursor
+        if self.keep_warm:
+            return
+        self._upload_sync_cursor(cursor=cursor, gcs_handler=gcs_handler)
+
+    def _upload_sync_cursor(self, cursor: SyncCursor, gcs_handler: GCSHandler):
+        """レギュラータスクのカーソルをファイルに保存し、GCSへアップロードするメソッド"""
+        try:
+            self.sync_cursor_cache.save(cursor)
+            gcs_handler.upload(
+                from_=self.sync_cursor_cache.save_path,
+                to=config.BUCKET_SYNC_CURSOR_PATH,
+            )
+            self.logger.info(
+                f"カーソルを{cursor.last_edited_time.isoformat()}に進めました。"
+            )
+        except Exception as e:
+            self.logger.error(f"カーソルの保存に失敗。エラー内容: {e}")
+
+    def _enqueue_updated_tasks(
+        self,
+        scheduled_tasks: list[ScheduledTask],
+        executed_tasks: list[ExecutedTask],
+    ):
+        """更新された予定タスクと実績タスクの変更内容を書き込み待ちキューに積むメソッド
+
+        積んだタスクの変更の記録は消去する(常駐時に同じ変更を毎回積み直さないため)。
+        """
+        for task in TaskService.get_updated_tasks(scheduled_tasks):
+            self.page_update_queue.enqueue(
+                page_id=task.page_id,
+                properties=self.scheduled_task_repo.build_update_properties(task),
+            )
+            self.logger.info(
+                f"予定タスク[{task.id.number}]の更新: {task.update_contents}"
+            )
+            task.clear_updated()
+        for task in TaskService.get_updated_tasks(executed_tasks):
+            self.page_update_queue.enqueue(
+                page_id=task.page_id,
+                properties=self.executed_task_repo.build_update_properties(task),
+            )
+            self._executed_tasks_to_invalidate_by_page_id[task.page_id] = task
+            self.logger.info(
+                f"実績タスク[{task.id.number}]の更新: {task.update_contents}"
+            )
+            task.clear_updated()
+
+    def _load_page_update_queue(self, gcs_handler: GCSHandler):
+        """GCSから書き込み待ちのページ更新を読み込むメソッド
+
+        GCSから取得できない場合は、ローカルに保存したものを読み込む。
+        常駐時は初回のみ読み込み、以降はメモリ上のものを使う。
+        保存時に他の処理の書き込みを上書きしないよう、読み込んだ世代を保持する。
+        """
+        if self.keep_warm and self._is_page_update_queue_loaded:
+            return
+        try:
+            self._page_update_queue_generation = gcs_handler.download_if_updated(
+                from_=config.BUCKET_PAGE_UPDATE_QUEUE_PATH,
+                to=self.page_update_queue.save_path,
+                generation=None,
+            )
+        except Exception as e:
+            # GCSにない場合は、ファイルがない場合のみ保存する
+            self._page_update_queue_generation = 0
+            self.logger.warning(
+                f"書き込み待ちのページ更新のダウンロードに失敗。エラー内容: {e}"
+            )
+        try:
+            self.page_update_queue.load()
+            self._is_page_update_queue_loaded = True
+        except Exception as e:
+            self.logger.error(
+                f"書き込み待ちのページ更新の読み込みに失敗。エラー内容: {e}"
+            )
+
+    async def _flush_page_updates(
+        self, gcs_handler: GCSHandler, delay: float
+    ) -> BatchResult:
+        """書き込み待ちのページ更新を書き込み、残りを保存するメソッド(常駐時はローカルのみ)
+
+        :param delay: 最初に積まれてからこの秒数が経過したページのみ書き込む
+        """
+        result = await self.page_update_queue.flush(
+            update=self.task_repo.update_page,
+            on_error=lambda e, page_id: self.logger.error(
+                f"ページ[{page_id}]の更新に失敗しました。 エラー内容: {e}"
+            ),
+            max_concurrency=config.NOTION_MAX_IN_FLIGHT,
+            delay=delay,
+        )
+        self._invalidate_flushed_uptime_cache()
+        self.logger.info(
+            f"ページの更新結果: 成功{result.success_count}件, 失敗{result.failure_count}件, "
+            f"書き込み待ち{len(self.page_update_queue)}件"
+        )
+        if self.keep_warm:
+            try:
+                self.page_update_queue.save()
+            except Exception as e:
+                self.logger.error(
+                    f"書き込み待ちのページ更新の保存に失敗。エラー内容: {e}"
+                )
+        else:
+            self._save_page_update_queue(gcs_handler=gcs_handler)
+        return result
+
+    def _save_page_update_queue(self, gcs_handler: GCSHandler):
+        """書き込み待ちのページ更新を保存し、GCSへアップロードするメソッド
+
+        読み込み後に他の処理(Webhookの同期など)が保存していた場合は、
+        GCSのものを読み直して統合してから保存し直す。
+        """
+        try:
+            self.page_update_queue.save()
+            for _ in range(config.PAGE_UPDATE_QUEUE_SAVE_RETRIES + 1):
+                try:
+                    self._page_update_queue_generation = gcs_handler.upload(
+                        from_=self.page_update_queue.save_path,
+                        to=config.BUCKET_PAGE_UPDATE_QUEUE_PATH,
+                        if_generation_match=self._page_update_queue_generation,
+                    )
+                    return
+                except GenerationMismatchError:
+                    self.logger.info(
+                        "書き込み待ちのページ更新が他の処理で更新されたため、統合して保存し直します。"
+                    )
+                    self._merge_remote_page_update_queue(gcs_handler=gcs_handler)
+            raise RuntimeError("他の処理との競合が続いたため、保存を中止しました。")
+        except Exception as e:
+            self.logger.error(f"書き込み待ちのページ更新の保存に失敗。エラー内容: {e}")
+
+    def _merge_remote_page_update_queue(self, gcs_handler: GCSHandler):
+        """GCSの書き込み待ちのページ更新を読み込み、メモリ上のものに統合するメソッド
+
+        本処理で書き込み済みのページがGCSに残っている場合も統合するが、同じ値を再度書き込むのみとなる。
+        """
+        remote_queue = PageUpdateQueue(
+            save_path=self.page_update_queue.save_path + ".remote"
+        )
+        self._page_update_queue_generation = gcs_handler.download_if_updated(
+            from_=config.BUCKET_PAGE_UPDATE_QUEUE_PATH,
+            to=remote_queue.save_path,
+            generation=None,
+        )
+        remote_queue.load()
+        self.page_update_queue.merge(remote_queue)
+        self.page_update_queue.save()
 
     async def _load_pickle(self, gcs_handler: GCSHandler) -> List[ScheduledTask] | None:
         """GCSからPickleをダウンロードし、読み込むメソッド"""
         try:
-            gcs_handler.download(
+            local_generation = self.scheduled_task_cache.get_generation()
+            generation = gcs_handler.download_if_updated(
                 from_=config.BUCKET_SCHEDULED_PICKLE_PATH,
                 to=self.scheduled_task_cache.save_path,
+                generation=local_generation,
             )
+            self.scheduled_task_cache.save_generation(generation)
+            if generation == local_generation:
+                self.logger.info(
+                    "ローカルのPickleが最新のため、ダウンロードを省略しました。"
+                )
+            self._sync_deltas(gcs_handler=gcs_handler)
             self.logger.info("PickleのGCSからのダウンロードに成功しました。")
 
             # Pickleから予定タスクを読み込む
@@ -399,10 +1156,86 @@ class TaskApplicationService:
             self.logger.critical("処理を終了します。")
             return None
 
+    def _sync_deltas(self, gcs_handler: GCSHandler):
+        """GCSの差分pickleとローカルの差分pickleを同期するメソッド
+
+        差分は追記のみで内容が変わらないため、ローカルにあるものはダウンロードしない。
+        GCSから削除された差分はスナップショットへ集約済みのため、ローカルからも削除する。
+        """
+        remote_paths_by_name = {
+            os.path.basename(path): path
+            for path in self._list_delta_paths(gcs_handler=gcs_handler, strict=True)
+        }
+        local_names = self.scheduled_task_cache.get_delta_names()
+
+        self.scheduled_task_cache.delete_deltas(
+            [name for name in local_names if name not in remote_paths_by_name]
+        )
+        for name, path in remote_paths_by_name.items():
+            if name in local_names:
+                continue
+            gcs_handler.download(
+                from_=path,
+                to=os.path.join(self.scheduled_task_cache.delta_dir, name),
+            )
+
+    def _list_delta_paths(
+        self, gcs_handler: GCSHandler, strict: bool = False
+    ) -> List[str]:
+        """GCSの差分pickleのパス一覧を取得するメソッド
+
+        :param strict: Trueの場合、取得に失敗したら例外を送出する
+        """
+        try:
+            return gcs_handler.list_names(prefix=config.BUCKET_SCHEDULED_DELTA_PREFIX)
+        except Exception as e:
+            if strict:
+                raise e
+            self.logger.error(f"差分Pickleの一覧取得に失敗。エラー内容: {e}")
+            return []
+
+    def _delete_deltas(self, gcs_handler: GCSHandler, delta_paths: List[str]):
+        """スナップショットへ集約済みの差分pickleを削除するメソッド"""
+        for path in delta_paths:
+            try:
+                gcs_handler.delete(path)
+            except Exception as e:
+                self.logger.error(f"差分Pickle[{path}]の削除に失敗。エラー内容: {e}")
+        self.scheduled_task_cache.delete_deltas(
+            [os.path.basename(path) for path in delta_paths]
+        )
+        self.logger.info(f"{len(delta_paths)}件の差分Pickleを集約しました。")
+
+    async def _save_delta_pickle(
+        self, scheduled_tasks: List[ScheduledTask], gcs_handler: GCSHandler
+    ) -> bool:
+        """変更された予定タスクを差分PickleとしてGCSへアップロードするメソッド
+
+        :return: アップロードに成功した場合True(変更がない場合を含む)
+        """
+        if not scheduled_tasks:
+            return True
+        try:
+            path = self.scheduled_task_cache.save_delta(tasks=scheduled_tasks)
+            gcs_handler.upload(
+                from_=path,
+                to=config.BUCKET_SCHEDULED_DELTA_PREFIX + os.path.basename(path),
+            )
+            self.logger.info(
+                f"差分Pickle({len(scheduled_tasks)}件)のGCSへのアップロードに成功しました。"
+            )
+            return True
+        except Exception as e:
+            self.logger.critical(f"差分Pickleの保存に失敗。エラー内容: {e}")
+            return False
+
     async def _save_pickle(
         self, scheduled_tasks: List[ScheduledTask], gcs_handler: GCSHandler
-    ):
-        """GCSにPickleをアップロードするメソッド"""
+    ) -> bool:
+        """GCSにPickleをアップロードするメソッド
+
+        :return: アップロードに成功した場合True
+        """
         try:
             self.scheduled_task_cache.save(
                 tasks=scheduled_tasks,
@@ -410,19 +1243,23 @@ class TaskApplicationService:
             self.logger.info("Pickleの保存に成功しました。")
 
             # pickleをGCSにアップロードする
-            gcs_handler.upload(
+            generation = gcs_handler.upload(
                 from_=self.scheduled_task_cache.save_path,
                 to=config.BUCKET_SCHEDULED_PICKLE_PATH,
             )
+            # アップロードしたものはローカルと同一のため、次回のダウンロードを省略できる
+            self.scheduled_task_cache.save_generation(generation)
             self.logger.info("PickleのGCSへのアップロードに成功しました。")
+            return True
         except Exception as e:
             self.logger.critical(f"Pickleの保存に失敗。エラー内容: {e}")
             self.logger.critical("処理を終了します。")
+            return False
 
     async def _update_executed_tasks(
         self,
         executed_tasks: list[ExecutedTask],
-    ):
+    ) -> BatchResult:
         """実績タスクの予定タスクIDを更新するメソッド"""
         updated_executed_tasks = TaskService.get_updated_tasks(executed_tasks)
         tasks = []
@@ -439,4 +1276,8 @@ class TaskApplicationService:
                 )
             )
 
-        await asyncio.gather(*tasks)
+        result = BatchResult.from_results(await asyncio.gather(*tasks))
+        self.logger.info(
+            f"実績タスクの更新結果: 成功{result.success_count}件, 失敗{result.failure_count}件"
+        )
+        return result
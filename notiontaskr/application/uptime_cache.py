@@ -0,0 +1,94 @@
+import time
+from datetime import date, datetime, timezone
+from typing import Callable, Iterable
+
+from cachetools import TLRUCache
+
+from notiontaskr.application.dto.uptime_data import UptimeDataByTag
+from notiontaskr.domain.uptime_rollup import UptimeRollup
+
+# (ソートしたタグ, 開始日時, 終了日時)
+UptimeCacheKey = tuple[tuple[str, ...], datetime, datetime]
+
+
+class UptimeCache:
+    """稼働実績のTTL付きLRUキャッシュ
+
+    キーはタグの順序と重複によらないよう、ソートしたタグと期間とする。
+    当日以降を含む期間は実績が増えうるため、短いTTLで破棄する。
+    日付は工数集計と同じく、UTCに変換した日付で扱う。
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        open_ttl: float,
+        timer: Callable[[], float] = time.monotonic,
+        today: Callable[[], date] = lambda: datetime.now(timezone.utc).date(),
+    ):
+        """
+        :param ttl: 過去のみの期間のTTL(秒)
+        :param open_ttl: 当日以降を含む期間のTTL(秒)
+        """
+        self._ttl = ttl
+        self._open_ttl = open_ttl
+        self._today = today
+        self._cache: TLRUCache = TLRUCache(
+            maxsize=maxsize, ttu=self._get_expiration, timer=timer
+        )
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    @staticmethod
+    def to_key(tags: Iterable[str], from_: datetime, to: datetime) -> UptimeCacheKey:
+        """キャッシュのキーを生成する"""
+        return (tuple(sorted(set(tags))), from_, to)
+
+    def _get_expiration(self, key: UptimeCacheKey, value, now: float) -> float:
+        _, _, to = key
+        is_open = UptimeRollup.to_day(to) >= self._today()
+        return now + (self._open_ttl if is_open else self._ttl)
+
+    def get(
+        self, tags: Iterable[str], from_: datetime, to: datetime
+    ) -> UptimeDataByTag | None:
+        """キャッシュした稼働実績を取得する(ない場合や期限切れの場合None)"""
+        return self._cache.get(self.to_key(tags, from_, to))
+
+    def set(
+        self,
+        tags: Iterable[str],
+        from_: datetime,
+        to: datetime,
+        uptime_data_by_tag: UptimeDataByTag,
+    ) -> None:
+        """稼働実績をキャッシュする"""
+        self._cache[self.to_key(tags, from_, to)] = uptime_data_by_tag
+
+    def invalidate(self, tags: Iterable[str], days: Iterable[date]) -> int:
+        """指定したタグのいずれかを含み、期間が指定した日のいずれかを含むものを破棄する
+
+        :return: 破棄した件数
+        """
+        tags = set(tags)
+        days = set(days)
+        if not tags or not days:
+            return 0
+        keys = [
+            key
+            for key in list(self._cache.keys())
+            if tags.intersection(key[0])
+            and any(
+                UptimeRollup.to_day(key[1]) <= day <= UptimeRollup.to_day(key[2])
+                for day in days
+            )
+        ]
+        for key in keys:
+            self._cache.pop(key, None)
+        return len(keys)
+
+    def clear(self) -> None:
+        """全て破棄する"""
+        self._cache.clear()
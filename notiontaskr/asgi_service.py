@@ -0,0 +1,187 @@
+import asyncio
+import contextlib
+import os
+from datetime import datetime
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
+from starlette.routing import Route
+from starlette.templating import Jinja2Templates
+
+import notiontaskr.config as config
+from notiontaskr.application.page_change_worker import PageChangeWorker
+from notiontaskr.application.task_application_service import TaskApplicationService
+from notiontaskr.domain.uptime_series import UptimeBucket
+from notiontaskr.util.converter import date_str_to_start_end, dt_to_month_start_end
+from notiontaskr.util.validator import is_valid_signature
+
+# service.pyのASGI版。uvicornのイベントループ上で全リクエストを処理するため、
+# Notionクライアントのコネクションプールと流量制御を全リクエストで共有できる
+templates = Jinja2Templates(
+    directory=os.path.join(os.path.dirname(__file__), "templates")
+)
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app: Starlette):
+    """起動時にサービスとワーカーを生成し、終了時にコネクションプールを閉じる"""
+    async with TaskApplicationService() as service:
+        page_change_worker = PageChangeWorker(
+            sync=service.sync_pages,
+            batch_seconds=config.WEBHOOK_BATCH_SECONDS,
+            logger=service.logger,
+        )
+        worker_task = asyncio.ensure_future(page_change_worker.run())
+        app.state.service = service
+        app.state.page_change_worker = page_change_worker
+        try:
+            yield
+        finally:
+            worker_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await worker_task
+
+
+async def index(request: Request):
+    return templates.TemplateResponse(request, "index.html")
+
+
+async def update_executed_task_id(request: Request):
+    """dayly_taskを実行するエンドポイント"""
+
+    await request.app.state.service.daily_task()
+
+    return PlainTextResponse("dayly task executed successfully!")
+
+
+async def receive_notion_webhook(request: Request):
+    """NotionのWebhookを受け取るエンドポイント
+
+    変更されたページIDをワーカーに渡してすぐに応答し、同期はワーカーで行う。
+    """
+    body = await request.body()
+    try:
+        event = await request.json()
+    except ValueError:
+        event = {}
+    if not isinstance(event, dict):
+        event = {}
+
+    token = config.NOTION_WEBHOOK_VERIFICATION_TOKEN
+    # 購読作成時の検証リクエスト。通知されたトークンを環境変数に設定する
+    # (署名できないため、トークンを設定するまでのみ受け付ける)
+    if not token and "verification_token" in event:
+        request.app.state.service.logger.info(
+            f"Webhookの検証トークン: {event['verification_token']}"
+        )
+        return Response(status_code=200)
+
+    signature = request.headers.get("X-Notion-Signature", "")
+    if not token or not is_valid_signature(body, signature, token):
+        return PlainTextResponse("Invalid signature", status_code=401)
+
+    page_id = PageChangeWorker.parse_page_id(event)
+    if page_id is not None:
+        request.app.state.page_change_worker.notify(page_id)
+
+    return Response(status_code=200)
+
+
+async def get_uptime_from_start_end(request: Request):
+    """uptimeを取得するエンドポイント
+
+    タグ配列、開始日、終了日をクエリパラメータとして受け取る
+    例: https://example.com/uptime_from_start_end?tags=tag1&start_year=2024&start_month=12&end_year=2025&end_month=1
+    """
+    tags = request.query_params.getlist("tags")
+    start_year = request.query_params.get("start_year")
+    start_month = request.query_params.get("start_month")
+    end_year = request.query_params.get("end_year")
+    end_month = request.query_params.get("end_month")
+
+    if not tags or not start_year or not start_month or not end_year or not end_month:
+        return PlainTextResponse("Invalid parameters", status_code=400)
+
+    start_of_month = datetime(year=int(start_year), month=int(start_month), day=1)
+    end_dt = datetime(year=int(end_year), month=int(end_month), day=1)
+    _, end_of_month = dt_to_month_start_end(end_dt)
+
+    uptime_data_by_tag = await request.app.state.service.get_uptime(
+        from_=start_of_month, to=end_of_month, tags=tags
+    )
+
+    # レスポンスをJSON形式で返す
+    return Response(uptime_data_by_tag.to_json(), media_type="application/json")
+
+
+async def get_uptime_from_month(request: Request):
+    """uptimeを取得するエンドポイント
+
+    タグ配列、年月をクエリパラメータとして受け取る
+    例: https://example.com/uptime_from_month?tags=tag1&year=2024&month=12
+    """
+    tags = request.query_params.getlist("tags")
+    year = request.query_params.get("year")
+    month = request.query_params.get("month")
+
+    if not tags or not year or not month:
+        return PlainTextResponse("Invalid parameters", status_code=400)
+
+    dt = datetime(year=int(year), month=int(month), day=1)
+    start, end = dt_to_month_start_end(dt)
+
+    uptime_data_by_tag = await request.app.state.service.get_uptime(
+        from_=start,
+        to=end,
+        tags=tags,
+    )
+
+    # レスポンスをJSON形式で返す
+    return Response(uptime_data_by_tag.to_json(), media_type="application/json")
+
+
+async def get_uptime_series(request: Request):
+    """uptimeを区間ごとの時系列で取得するエンドポイント
+
+    タグ配列、開始日、終了日(YYYY-MM-DD)、区間の単位(month/week、省略時はmonth)をクエリパラメータとして受け取る
+    例: https://example.com/uptime_series?tags=tag1&from=2025-01-01&to=2025-12-31&bucket=month
+    """
+    tags = request.query_params.getlist("tags")
+    from_ = request.query_params.get("from")
+    to = request.query_params.get("to")
+
+    if not tags or not from_ or not to:
+        return PlainTextResponse("Invalid parameters", status_code=400)
+
+    try:
+        start, end = date_str_to_start_end(from_, to)
+        bucket = UptimeBucket.from_str(request.query_params.get("bucket", "month"))
+    except ValueError:
+        return PlainTextResponse("Invalid parameters", status_code=400)
+
+    uptime_series_by_tag = await request.app.state.service.get_uptime_series(
+        from_=start, to=end, tags=tags, bucket=bucket
+    )
+
+    # レスポンスをJSON形式で返す
+    return Response(uptime_series_by_tag.to_json(), media_type="application/json")
+
+
+app = Starlette(
+    routes=[
+        Route("/", index),
+        Route("/run-daily-task", update_executed_task_id),
+        Route("/notion-webhook", receive_notion_webhook, methods=["POST"]),
+        Route("/uptime_from_start_end", get_uptime_from_start_end, methods=["GET"]),
+        Route("/uptime_from_month", get_uptime_from_month, methods=["GET"]),
+        Route("/uptime_series", get_uptime_series, methods=["GET"]),
+    ],
+    lifespan=lifespan,
+)
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(app, host="0.0.0.0", port=5000)
@@ -1,6 +1,8 @@
 import os
 import emoji
 
+from notiontaskr.util.converter import remove_variant_selectors
+
 # ------------- ディレクトリ設定 -------------
 PROJECT_DIR = os.path.dirname(os.path.dirname(__file__))
 LOG_DIR = os.path.join(PROJECT_DIR, "logs")
@@ -19,6 +21,15 @@ LOG_PATH = os.path.join(LOG_DIR, "app.log")  # ログファイルの出力先
 # ------------- Notion API設定 -------------
 NOTION_TOKEN = os.getenv("NOTION_TOKEN")
 TASK_DB_ID = os.getenv("TASK_DB_ID")
+NOTION_MAX_IN_FLIGHT = 3  # Notion APIリクエストの同時実行数の上限
+NOTION_REQUESTS_PER_SECOND = 3.0  # 1秒あたりのリクエスト数(Notionの平均レート制限)
+NOTION_REQUEST_BURST = 3  # 一度に送信できるリクエスト数(トークンバケットの容量)
+NOTION_MAX_RETRIES = 5  # 429/5xx時のリトライ回数
+NOTION_FETCH_PARTITION_COUNT = 4  # 全件取得時に最終更新日時の期間を分割して並列取得する数
+NOTION_WEBHOOK_VERIFICATION_TOKEN = os.getenv(
+    "NOTION_WEBHOOK_VERIFICATION_TOKEN"
+)  # Webhookの署名の検証に使うトークン(購読作成時に通知される)
+WEBHOOK_BATCH_SECONDS = 2.0  # Webhookで通知されたページをまとめて同期するまで待つ秒数
 
 # ------------- pickleファイル設定 -------------
 BUCKET_NAME = "notion-api-bucket"  # GCSバケット名
@@ -28,12 +39,49 @@ LOCAL_SCHEDULED_PICKLE_PATH = os.path.join(
 BUCKET_SCHEDULED_PICKLE_PATH = (
     "/notion-api/cache/scheduled_task.pkl"  # GCSのpickleファイルの保存先
 )
+LOCAL_SCHEDULED_DELTA_DIR = os.path.join(
+    CACHE_DIR, "scheduled_task_deltas"
+)  # ローカルの差分pickleファイルの保存先
+BUCKET_SCHEDULED_DELTA_PREFIX = (
+    "/notion-api/cache/scheduled_task_deltas/"  # GCSの差分pickleファイルの保存先
+)
+MAX_SCHEDULED_DELTA_COUNT = 360  # 差分がこの件数を超えたらスナップショットへ集約する
+LOCAL_UPTIME_ROLLUP_PATH = os.path.join(
+    CACHE_DIR, "uptime_rollup.json"
+)  # ローカルのタグ・日ごとの工数集計ファイルの保存先
+BUCKET_UPTIME_ROLLUP_PATH = "/notion-api/cache/uptime_rollup.json"  # GCSのタグ・日ごとの工数集計ファイルの保存先
+UPTIME_ROLLUP_DAYS = 365  # 工数を集計する日数(デイリータスクの取得期間に合わせる)
+UPTIME_CACHE_MAXSIZE = 256  # 稼働実績のキャッシュの最大件数
+UPTIME_CACHE_TTL_SECONDS = 3600  # 過去のみの期間の稼働実績のキャッシュの有効期間
+UPTIME_CACHE_OPEN_TTL_SECONDS = 60  # 当日以降を含む期間の稼働実績のキャッシュの有効期間
+LOCAL_PAGE_UPDATE_QUEUE_PATH = os.path.join(
+    CACHE_DIR, "page_update_queue.json"
+)  # ローカルの書き込み待ちのページ更新の保存先
+BUCKET_PAGE_UPDATE_QUEUE_PATH = (
+    "/notion-api/cache/page_update_queue.json"  # GCSの書き込み待ちのページ更新の保存先
+)
+PAGE_UPDATE_FLUSH_DELAY_SECONDS = 120  # ページ更新を統合するために書き込みを待つ秒数(レギュラータスク)
+PAGE_UPDATE_QUEUE_SAVE_RETRIES = 3  # 書き込み待ちキューを他の処理と統合して保存し直す回数の上限
+LOCAL_SYNC_CURSOR_PATH = os.path.join(
+    CACHE_DIR, "sync_cursor.json"
+)  # ローカルのレギュラータスクのカーソルの保存先
+BUCKET_SYNC_CURSOR_PATH = (
+    "/notion-api/cache/sync_cursor.json"  # GCSのレギュラータスクのカーソルの保存先
+)
+REGULAR_TASK_LOOKBACK_SECONDS = 90  # カーソルがない場合に遡って取得する秒数
+REGULAR_TASK_OVERLAP_SECONDS = 120  # カーソルから遡って取得する秒数(最終更新日時は分単位のため)
+SYNC_DAEMON_INTERVAL_SECONDS = 60  # 常駐モードでレギュラータスクを実行する間隔
+SYNC_DAEMON_CHECKPOINT_SECONDS = 600  # 常駐モードでメモリ上の状態をGCSへ保存する間隔
 
 # ------------- タスク名ラベル設定 -------------
 # 名前ラベルの絵文字（例: [⏱️0/2]）
 ID_EMOJI = emoji.emojize(":label:")
 MAN_HOURS_EMOJI = emoji.emojize(":stopwatch:")
 PARENT_ID_EMOJI = emoji.emojize(":deciduous_tree:")
+# ラベルの解析で比較する絵文字(起動時にバリアントセレクタを除いておく)
+ID_EMOJI_KEY = remove_variant_selectors(ID_EMOJI)
+MAN_HOURS_EMOJI_KEY = remove_variant_selectors(MAN_HOURS_EMOJI)
+PARENT_ID_EMOJI_KEY = remove_variant_selectors(PARENT_ID_EMOJI)
 
 # 動作確認用
 if __name__ == "__main__":
@@ -2,10 +2,14 @@ import asyncio
 from notiontaskr.application.task_application_service import TaskApplicationService
 
 
+async def _run():
+    async with TaskApplicationService() as service:
+        await service.daily_task()
+
+
 def main():
     """デプロイ時に実行する処理"""
-    service = TaskApplicationService()
-    asyncio.run(service.daily_task())
+    asyncio.run(_run())
 
 
 if __name__ == "__main__":
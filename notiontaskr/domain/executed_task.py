@@ -1,7 +1,8 @@
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import ClassVar, Optional
 
 from notiontaskr.domain.task import Task
+from notiontaskr.domain.task_field import TaskField
 from notiontaskr.domain.task_name import TaskName
 from notiontaskr.domain.value_objects.man_hours import ManHours
 from notiontaskr.domain.value_objects.notion_date import NotionDate
@@ -14,6 +15,12 @@ from notiontaskr.domain.value_objects.status import Status
 class ExecutedTask(Task):
     """実績タスクモデル"""
 
+    PROPERTY_NAMES: ClassVar[tuple[str, ...]] = Task.PROPERTY_NAMES + (
+        "日付",
+        "親アイテム(予)",
+        "予定タスク",
+    )
+
     date: Optional[NotionDate] = None
     man_hours: ManHours = field(default_factory=lambda: ManHours(0))
     scheduled_task_id: Optional[NotionId] = None  # 紐づいている予定タスクのID
@@ -78,6 +85,7 @@ class ExecutedTask(Task):
                     if data["properties"]["予定タスク"]["relation"]
                     else None
                 ),
+                last_edited_time=cls.parse_last_edited_time(data),
             )
         except KeyError as e:
             raise ValueError(f"In ExecutedTask[{task_number}] initialize error, {e}")
@@ -88,6 +96,7 @@ class ExecutedTask(Task):
         """予定タスクIDを更新するメソッド"""
         if self.scheduled_task_id != scheduled_task_id:
             self._toggle_is_updated(
-                f"予定タスクID: {self.scheduled_task_id} -> {scheduled_task_id}"
+                f"予定タスクID: {self.scheduled_task_id} -> {scheduled_task_id}",
+                TaskField.SCHEDULED_TASK_ID,
             )
             self.scheduled_task_id = scheduled_task_id
@@ -1,6 +1,6 @@
 from notiontaskr.domain.executed_task import ExecutedTask
 from notiontaskr.domain.scheduled_task import ScheduledTask
-from notiontaskr.domain.task_service import TaskService
+from notiontaskr.domain.scheduled_task_name_index import ScheduledTaskNameIndex
 
 from notiontaskr.domain.value_objects.man_hours import ManHours
 
@@ -9,21 +9,28 @@ class ExecutedTaskService:
 
     @staticmethod
     def get_tasks_add_id_tag(
-        to: list[ExecutedTask], source: list[ScheduledTask]
+        to: list[ExecutedTask], source: list[ScheduledTask] | ScheduledTaskNameIndex
     ) -> list[ScheduledTask]:
         """予定タスクと同じ名前を持つ実績タスクに同じIDを付与し、
-        新たにIDが付与された予定タスクのみを返却する"""
-        updated_tasks = []
-        for executed_task in to:
-            if executed_task.name.id_label is not None:
+        新たにIDが付与された予定タスクのみを返却する
+
+        名前の比較は索引で行う。リストを渡した場合は索引を生成する。
+        """
+        unlabeled_tasks = [task for task in to if task.name.id_label is None]
+        if not unlabeled_tasks:
+            return []
+        if not isinstance(source, ScheduledTaskNameIndex):
+            source = ScheduledTaskNameIndex.from_scheduled_tasks(source)
+
+        updated_tasks_by_id = {}
+        for executed_task in unlabeled_tasks:
+            scheduled_task = source.get(executed_task.name.task_name)
+            if scheduled_task is None:
                 continue
-            for scheduled_task in source:
-                if executed_task.name.task_name == scheduled_task.name.task_name:
-                    executed_task.update_id_label(scheduled_task.name.id_label)  # type: ignore (予定タスクのIDがNoneになることはない)
-                    executed_task.update_scheduled_task_id(scheduled_task.id)
-                    TaskService.upsert_tasks(to=updated_tasks, source=scheduled_task)
-                    break
-        return updated_tasks
+            executed_task.update_id_label(scheduled_task.name.id_label)  # type: ignore (予定タスクのIDがNoneになることはない)
+            executed_task.update_scheduled_task_id(scheduled_task.id)
+            updated_tasks_by_id[scheduled_task.id] = scheduled_task
+        return list(updated_tasks_by_id.values())
 
     @staticmethod
     def get_executed_tasks_by_tag(
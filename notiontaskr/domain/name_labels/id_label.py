@@ -5,6 +5,9 @@ from notiontaskr.domain.name_labels.name_label import NameLabel
 from notiontaskr.domain.value_objects.notion_id import NotionId
 from notiontaskr.domain.value_objects.status import Status
 
+# 未着手以外のステータスを表すラベルの先頭の記号
+STATUS_SYMBOLS = ("→", "!", "✓", "×")
+
 
 @dataclass
 class IdLabel(NameLabel):
@@ -30,6 +33,11 @@ class IdLabel(NameLabel):
             value=str(id.number),
         )
 
+    @classmethod
+    def get_keys(cls) -> tuple[str, ...]:
+        """ラベルの先頭になりうる文字を返す(未着手は半角または全角の数字から始まる)"""
+        return tuple("0123456789") + tuple("０１２３４５６７８９") + STATUS_SYMBOLS
+
     @classmethod
     def parse_and_register(cls, key: str, value: str, delegate: "LabelRegisterable"):
         """ラベルを解析して登録する
@@ -38,12 +46,10 @@ class IdLabel(NameLabel):
         """
         label = key + value  # 一度文字列を結合する
 
-        key_value_symbols = ["→", "!", "✓", "×"]
-
         if label[0].isdigit():
             key = ""
             value = label
-        elif label[0] in key_value_symbols:
+        elif label[0] in STATUS_SYMBOLS:
             key = label[0]
             value = label[1:]
         else:
@@ -1,13 +1,12 @@
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 from notiontaskr import config
-from notiontaskr.util.validator import is_emoji_matches
 
 
 if TYPE_CHECKING:
     from notiontaskr.domain.name_labels.label_registerable import LabelRegisterable
 from notiontaskr.domain.value_objects.man_hours import ManHours
-from notiontaskr.util.converter import truncate_decimal
+from notiontaskr.util.converter import remove_variant_selectors, truncate_decimal
 from notiontaskr.domain.name_labels.name_label import NameLabel
 
 
@@ -26,10 +25,18 @@ class ManHoursLabel(NameLabel):
             value=f"{truncate_decimal(executed_man_hours.value)}/{truncate_decimal(scheduled_man_hours.value)}",
         )
 
+    @classmethod
+    def get_keys(cls) -> tuple[str, ...]:
+        """ラベルの先頭になりうる文字を返す"""
+        return (config.MAN_HOURS_EMOJI_KEY,)
+
     @classmethod
     def parse_and_register(cls, key: str, value: str, delegate: "LabelRegisterable"):
-        """ラベルを解析して登録する"""
-        if not is_emoji_matches(key, config.MAN_HOURS_EMOJI):
+        """ラベルを解析して登録する
+
+        絵文字はバリアントセレクタを除いたコードポイントで比較する。
+        """
+        if remove_variant_selectors(key) != config.MAN_HOURS_EMOJI_KEY:
             raise ValueError(f"Unknown key: {key}")
 
         delegate.register_man_hours_label(
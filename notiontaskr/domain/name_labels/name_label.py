@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
-from typing import List
+from typing import Optional
 
 from notiontaskr.domain.name_labels.label_registerable import LabelRegisterable
 from notiontaskr.util.converter import remove_variant_selectors
@@ -24,38 +24,50 @@ class NameLabel(ABC):
         """ラベルを解析してdelegeteのメンバへ登録する"""
         pass
 
+    @classmethod
+    @abstractmethod
+    def get_keys(cls) -> tuple[str, ...]:
+        """ラベルの先頭になりうる文字(バリアントセレクタを除く)を返す"""
+        pass
+
     @staticmethod
     def parse_labels(label: str, delegate: "LabelRegisterable"):
         """ラベルを解析してdelegateのメンバへ登録する
 
-        chain of responsibleパターンで検索する
+        先頭の文字からラベルのクラスを引き、該当するクラスのみで解析する。
+        どのクラスにも該当しないラベルは無視する。
         """
-        from notiontaskr.domain.name_labels.id_label import IdLabel
-        from notiontaskr.domain.name_labels.man_hours_label import ManHoursLabel
-        from notiontaskr.domain.name_labels.parent_id_label import ParentIdLabel
-
         label = remove_variant_selectors(label)  # バリアントセレクタを除去
+        if not label:
+            return
+
+        handler = _get_label_handlers().get(label[0])
+        if handler is None:
+            return
 
-        key = label[0]  # 最初の文字をキーとする
-        value = remove_variant_selectors(label[1:])  # 2文字目以降を値とする
-
-        # 検索対象のクラスを配列に格納
-        # Generated by Copilot
-        handlers: List[type["NameLabel"]] = [
-            IdLabel,
-            ManHoursLabel,
-            ParentIdLabel,
-        ]
-
-        # ID以外のラベルを登録
-        for handler in handlers:
-            try:
-                handler.parse_and_register(key, value, delegate)
-                return
-            except ValueError:
-                continue
+        # 最初の文字をキー、2文字目以降を値とする
+        handler.parse_and_register(label[0], label[1:], delegate)
 
     def __eq__(self, other: "object"):
         if not isinstance(other, NameLabel):
             return False
         return self.key == other.key and self.value == other.value
+
+
+# ラベルの先頭の文字からラベルのクラスを引く表(循環importを避けるため、初回の解析時に作成する)
+_label_handlers: Optional[dict[str, type[NameLabel]]] = None
+
+
+def _get_label_handlers() -> dict[str, type[NameLabel]]:
+    global _label_handlers
+    if _label_handlers is None:
+        from notiontaskr.domain.name_labels.id_label import IdLabel
+        from notiontaskr.domain.name_labels.man_hours_label import ManHoursLabel
+        from notiontaskr.domain.name_labels.parent_id_label import ParentIdLabel
+
+        _label_handlers = {
+            key: handler
+            for handler in (IdLabel, ManHoursLabel, ParentIdLabel)
+            for key in handler.get_keys()
+        }
+    return _label_handlers
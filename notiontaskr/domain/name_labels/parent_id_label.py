@@ -17,6 +17,11 @@ class ParentIdLabel(NameLabel):
             value=str(parent_id.number),
         )
 
+    @classmethod
+    def get_keys(cls) -> tuple[str, ...]:
+        """ラベルの先頭になりうる文字を返す"""
+        return ("親",)
+
     @classmethod
     def parse_and_register(cls, key: str, value: str, delegate: "LabelRegisterable"):
         """ラベルを解析して登録する"""
@@ -1,10 +1,13 @@
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from typing import ClassVar, Iterable
 
 from notiontaskr.domain.executed_task import ExecutedTask
 from notiontaskr.domain.name_labels.id_label import IdLabel
 from notiontaskr.domain.name_labels.parent_id_label import ParentIdLabel
 from notiontaskr.domain.task import Task
+from notiontaskr.domain.task_collection import TaskCollection
+from notiontaskr.domain.task_field import TaskField
 from notiontaskr.domain.task_name import TaskName
 from notiontaskr.domain.value_objects.man_hours import ManHours
 from notiontaskr.domain.value_objects.notion_id import NotionId
@@ -17,19 +20,34 @@ from notiontaskr.domain.value_objects.status import Status
 class ScheduledTask(Task):
     """予定タスクモデル"""
 
+    PROPERTY_NAMES: ClassVar[tuple[str, ...]] = Task.PROPERTY_NAMES + (
+        "親アイテム",
+        "人時(予)",
+        "人時(実)",
+        "サブアイテム",
+        "進捗率",
+    )
+
     scheduled_man_hours: ManHours = field(default_factory=lambda: ManHours(0))
     executed_man_hours: ManHours = field(default_factory=lambda: ManHours(0))
-    executed_tasks: list["ExecutedTask"] = field(
-        default_factory=list
+    executed_tasks: TaskCollection["ExecutedTask"] = field(
+        default_factory=TaskCollection
     )  # 紐づいている実績タスク
     sub_task_page_ids: list["PageId"] = field(
         default_factory=list
     )  # サブアイテムのページID
-    sub_tasks: list["ScheduledTask"] = field(default_factory=list)  # サブアイテム
+    sub_tasks: TaskCollection["ScheduledTask"] = field(
+        default_factory=TaskCollection
+    )  # サブアイテム
     progress_rate: ProgressRate = field(
         default_factory=lambda: ProgressRate(0)
     )  # 進捗率
 
+    def __post_init__(self):
+        # リストで渡された場合も、IDで追加・更新できるようにする
+        self.executed_tasks = TaskCollection.from_tasks(self.executed_tasks)
+        self.sub_tasks = TaskCollection.from_tasks(self.sub_tasks)
+
     @classmethod
     def from_response_data(cls, data: dict):
         """レスポンスデータからインスタンスを生成する
@@ -75,6 +93,7 @@ class ScheduledTask(Task):
                 ],
                 sub_tasks=[],
                 progress_rate=ProgressRate(data["properties"]["進捗率"]["number"]),
+                last_edited_time=cls.parse_last_edited_time(data),
             )
 
             # IDラベルを更新
@@ -126,8 +145,11 @@ class ScheduledTask(Task):
         ):
             self.update_status(Status.NOT_STARTED)
 
-    def update_status_by_checking_properties(self):
-        """タスクのプロパティに応じてステータスを更新する"""
+    def update_status_by_checking_properties(self, recursive: bool = True):
+        """タスクのプロパティに応じてステータスを更新する
+
+        :param recursive: Falseの場合、サブアイテムのステータスは更新済みとして扱う
+        """
 
         if self.status == Status.CANCELED:
             # ステータスが中止の場合は、何もしない
@@ -143,7 +165,8 @@ class ScheduledTask(Task):
         # サブアイテムのステータスを更新し、ステータスを集計する
         statuses = []
         for sub_task in self.sub_tasks:
-            sub_task.update_status_by_checking_properties()
+            if recursive:
+                sub_task.update_status_by_checking_properties()
             statuses.append(sub_task.status)
 
         if all(status == Status.COMPLETED for status in statuses):
@@ -206,17 +229,26 @@ class ScheduledTask(Task):
     def update_progress_rate(self, progress_rate: ProgressRate):
         """進捗率を更新する"""
         if self.progress_rate != progress_rate:
-            self._toggle_is_updated(f"進捗率: {self.progress_rate} -> {progress_rate}")
+            self._toggle_is_updated(
+                f"進捗率: {self.progress_rate} -> {progress_rate}",
+                TaskField.PROGRESS_RATE,
+            )
             self.progress_rate = progress_rate
 
-    def _aggregate_sub_man_hours(self) -> tuple[ManHours, ManHours]:
-        """サブアイテムの工数を集計する"""
+    def _aggregate_sub_man_hours(
+        self, recursive: bool = True
+    ) -> tuple[ManHours, ManHours]:
+        """サブアイテムの工数を集計する
+
+        :param recursive: Falseの場合、サブアイテムの工数は集計済みとして扱う
+        """
         if self.sub_tasks is None or len(self.sub_tasks) == 0:
             return (ManHours(0), ManHours(0))
         sub_scheduled_man_hours = 0.0
         sub_executed_man_hours = 0.0
         for sub_task in self.sub_tasks:
-            sub_task.aggregate_man_hours()
+            if recursive:
+                sub_task.aggregate_man_hours()
             sub_scheduled_man_hours += float(sub_task.scheduled_man_hours)
             sub_executed_man_hours += float(sub_task.executed_man_hours)
         return (
@@ -235,8 +267,11 @@ class ScheduledTask(Task):
 
         return executed_man_hours
 
-    def aggregate_man_hours(self):
-        """実績工数を集計し、ラベルを更新する"""
+    def aggregate_man_hours(self, recursive: bool = True):
+        """実績工数を集計し、ラベルを更新する
+
+        :param recursive: Falseの場合、サブアイテムの工数は集計済みとして扱う
+        """
 
         sub_scheduled_man_hours = ManHours(0)
         sub_executed_man_hours = ManHours(0)
@@ -244,7 +279,7 @@ class ScheduledTask(Task):
         if len(self.sub_tasks) > 0:
             # サブアイテムの工数を集計する
             sub_scheduled_man_hours, sub_executed_man_hours = (
-                self._aggregate_sub_man_hours()
+                self._aggregate_sub_man_hours(recursive=recursive)
             )
             # サブアイテムの予定人時を更新する
             self.update_scheduled_man_hours(sub_scheduled_man_hours)
@@ -258,7 +293,8 @@ class ScheduledTask(Task):
         """実績人時を更新する"""
         if self.executed_man_hours != executed_man_hours:
             self._toggle_is_updated(
-                f"実績人時: {self.executed_man_hours} -> {executed_man_hours}"
+                f"実績人時: {self.executed_man_hours} -> {executed_man_hours}",
+                TaskField.EXECUTED_MAN_HOURS,
             )
             self.executed_man_hours = executed_man_hours
 
@@ -266,20 +302,21 @@ class ScheduledTask(Task):
         """予定人時を更新する"""
         if self.scheduled_man_hours != scheduled_man_hours:
             self._toggle_is_updated(
-                f"予定人時: {self.scheduled_man_hours} -> {scheduled_man_hours}"
+                f"予定人時: {self.scheduled_man_hours} -> {scheduled_man_hours}",
+                TaskField.SCHEDULED_MAN_HOURS,
             )
             self.scheduled_man_hours = scheduled_man_hours
 
     def update_executed_tasks(
         self,
-        executed_tasks: list["ExecutedTask"],
+        executed_tasks: Iterable["ExecutedTask"],
     ):
         """実績タスクを更新する"""
-        self.executed_tasks = executed_tasks
+        self.executed_tasks = TaskCollection.from_tasks(executed_tasks)
 
     def update_sub_tasks(
         self,
-        sub_tasks: list["ScheduledTask"],
+        sub_tasks: Iterable["ScheduledTask"],
     ):
         """サブアイテムを更新する"""
-        self.sub_tasks = sub_tasks
+        self.sub_tasks = TaskCollection.from_tasks(sub_tasks)
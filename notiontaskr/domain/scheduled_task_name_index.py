@@ -0,0 +1,58 @@
+import re
+import unicodedata
+from typing import Optional
+
+from notiontaskr.domain.scheduled_task import ScheduledTask
+
+
+class ScheduledTaskNameIndex:
+    """予定タスクをタスク名で引くための索引
+
+    同じタスク名の予定タスクが複数ある場合は、IDの番号が最も大きい(=最も新しく作成された)ものを採用する。
+    """
+
+    def __init__(self):
+        self._tasks_by_name: dict[str, ScheduledTask] = {}
+
+    @classmethod
+    def from_scheduled_tasks(
+        cls, scheduled_tasks: list[ScheduledTask]
+    ) -> "ScheduledTaskNameIndex":
+        """予定タスクの一覧から索引を生成する"""
+        instance = cls()
+        for scheduled_task in scheduled_tasks:
+            instance.upsert(scheduled_task)
+        return instance
+
+    @staticmethod
+    def normalize(task_name: str) -> str:
+        """タスク名を正規化する
+
+        全角・半角の揺れと、ラベル削除後に残る連続した空白を吸収する。
+        """
+        return re.sub(r"\s+", " ", unicodedata.normalize("NFKC", task_name)).strip()
+
+    def upsert(self, scheduled_task: ScheduledTask) -> None:
+        """予定タスクを索引に追加する"""
+        key = self.normalize(scheduled_task.name.task_name)
+        current = self._tasks_by_name.get(key)
+        if current is None or current.id == scheduled_task.id:
+            self._tasks_by_name[key] = scheduled_task
+        elif self._to_order(scheduled_task) > self._to_order(current):
+            self._tasks_by_name[key] = scheduled_task
+
+    def remove(self, scheduled_task: ScheduledTask) -> None:
+        """予定タスクを索引から削除する(同じ名前で別の予定タスクを採用している場合は何もしない)"""
+        key = self.normalize(scheduled_task.name.task_name)
+        current = self._tasks_by_name.get(key)
+        if current is not None and current.id == scheduled_task.id:
+            del self._tasks_by_name[key]
+
+    def get(self, task_name: str) -> Optional[ScheduledTask]:
+        """タスク名に一致する予定タスクを取得する"""
+        return self._tasks_by_name.get(self.normalize(task_name))
+
+    @staticmethod
+    def _to_order(scheduled_task: ScheduledTask) -> int:
+        number = scheduled_task.id.number
+        return int(number) if number.isdigit() else -1
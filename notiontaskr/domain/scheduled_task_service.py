@@ -1,6 +1,8 @@
 from typing import Callable
 from notiontaskr.domain.executed_task import ExecutedTask
 from notiontaskr.domain.scheduled_task import ScheduledTask
+from notiontaskr.domain.scheduled_task_name_index import ScheduledTaskNameIndex
+from notiontaskr.domain.task_collection import TaskCollection
 from notiontaskr.domain.task_service import TaskService
 from notiontaskr.domain.value_objects.notion_id import NotionId
 from notiontaskr.domain.value_objects.page_id import PageId
@@ -19,7 +21,7 @@ class ScheduledTaskService:
 
         - **注意**: 本メソッドは予定タスクが直接変更される。
         """
-        updated_tasks = []
+        updated_tasks: TaskCollection[ScheduledTask] = TaskCollection()
         for executed_task in executed_tasks:
             try:
                 target_task = scheduled_tasks_by_id.get(executed_task.scheduled_task_id)  # type: ignore (既にエラーハンドルしているため)
@@ -31,7 +33,7 @@ class ScheduledTaskService:
             except Exception as e:
                 on_error(e, executed_task)
 
-        return updated_tasks
+        return list(updated_tasks)
 
     @staticmethod
     def get_tasks_appended_sub_tasks(
@@ -43,7 +45,7 @@ class ScheduledTaskService:
 
         - **注意**: 本メソッドは予定タスクが直接変更される。
         """
-        updated_tasks = []
+        updated_tasks: TaskCollection[ScheduledTask] = TaskCollection()
         for sub_task in sub_tasks:
             try:
                 target_task = parent_tasks_by_page_id.get(sub_task.parent_task_page_id)  # type: ignore (既にエラーハンドルしているため)
@@ -55,17 +57,19 @@ class ScheduledTaskService:
             except Exception as e:
                 on_error(e, sub_task)
 
-        return updated_tasks
+        return list(updated_tasks)
 
     @staticmethod
     def merge_scheduled_tasks(
         scheduled_tasks_by_id: dict[NotionId, ScheduledTask],
         sources: list[ScheduledTask],
         on_error: Callable[[Exception, ScheduledTask], None] = lambda e, t: None,
+        name_index: ScheduledTaskNameIndex | None = None,
     ) -> dict[NotionId, ScheduledTask]:
         """キャッシュと取得した予定タスクをマージする
 
-        マージする際、task.executed_tasksはマージ先に引き継ぐ
+        マージする際、task.executed_tasksはマージ先に引き継ぐ。
+        name_indexを渡した場合は、マージした予定タスクで索引も更新する。
         """
         for source in sources:
             try:
@@ -75,10 +79,15 @@ class ScheduledTaskService:
                         scheduled_tasks_by_id[source.id].executed_tasks
                     )
                     source.update_sub_tasks(scheduled_tasks_by_id[source.id].sub_tasks)
+                    if name_index is not None:
+                        # 名前が変更された場合に古い名前で引けないようにする
+                        name_index.remove(scheduled_tasks_by_id[source.id])
                     scheduled_tasks_by_id[source.id] = source
                 else:
                     # 新しいタスクを追加する
                     scheduled_tasks_by_id[source.id] = source
+                if name_index is not None:
+                    name_index.upsert(source)
             except Exception as e:
                 on_error(e, source)
 
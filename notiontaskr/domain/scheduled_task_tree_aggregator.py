@@ -0,0 +1,65 @@
+from typing import Iterable
+
+from notiontaskr.domain.name_labels.man_hours_label import ManHoursLabel
+from notiontaskr.domain.scheduled_task import ScheduledTask
+from notiontaskr.domain.value_objects.notion_id import NotionId
+
+
+class ScheduledTaskTreeAggregator:
+    """予定タスクの木を集計するクラス
+
+    サブアイテムを含む木を帰りがけ順に一度だけ走査し、各予定タスクの工数・ステータス・進捗率を更新する。
+    各予定タスクはサブアイテムの集計が済んだ後に一度だけ処理するため、木全体を線形時間で集計できる。
+    """
+
+    @classmethod
+    def aggregate(cls, scheduled_tasks: Iterable[ScheduledTask]) -> list[ScheduledTask]:
+        """指定した予定タスクとその子孫を集計する
+
+        - **注意**: 本メソッドは予定タスクが直接変更される。
+
+        :return: 集計した予定タスク(帰りがけ順)
+        """
+        visited_ids: set[NotionId] = set()
+        aggregated_tasks = []
+        for root in scheduled_tasks:
+            if root.id in visited_ids:
+                continue
+            # (予定タスク, サブアイテムを集計済みか)
+            stack = [(root, False)]
+            while stack:
+                scheduled_task, is_sub_tasks_aggregated = stack.pop()
+                if is_sub_tasks_aggregated:
+                    cls._aggregate_task(scheduled_task)
+                    aggregated_tasks.append(scheduled_task)
+                    continue
+                if scheduled_task.id in visited_ids:
+                    continue
+                # 走査開始時に訪問済みにするため、循環した親子関係があっても停止する
+                visited_ids.add(scheduled_task.id)
+                stack.append((scheduled_task, True))
+                for sub_task in reversed(list(scheduled_task.sub_tasks)):
+                    if sub_task.id not in visited_ids:
+                        stack.append((sub_task, False))
+        return aggregated_tasks
+
+    @staticmethod
+    def _aggregate_task(scheduled_task: ScheduledTask):
+        """サブアイテムが集計済みの予定タスクのプロパティを更新する"""
+        # サブアイテムに親IDラベルを付与する
+        scheduled_task.update_sub_tasks_properties()
+        # サブアイテムの工数を集計し、ラベルを更新する
+        scheduled_task.aggregate_man_hours(recursive=False)
+        # 実績タスクのステータスを更新する
+        scheduled_task.update_status_by_checking_properties(recursive=False)
+        # 進捗率を更新する
+        scheduled_task.calc_progress_rate()
+        # 実績人時ラベルを更新する
+        scheduled_task.update_man_hours_label(
+            ManHoursLabel.from_man_hours(
+                executed_man_hours=scheduled_task.executed_man_hours,
+                scheduled_man_hours=scheduled_task.scheduled_man_hours,
+            )
+        )
+        # 予定タスクが持つ実績タスクのプロパティを更新する
+        scheduled_task.update_executed_tasks_properties()
@@ -0,0 +1,70 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Iterable
+
+from notiontaskr.domain.task import Task
+
+
+@dataclass
+class SyncCursor:
+    """処理済みのページの最終更新日時の上限(high-water mark)モデル
+
+    次回は上限から重なり期間だけ遡って取得し、重なり期間内に処理済みのページは除く。
+    Notionの最終更新日時は分単位に丸められるため、重なり期間は1分以上にすること。
+
+    :param last_edited_time: 処理済みのページの最終更新日時の最大値
+    :param processed_pages: 重なり期間内に処理済みのページIDと、その最終更新日時
+    """
+
+    last_edited_time: datetime
+    processed_pages: dict[str, datetime] = field(default_factory=dict)
+
+    def get_from(self, overlap: timedelta) -> datetime:
+        """次回の取得を開始する日時を取得する"""
+        return self.last_edited_time - overlap
+
+    def is_processed(self, task: Task) -> bool:
+        """同じ最終更新日時のページを処理済みかを判定する"""
+        return (
+            task.last_edited_time is not None
+            and self.processed_pages.get(str(task.page_id)) == task.last_edited_time
+        )
+
+    def advance(self, tasks: Iterable[Task], overlap: timedelta) -> "SyncCursor":
+        """処理したタスクで上限を進めた新しいカーソルを返す"""
+        processed_pages = {**self.processed_pages, **self._to_processed_pages(tasks)}
+        return self._from_processed_pages(processed_pages, overlap=overlap) or self
+
+    @classmethod
+    def from_tasks(
+        cls, tasks: Iterable[Task], overlap: timedelta
+    ) -> "SyncCursor | None":
+        """処理したタスクからカーソルを生成する(最終更新日時を持つタスクがない場合None)"""
+        return cls._from_processed_pages(
+            cls._to_processed_pages(tasks), overlap=overlap
+        )
+
+    @staticmethod
+    def _to_processed_pages(tasks: Iterable[Task]) -> dict[str, datetime]:
+        return {
+            str(task.page_id): task.last_edited_time
+            for task in tasks
+            if task.last_edited_time is not None
+        }
+
+    @classmethod
+    def _from_processed_pages(
+        cls, processed_pages: dict[str, datetime], overlap: timedelta
+    ) -> "SyncCursor | None":
+        if not processed_pages:
+            return None
+        last_edited_time = max(processed_pages.values())
+        # 次回の取得範囲に含まれるページのみ残す
+        return cls(
+            last_edited_time=last_edited_time,
+            processed_pages={
+                page_id: edited_time
+                for page_id, edited_time in processed_pages.items()
+                if edited_time >= last_edited_time - overlap
+            },
+        )
@@ -1,8 +1,10 @@
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, List, Optional
+from datetime import datetime
+from typing import TYPE_CHECKING, ClassVar, List, Optional
 
 from notiontaskr.domain.name_labels.man_hours_label import ManHoursLabel
 from notiontaskr.domain.name_labels.parent_id_label import ParentIdLabel
+from notiontaskr.domain.task_field import TaskField
 from notiontaskr.domain.task_name import TaskName
 from notiontaskr.domain.value_objects.notion_id import NotionId
 from notiontaskr.domain.value_objects.page_id import PageId
@@ -17,6 +19,9 @@ if TYPE_CHECKING:
 class Task:
     """タスクモデル"""
 
+    # from_response_dataで読み込むプロパティ名(取得するプロパティを絞り込むために使う)
+    PROPERTY_NAMES: ClassVar[tuple[str, ...]] = ("名前", "ID", "ステータス", "タグ")
+
     page_id: PageId
     name: TaskName
     tags: List[Tag]
@@ -27,6 +32,12 @@ class Task:
     update_contents: List[str] = field(
         default_factory=list  # 生成時に空のリストを作成(他インスタンスとの共有を避けるため)
     )  # （デバッグ用）更新内容を保存
+    updated_fields: set[TaskField] = field(
+        default_factory=set
+    )  # 変更された項目(変更されたプロパティのみ更新するため)
+    last_edited_time: Optional[datetime] = field(
+        default=None, compare=False
+    )  # ページの最終更新日時(Notionから取得した場合のみ設定される)
 
     def __init__(
         self,
@@ -44,47 +55,73 @@ class Task:
         self.is_updated = False
         self.parent_task_page_id = None
         self.update_contents = []
+        self.updated_fields = set()
+        self.last_edited_time = None
+
+    @staticmethod
+    def parse_last_edited_time(data: dict) -> Optional[datetime]:
+        """レスポンスデータからページの最終更新日時を取得する(存在しない場合None)"""
+        last_edited_time = data.get("last_edited_time")
+        return datetime.fromisoformat(last_edited_time) if last_edited_time else None
 
-    def _toggle_is_updated(self, update_message: str):
-        """is_updatedをトグルする"""
+    def _toggle_is_updated(self, update_message: str, field: TaskField | None = None):
+        """is_updatedをトグルし、変更された項目を記録する"""
         if not self.update_contents:
             self.update_contents = []
+        if not getattr(self, "updated_fields", None):
+            self.updated_fields = set()
         self.is_updated = True
         self.update_contents.append(update_message)
+        if field is not None:
+            self.updated_fields.add(field)
+
+    def clear_updated(self):
+        """変更の記録を消去する
+
+        常駐時はタスクを実行をまたいで保持するため、変更内容を書き込み待ちキューに積んだ後に呼び出す。
+        """
+        self.is_updated = False
+        self.update_contents = []
+        self.updated_fields = set()
 
     def update_man_hours_label(self, man_hours_label: "ManHoursLabel"):
         """工数ラベルを登録し、is_updatedをTrueにする"""
         if self.name.man_hours_label != man_hours_label:
             self._toggle_is_updated(
-                f"工数ラベル: {self.name.man_hours_label} -> {man_hours_label}"
+                f"工数ラベル: {self.name.man_hours_label} -> {man_hours_label}",
+                TaskField.NAME,
             )
-            self.name.man_hours_label = man_hours_label
+            self.name = self.name.with_man_hours_label(man_hours_label)
 
     def update_id_label(self, label: "IdLabel"):
         """IDラベルを登録し、is_updatedをTrueにする"""
         if self.name.id_label != label:
-            self._toggle_is_updated(f"IDラベル: {self.name.id_label} -> {label}")
-            self.name.id_label = label
+            self._toggle_is_updated(
+                f"IDラベル: {self.name.id_label} -> {label}", TaskField.NAME
+            )
+            self.name = self.name.with_id_label(label)
 
     def update_parent_id_label(self, parent_id_label: "ParentIdLabel"):
         """親IDラベルを更新する"""
         if self.name.parent_id_label != parent_id_label:
             self._toggle_is_updated(
-                f"親IDラベル: {self.name.parent_id_label} -> {parent_id_label}"
+                f"親IDラベル: {self.name.parent_id_label} -> {parent_id_label}",
+                TaskField.NAME,
             )
-            self.name.parent_id_label = parent_id_label
+            self.name = self.name.with_parent_id_label(parent_id_label)
 
     def update_name(self, name: TaskName):
         """タスク名を更新し、is_updatedをTrueにする"""
         if self.name != name:
-            self._toggle_is_updated(f"タスク名: {self.name} -> {name}")
+            self._toggle_is_updated(f"タスク名: {self.name} -> {name}", TaskField.NAME)
             self.name = name
 
     def update_parent_task_page_id(self, parent_task_page_id: Optional[PageId]):
         """親タスクIDを更新し、is_updatedをTrueにする"""
         if self.parent_task_page_id != parent_task_page_id:
             self._toggle_is_updated(
-                f"親タスクID: {self.parent_task_page_id} -> {parent_task_page_id}"
+                f"親タスクID: {self.parent_task_page_id} -> {parent_task_page_id}",
+                TaskField.PARENT_TASK_PAGE_ID,
             )
             self.parent_task_page_id = parent_task_page_id
 
@@ -92,14 +129,17 @@ class Task:
         """予定タスクページIDを更新するメソッド"""
         if self.scheduled_task_page_id != scheduled_task_page_id:
             self._toggle_is_updated(
-                f"予定タスクページID: {self.scheduled_task_page_id} -> {scheduled_task_page_id}"
+                f"予定タスクページID: {self.scheduled_task_page_id} -> {scheduled_task_page_id}",
+                TaskField.SCHEDULED_TASK_PAGE_ID,
             )
             self.scheduled_task_page_id = scheduled_task_page_id
 
     def update_status(self, status: Status):
         """ステータスを更新し、is_updatedをTrueにする"""
         if self.status != status:
-            self._toggle_is_updated(f"ステータス: {self.status} -> {status}")
+            self._toggle_is_updated(
+                f"ステータス: {self.status} -> {status}", TaskField.STATUS
+            )
             self.status = status
 
     def get_display_name(self) -> str:
@@ -0,0 +1,56 @@
+from typing import Generic, Iterable, Iterator, TypeVar
+
+from notiontaskr.domain.task import Task
+from notiontaskr.domain.value_objects.notion_id import NotionId
+
+T = TypeVar("T", bound=Task)
+
+
+class TaskCollection(Generic[T]):
+    """IDで索引されたタスクの集合
+
+    追加順を保持し、IDによる追加・上書きを定数時間で行う。
+    上書きしたタスクは元の位置に残る(リストの要素を置き換えた場合と同じ順序になる)。
+    """
+
+    def __init__(self, tasks: Iterable[T] = ()):
+        self._tasks_by_id: dict[NotionId, T] = {}
+        for task in tasks:
+            self.upsert(task)
+
+    @classmethod
+    def from_tasks(cls, tasks: Iterable[T]) -> "TaskCollection[T]":
+        """タスクの一覧から生成する(既にTaskCollectionの場合はそのまま返す)"""
+        if isinstance(tasks, TaskCollection):
+            return tasks
+        return cls(tasks)
+
+    def upsert(self, task: T) -> None:
+        """タスクを追加または更新する"""
+        self._tasks_by_id[task.id] = task
+
+    def get(self, id: NotionId) -> T | None:
+        """IDに一致するタスクを取得する"""
+        return self._tasks_by_id.get(id)
+
+    def __contains__(self, task: object) -> bool:
+        return getattr(task, "id", None) in self._tasks_by_id
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._tasks_by_id.values())
+
+    def __len__(self) -> int:
+        return len(self._tasks_by_id)
+
+    def __getitem__(self, index: int) -> T:
+        return list(self._tasks_by_id.values())[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, TaskCollection):
+            return list(self) == list(other)
+        if isinstance(other, list):
+            return list(self) == other
+        return False
+
+    def __repr__(self) -> str:
+        return f"TaskCollection({list(self)!r})"
@@ -0,0 +1,22 @@
+from enum import Enum
+
+
+class TaskField(Enum):
+    """タスクの変更を記録する項目"""
+
+    # タスク名(ラベルを含む)
+    NAME = "name"
+    # ステータス
+    STATUS = "status"
+    # 親タスクのページID
+    PARENT_TASK_PAGE_ID = "parent_task_page_id"
+    # 紐づいている予定タスクのID
+    SCHEDULED_TASK_ID = "scheduled_task_id"
+    # 紐づいている予定タスクのページID
+    SCHEDULED_TASK_PAGE_ID = "scheduled_task_page_id"
+    # 予定人時
+    SCHEDULED_MAN_HOURS = "scheduled_man_hours"
+    # 実績人時
+    EXECUTED_MAN_HOURS = "executed_man_hours"
+    # 進捗率
+    PROGRESS_RATE = "progress_rate"
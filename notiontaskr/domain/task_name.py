@@ -1,8 +1,9 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from functools import cached_property
 import re
+import sys
 from typing import TYPE_CHECKING, Optional
 
-
 if TYPE_CHECKING:
     from notiontaskr.domain.name_labels.id_label import IdLabel
     from notiontaskr.domain.name_labels.man_hours_label import ManHoursLabel
@@ -10,14 +11,28 @@ if TYPE_CHECKING:
 from notiontaskr.domain.name_labels.label_registerable import LabelRegisterable
 from notiontaskr.domain.name_labels.name_label import NameLabel
 
+# 角括弧で囲まれたラベル
+LABEL_PATTERN = re.compile(r"\[(.*?)\]")
+
+
+@dataclass(frozen=True, eq=False)
+class TaskName:
+    """タスク名(不変)
+
+    予定タスクと実績タスクで同じインスタンスを共有するため、変更せずに新しいインスタンスを作る。
+    表示用の文字列は初回の生成時にキャッシュし、タスク名の文字列はinternする。
+    """
 
-@dataclass
-class TaskName(LabelRegisterable):
     task_name: str  # タスク名
     id_label: Optional["IdLabel"] = None  # IDラベル
     man_hours_label: Optional["ManHoursLabel"] = None  # 人時ラベル
     parent_id_label: Optional["ParentIdLabel"] = None  # 親IDラベル
 
+    def __post_init__(self):
+        # sys.internはstr以外を受け付けない
+        if isinstance(self.task_name, str):
+            object.__setattr__(self, "task_name", sys.intern(self.task_name))
+
     @classmethod
     def from_raw_task_name(cls, raw_task_name: str):
         """生のタスク名からタイトルオブジェクトを生成する
@@ -25,29 +40,25 @@ class TaskName(LabelRegisterable):
         :param str raw_task_name: タスク名
         :return: TaskNameオブジェクト
         """
-        # 角括弧で囲まれた文字列全体を取得
-        pattern = r"\[(.*?)\]"
-        matches = re.findall(pattern, raw_task_name)
+        # 1回の走査でタイトルとラベルに分割する(奇数番目が角括弧の中身)
+        parts = LABEL_PATTERN.split(raw_task_name)
+        labels = parts[1::2]
 
-        # タイトルからラベルを削除
-        for match in matches:
-            raw_task_name = raw_task_name.replace(f"[{match}]", "").strip()
+        # ラベルをラベルオブジェクトに変換して登録
+        registered_labels = _RegisteredLabels()
+        for label in labels:
+            NameLabel.parse_labels(label, registered_labels)
 
-        instance = cls(
-            task_name=raw_task_name,
+        # タイトルからラベルを削除
+        return cls(
+            task_name="".join(parts[0::2]).strip() if labels else raw_task_name,
+            id_label=registered_labels.id_label,
+            man_hours_label=registered_labels.man_hours_label,
+            parent_id_label=registered_labels.parent_id_label,
         )
 
-        # マッチしたラベルをラベルオブジェクトに変換してリストに追加
-        for match in matches:
-            NameLabel.parse_labels(match, instance)
-
-        return instance
-
-    def __str__(self):
-        """表示用の文字列を返す
-
-        :return: 表示用の文字列
-        """
+    @cached_property
+    def _display_str(self) -> str:
         display_strs = []
 
         # 表示順に文字列を追加
@@ -62,7 +73,16 @@ class TaskName(LabelRegisterable):
         # 文字列を結合
         return ("".join(display_strs)).strip()
 
+    def __str__(self):
+        """表示用の文字列を返す
+
+        :return: 表示用の文字列
+        """
+        return self._display_str
+
     def __eq__(self, other: object):
+        if self is other:
+            return True
         if not isinstance(other, TaskName):
             return False
         return (
@@ -72,6 +92,27 @@ class TaskName(LabelRegisterable):
             and self.parent_id_label == other.parent_id_label
         )
 
+    def with_id_label(self, label: Optional["IdLabel"]) -> "TaskName":
+        """IDラベルを差し替えたタスク名を返すメソッド"""
+        return replace(self, id_label=label)
+
+    def with_man_hours_label(self, label: Optional["ManHoursLabel"]) -> "TaskName":
+        """工数ラベルを差し替えたタスク名を返すメソッド"""
+        return replace(self, man_hours_label=label)
+
+    def with_parent_id_label(self, label: Optional["ParentIdLabel"]) -> "TaskName":
+        """親IDラベルを差し替えたタスク名を返すメソッド"""
+        return replace(self, parent_id_label=label)
+
+
+@dataclass
+class _RegisteredLabels(LabelRegisterable):
+    """タスク名の解析中に、解析したラベルを受け取るクラス"""
+
+    id_label: Optional["IdLabel"] = None
+    man_hours_label: Optional["ManHoursLabel"] = None
+    parent_id_label: Optional["ParentIdLabel"] = None
+
     def register_id_label(self, label: "IdLabel"):
         """IDラベルを登録するメソッド"""
         self.id_label = label
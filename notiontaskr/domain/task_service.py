@@ -1,5 +1,6 @@
 from typing import TypeVar
 from notiontaskr.domain.task import Task
+from notiontaskr.domain.task_collection import TaskCollection
 
 T = TypeVar("T", bound=Task)
 
@@ -13,8 +14,14 @@ class TaskService:
         return updated_tasks
 
     @staticmethod
-    def upsert_tasks(to: list[T], source: T):
-        """タスクを追加または更新する"""
+    def upsert_tasks(to: list[T] | TaskCollection[T], source: T):
+        """タスクを追加または更新する
+
+        TaskCollectionの場合は定数時間、リストの場合は線形時間で処理する。
+        """
+        if isinstance(to, TaskCollection):
+            to.upsert(source)
+            return
         for i, task in enumerate(to):
             if task.id == source.id:
                 to[i] = source  # 上書き
@@ -0,0 +1,81 @@
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timezone
+
+from notiontaskr.domain.executed_task import ExecutedTask
+from notiontaskr.domain.value_objects.man_hours import ManHours
+
+
+@dataclass
+class UptimeRollup:
+    """タグ・日ごとの実績工数の集計モデル
+
+    covered_from以降、closed_until未満の日を集計済みの期間とする。
+    日付は実績タスクの開始日時をUTCに変換した日付とする(Notionの日付フィルターと合わせるため)。
+    """
+
+    covered_from: date
+    closed_until: date
+    man_hours_by_tag_day: dict[str, dict[date, float]] = field(default_factory=dict)
+
+    @classmethod
+    def from_executed_tasks(
+        cls,
+        executed_tasks: list[ExecutedTask],
+        covered_from: date,
+        closed_until: date,
+    ) -> "UptimeRollup":
+        """実績タスクから集計済みの期間の工数をタグ・日ごとに集計する"""
+        rollup = cls(covered_from=covered_from, closed_until=closed_until)
+        for task in executed_tasks:
+            rollup.add(task)
+        return rollup
+
+    def add(self, executed_task: ExecutedTask) -> None:
+        """実績タスクの工数を集計に加える(集計済みの期間外のものは無視する)"""
+        if executed_task.date is None:
+            return
+        day = self.to_day(executed_task.date.start)
+        if not self.covered_from <= day < self.closed_until:
+            return
+        for tag in executed_task.tags:
+            man_hours_by_day = self.man_hours_by_tag_day.setdefault(str(tag), {})
+            man_hours_by_day[day] = man_hours_by_day.get(day, 0.0) + float(
+                executed_task.man_hours
+            )
+
+    @staticmethod
+    def to_day(dt: datetime) -> date:
+        """日時を集計する日付に変換する"""
+        if dt.tzinfo is not None:
+            dt = dt.astimezone(timezone.utc)
+        return dt.date()
+
+    def covers(self, from_: date) -> bool:
+        """指定した開始日以降の工数を集計から取得できるか判定する"""
+        return self.covered_from <= from_
+
+    def get_open_from(self, from_: datetime) -> datetime:
+        """指定した開始日時のうち、未集計の期間の開始日時を取得する"""
+        closed_until = datetime.combine(
+            self.closed_until, time.min, tzinfo=timezone.utc
+        )
+        if from_.tzinfo is None:
+            closed_until = closed_until.replace(tzinfo=None)
+        return max(from_, closed_until)
+
+    def get_man_hours_by_day(
+        self, tag: str, from_: date, to: date
+    ) -> dict[date, float]:
+        """指定した期間(両端を含む)のうち、集計済みの期間の工数を日ごとに取得する"""
+        return {
+            day: man_hours
+            for day, man_hours in self.man_hours_by_tag_day.get(tag, {}).items()
+            if from_ <= day <= to and day < self.closed_until
+        }
+
+    def get_total_man_hours(self, tag: str, from_: date, to: date) -> float:
+        """指定した期間(両端を含む)のうち、集計済みの期間の工数を合計する"""
+        total_man_hours = ManHours(0)
+        for man_hours in self.get_man_hours_by_day(tag, from_, to).values():
+            total_man_hours += ManHours(man_hours)
+        return float(total_man_hours)
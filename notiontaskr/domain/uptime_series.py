@@ -0,0 +1,97 @@
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from enum import Enum
+
+from notiontaskr.domain.value_objects.man_hours import ManHours
+
+
+class UptimeBucket(Enum):
+    """稼働実績の時系列を区切る単位"""
+
+    MONTH = "month"
+    WEEK = "week"  # 月曜始まり
+
+    @staticmethod
+    def from_str(label: str) -> "UptimeBucket":
+        for bucket in UptimeBucket:
+            if bucket.value == label:
+                return bucket
+        raise ValueError(f"無効な集計単位です: {label}")
+
+    def get_start(self, day: date) -> date:
+        """日を含む区間の開始日を取得する"""
+        if self == UptimeBucket.MONTH:
+            return day.replace(day=1)
+        return day - timedelta(days=day.weekday())
+
+    def get_next_start(self, day: date) -> date:
+        """日を含む区間の次の区間の開始日を取得する"""
+        start = self.get_start(day)
+        if self == UptimeBucket.MONTH:
+            if start.month == 12:
+                return date(start.year + 1, 1, 1)
+            return date(start.year, start.month + 1, 1)
+        return start + timedelta(days=7)
+
+    def __str__(self):
+        return self.value
+
+
+@dataclass
+class UptimeSeries:
+    """タグ・区間ごとの実績工数の時系列
+
+    区間はfrom_からto(両端を含む)を集計単位で区切ったもので、工数のない区間も0として持つ。
+    キーは区間の開始日とする(最初の区間はfrom_に切り詰める)。
+    """
+
+    bucket: UptimeBucket
+    from_: date
+    to: date
+    man_hours_by_tag_bucket: dict[str, dict[date, ManHours]] = field(
+        default_factory=dict
+    )
+
+    @classmethod
+    def from_empty(
+        cls, tags: list[str], bucket: UptimeBucket, from_: date, to: date
+    ) -> "UptimeSeries":
+        """全ての区間の工数を0で初期化する"""
+        starts = [start for start, _ in cls.get_bucket_ranges(bucket, from_, to)]
+        return cls(
+            bucket=bucket,
+            from_=from_,
+            to=to,
+            man_hours_by_tag_bucket={
+                tag: {start: ManHours(0) for start in starts} for tag in tags
+            },
+        )
+
+    @staticmethod
+    def get_bucket_ranges(
+        bucket: UptimeBucket, from_: date, to: date
+    ) -> list[tuple[date, date]]:
+        """期間を区切った区間(開始日, 終了日)の一覧を取得する(両端は期間に切り詰める)"""
+        ranges = []
+        start = from_
+        while start <= to:
+            next_start = bucket.get_next_start(start)
+            ranges.append((start, min(next_start - timedelta(days=1), to)))
+            start = next_start
+        return ranges
+
+    def add(self, tag: str, day: date, man_hours: float) -> None:
+        """日の工数を区間に加える(対象外のタグや期間外の日は無視する)"""
+        man_hours_by_bucket = self.man_hours_by_tag_bucket.get(tag)
+        if man_hours_by_bucket is None or not self.from_ <= day <= self.to:
+            return
+        start = max(self.bucket.get_start(day), self.from_)
+        man_hours_by_bucket[start] += ManHours(man_hours)
+
+    def get_man_hours(self, tag: str) -> list[tuple[date, date, float]]:
+        """タグの区間(開始日, 終了日)と工数の一覧を古い順に取得する"""
+        man_hours_by_bucket = self.man_hours_by_tag_bucket[tag]
+        return [
+            (start, end, float(man_hours_by_bucket[start]))
+            for start, end in self.get_bucket_ranges(self.bucket, self.from_, self.to)
+        ]
@@ -1,9 +1,14 @@
 # gcs_manager.py
 import os
 from typing import Callable
+from google.api_core.exceptions import PreconditionFailed
 from google.cloud import storage
 
 
+class GenerationMismatchError(Exception):
+    """GCSのファイルが指定した世代から更新されていた場合の例外"""
+
+
 class GCSHandler:
     def __init__(
         self,
@@ -19,11 +24,15 @@ class GCSHandler:
         self,
         from_: str,
         to: str,
-    ):
+        if_generation_match: int | None = None,
+    ) -> int | None:
         """GCSにファイルをアップロード
 
         :param from_: アップロードするファイルのパス
         :param to: アップロード先のGCSのパス
+        :param if_generation_match: GCSのファイルがこの世代の場合のみアップロードする(0の場合はファイルがない場合のみ。Noneの場合は無条件)
+        :return: アップロードしたファイルの世代(generation)
+        :raise GenerationMismatchError: GCSのファイルが指定した世代でない場合
         """
 
         # ファイルの存在確認
@@ -32,7 +41,10 @@ class GCSHandler:
 
         try:
             blob = self.bucket.blob(to)
-            blob.upload_from_filename(from_)
+            blob.upload_from_filename(from_, if_generation_match=if_generation_match)
+            return blob.generation
+        except PreconditionFailed as e:
+            raise GenerationMismatchError(f"Generation mismatch: {to}") from e
         except Exception as e:
             raise e
 
@@ -53,3 +65,73 @@ class GCSHandler:
             blob.download_to_filename(to)
         except Exception as e:
             raise e
+
+    def download_if_updated(
+        self,
+        from_: str,
+        to: str,
+        generation: int | None,
+    ) -> int:
+        """GCSのファイルが指定した世代から更新されている場合のみダウンロード
+
+        メタデータのみを取得して世代(generation)を比較し、一致すればダウンロードしない。
+
+        :param from_: ダウンロードするGCSのパス
+        :param to: ダウンロード先のファイルのパス
+        :param generation: ローカルにあるファイルの世代(不明な場合None)
+        :return: ローカルにあるファイルの世代
+        :raise FileNotFoundError: GCSにファイルが存在しない場合
+        """
+        blob = self.bucket.get_blob(from_)
+        if blob is None:
+            raise FileNotFoundError(f"Blob not found: {from_}")
+        if (
+            generation is not None
+            and blob.generation == generation
+            and os.path.exists(to)
+        ):
+            return generation
+
+        os.makedirs(os.path.dirname(to), exist_ok=True)
+        # 比較した世代と同じものをダウンロードする
+        blob.download_to_filename(to, if_generation_match=blob.generation)
+        return blob.generation
+
+    def get_generation(
+        self,
+        path: str,
+    ) -> int | None:
+        """GCSのファイルの世代(generation)を取得(メタデータのみ取得する)
+
+        :param path: GCSのパス
+        :return: ファイルの世代(ファイルが存在しない場合None)
+        """
+        blob = self.bucket.get_blob(path)
+        return blob.generation if blob is not None else None
+
+    def list_names(
+        self,
+        prefix: str,
+    ) -> list[str]:
+        """GCSの指定したプレフィックス配下のファイル名一覧を取得
+
+        :param prefix: 検索するGCSのパスのプレフィックス
+        :return: ファイル名(GCSのパス)の一覧
+        """
+        try:
+            return [blob.name for blob in self.bucket.list_blobs(prefix=prefix)]
+        except Exception as e:
+            raise e
+
+    def delete(
+        self,
+        path: str,
+    ):
+        """GCSのファイルを削除
+
+        :param path: 削除するGCSのパス
+        """
+        try:
+            self.bucket.blob(path).delete()
+        except Exception as e:
+            raise e
@@ -2,20 +2,29 @@ from typing import Callable, List
 from notiontaskr.infrastructure.executed_task_update_properties import (
     ExecutedTaskUpdateProperties,
 )
-from notion_client import Client
 
 from notiontaskr.domain.executed_task import ExecutedTask
+from notiontaskr.infrastructure.notion_repository import NotionRepository
 from notiontaskr.infrastructure.operator import CheckboxOperator
 from notiontaskr.infrastructure.task_search_condition import TaskSearchCondition
 
 
-class ExecutedTaskRepository:
-    def __init__(self, token, db_id):
-        self.client = Client(
-            auth=token,
+class ExecutedTaskRepository(NotionRepository[ExecutedTask]):
+    is_scheduled = False
+    property_names = ExecutedTask.PROPERTY_NAMES
+
+    @staticmethod
+    def _to_task(data: dict) -> ExecutedTask:
+        return ExecutedTask.from_response_data(data)
+
+    @staticmethod
+    def build_update_properties(executed_task: ExecutedTask) -> dict:
+        """変更されたプロパティのみの更新内容を生成する"""
+        return (
+            ExecutedTaskUpdateProperties(task=executed_task)
+            .set_updated_fields()
+            .build()
         )
-        self.db_id = db_id
-        self.filter = TaskSearchCondition()
 
     async def find_all(
         self, on_error: Callable[[Exception, dict], None]
@@ -31,8 +40,9 @@ class ExecutedTaskRepository:
             .build()
         )
 
-        response_data = self.client.databases.query(
-            **{"database_id": self.db_id, "filter": filter}
+        query_params = await self._build_query_params(filter)
+        response_data = await self._request(
+            lambda: self.client.databases.query(**query_params)
         )
 
         # response_dataをScheduledTaskのリストに変換する
@@ -62,8 +72,9 @@ class ExecutedTaskRepository:
             .build()
         )
 
-        response_data = self.client.databases.query(
-            **{"database_id": self.db_id, "filter": filter}
+        query_params = await self._build_query_params(filter)
+        response_data = await self._request(
+            lambda: self.client.databases.query(**query_params)
         )
 
         # response_dataをScheduledTaskのリストに変換する
@@ -76,79 +87,31 @@ class ExecutedTaskRepository:
 
         return executed_tasks
 
-    async def find_all_by_condition(
-        self,
-        condition: TaskSearchCondition,
-        on_error: Callable[[Exception, dict], None],
-    ) -> List[ExecutedTask]:
-        """指定した条件に一致する全ての実績タスクをページネーションを考慮して取得する"""
-        all_tasks = []
-        start_cursor = ""
-        has_more = True
-        while has_more:
-            tasks, next_cursor, has_more = await self._find_by_condition_with_cursor(
-                condition=condition,
-                on_error=on_error,
-                start_cursor=start_cursor,
-            )
-            all_tasks.extend(tasks)
-            start_cursor = next_cursor
-        return all_tasks
-
-    async def _find_by_condition_with_cursor(
-        self,
-        condition: TaskSearchCondition,
-        on_error: Callable[[Exception, dict], None],
-        start_cursor: str,
-    ) -> tuple[list[ExecutedTask], str, bool]:
-        """タスクDBの指定タグの実績を全て取得する（ページネーション対応）"""
-        filter = (
-            TaskSearchCondition()
-            .and_(
-                TaskSearchCondition().where_scheduled_flag(
-                    operator=CheckboxOperator.EQUALS, is_scheduled=False
-                ),
-                condition,
-            )
-            .build()
-        )
-        query_params = {"database_id": self.db_id, "filter": filter}
-        if start_cursor:
-            query_params["start_cursor"] = start_cursor
-
-        response_data = self.client.databases.query(**query_params)
-        executed_tasks = []
-        for data in response_data["results"]:  # type: ignore
-            try:
-                executed_tasks.append(ExecutedTask.from_response_data(data))
-            except Exception as e:
-                on_error(e, data)
-        next_cursor = response_data.get("next_cursor")  # type: ignore
-        has_more = response_data.get("has_more", False)  # type: ignore
-        return executed_tasks, next_cursor, has_more
-
     async def update(
         self,
         executed_task: ExecutedTask,
         on_success: Callable[[ExecutedTask], None],
         on_error: Callable[[Exception, ExecutedTask], None],
-    ) -> None:
-        """実績タスクを更新する"""
+    ) -> bool:
+        """実績タスクを更新する
 
-        try:
-            properties = (
-                ExecutedTaskUpdateProperties(task=executed_task)
-                .set_name()
-                .set_status()
-                .set_parent_task_page_id()
-                .set_scheduled_task_page_id()
-                .build()
-            )
+        :return: 更新に成功した場合True
+        """
 
-            self.client.pages.update(
-                **{"page_id": str(executed_task.page_id), "properties": properties}
+        try:
+            # 変更されたプロパティのみ更新する
+            properties = self.build_update_properties(executed_task)
+            if not properties:
+                on_success(executed_task)
+                return True
+
+            await self._request(
+                lambda: self.client.pages.update(
+                    **{"page_id": str(executed_task.page_id), "properties": properties}
+                )
             )
             on_success(executed_task)
+            return True
         except Exception as e:
             on_error(e, executed_task)
-            return
+            return False
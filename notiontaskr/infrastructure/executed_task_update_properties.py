@@ -1,4 +1,7 @@
+from typing import Callable
+
 from notiontaskr.domain.executed_task import ExecutedTask
+from notiontaskr.domain.task_field import TaskField
 from notiontaskr.infrastructure.task_update_properties import TaskUpdateProperties
 
 
@@ -9,6 +12,13 @@ class ExecutedTaskUpdateProperties(TaskUpdateProperties):
         super().__init__(task)
         self.task = task
 
+    def _get_setters_by_field(self) -> dict[TaskField, Callable[[], object]]:
+        return {
+            **super()._get_setters_by_field(),
+            TaskField.PARENT_TASK_PAGE_ID: self.set_parent_task_page_id,
+            TaskField.SCHEDULED_TASK_PAGE_ID: self.set_scheduled_task_page_id,
+        }
+
     def set_scheduled_task_page_id(self):
         """予定タスクの更新"""
         if self.task.scheduled_task_page_id:
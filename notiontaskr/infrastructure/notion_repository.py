@@ -0,0 +1,266 @@
+import asyncio
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Awaitable, Callable, Generic, List, TypeVar
+
+from notion_client import AsyncClient
+
+from notiontaskr.domain.task import Task
+from notiontaskr.domain.value_objects.page_id import PageId
+from notiontaskr.infrastructure.notion_request_dispatcher import (
+    NotionRequestDispatcher,
+)
+from notiontaskr.infrastructure.operator import CheckboxOperator
+from notiontaskr.infrastructure.task_search_condition import TaskSearchCondition
+
+T = TypeVar("T")
+TaskT = TypeVar("TaskT", bound=Task)
+
+# 分割した条件ごとの取得が終わったことを示す値
+_PARTITION_DONE = object()
+
+
+class NotionRepository(ABC, Generic[TaskT]):
+    """Notion APIを利用するリポジトリの基底クラス
+
+    Notion APIへのリクエストは全て`_request`を経由させる。
+    サブクラスは予定フラグ(`is_scheduled`)とレスポンスデータの変換(`_to_task`)を定義する。
+    予定フラグがNoneの場合は、予定フラグで絞り込まない。
+    """
+
+    is_scheduled: bool | None = None
+    # 取得するプロパティ名(空の場合は全てのプロパティを取得する)
+    property_names: tuple[str, ...] = ()
+    # 1ページあたりの最大件数(Notion APIの仕様)
+    PAGE_SIZE = 100
+
+    def __init__(
+        self,
+        token,
+        db_id,
+        client: AsyncClient | None = None,
+        dispatcher: NotionRequestDispatcher | None = None,
+    ):
+        # clientを渡すと他のリポジトリとコネクションプールを共有できる
+        self.client = client or AsyncClient(
+            auth=token,
+        )
+        # dispatcherを渡すと読み取り・更新の同時実行数とレートを制御できる
+        self.dispatcher = dispatcher
+        self.db_id = db_id
+        self.filter = TaskSearchCondition()
+        # 取得するプロパティのID(DBのスキーマから一度だけ解決する。失敗した場合はNoneのまま)
+        self._property_ids: list[str] | None = None
+        self._is_property_ids_resolved = False
+        self._property_ids_lock = asyncio.Lock()
+
+    async def _request(self, request: Callable[[], Awaitable[T]]) -> T:
+        """Notion APIへリクエストする(dispatcherがあれば流量制御とリトライを行う)
+
+        :param request: 実行するたびに新しいリクエストを生成する関数
+        """
+        if self.dispatcher is None:
+            return await request()
+        return await self.dispatcher.run(request)
+
+    async def find_by_page_id(self, page_id: PageId) -> TaskT:
+        """ページIDから1件のページ情報を取得する
+
+        :raise RuntimeError: 取得またはタスクへの変換に失敗した場合
+        """
+        try:
+            filter_properties = await self._get_filter_properties()
+            response_data = await self._request(
+                lambda: self.client.pages.retrieve(
+                    page_id=str(page_id),
+                    **(
+                        {"filter_properties": filter_properties}
+                        if filter_properties is not None
+                        else {}
+                    ),
+                )
+            )
+            return self._to_task(response_data)  # type: ignore
+
+        except Exception as e:
+            raise RuntimeError(f"ページ取得失敗: {e}")
+
+    async def update_page(self, page_id: PageId, properties: dict) -> None:
+        """ページのプロパティを更新する
+
+        :raise Exception: 更新に失敗した場合
+        """
+        await self._request(
+            lambda: self.client.pages.update(
+                page_id=str(page_id), properties=properties
+            )
+        )
+
+    async def _get_filter_properties(self) -> list[str] | None:
+        """取得するプロパティのIDを取得する(filter_propertiesに指定する)
+
+        filter_propertiesにはプロパティIDを指定するため、初回のみDBのスキーマから名前をIDに変換する。
+        変換に失敗した場合は、以降も問い合わせ直さずに全てのプロパティを取得する(Noneを返す)。
+        """
+        if not self.property_names:
+            return None
+        async with self._property_ids_lock:
+            if not self._is_property_ids_resolved:
+                self._is_property_ids_resolved = True
+                try:
+                    database = await self._request(
+                        lambda: self.client.databases.retrieve(database_id=self.db_id)
+                    )
+                    ids_by_name = {
+                        name: property["id"]
+                        for name, property in database["properties"].items()  # type: ignore
+                    }
+                    self._property_ids = [
+                        ids_by_name[name]
+                        for name in self.property_names
+                        if name in ids_by_name
+                    ]
+                except Exception:
+                    return None
+        return self._property_ids
+
+    async def _build_query_params(self, filter: dict) -> dict:
+        """DBへの問い合わせのパラメータを生成する"""
+        query_params = {"database_id": self.db_id, "filter": filter}
+        filter_properties = await self._get_filter_properties()
+        if filter_properties is not None:
+            query_params["filter_properties"] = filter_properties
+        return query_params
+
+    @staticmethod
+    @abstractmethod
+    def _to_task(data: dict) -> TaskT:
+        """レスポンスデータからタスクを生成する"""
+        pass
+
+    def _build_filter(self, condition: TaskSearchCondition) -> dict:
+        """予定フラグと指定した条件を結合したフィルターを生成する"""
+        if self.is_scheduled is None:
+            return condition.build()
+        return (
+            TaskSearchCondition()
+            .and_(
+                TaskSearchCondition().where_scheduled_flag(
+                    operator=CheckboxOperator.EQUALS, is_scheduled=self.is_scheduled
+                ),
+                condition,
+            )
+            .build()
+        )
+
+    async def _iter_query_results(self, filter: dict) -> AsyncIterator[dict]:
+        """フィルターに一致するページのレスポンスデータを1件ずつ返す
+
+        次のページの取得を先に開始してから現在のページを返すため、呼び出し側の処理と通信が重なる。
+        """
+        query_params = await self._build_query_params(filter)
+        next_request = asyncio.ensure_future(
+            self._request(lambda: self.client.databases.query(**query_params))
+        )
+        try:
+            while next_request is not None:
+                response_data = await next_request
+                next_request = None
+                next_cursor = response_data.get("next_cursor")  # type: ignore
+                if response_data.get("has_more", False) and next_cursor:  # type: ignore
+                    # リトライ時にも同じカーソルで取得するため、引数を束縛する
+                    next_request = asyncio.ensure_future(
+                        self._request(
+                            lambda params={
+                                **query_params,
+                                "start_cursor": next_cursor,
+                            }: self.client.databases.query(**params)
+                        )
+                    )
+                for data in response_data["results"]:  # type: ignore
+                    yield data
+        finally:
+            # 途中で読み込みをやめた場合は、先行して開始した取得を取り消す
+            if next_request is not None:
+                next_request.cancel()
+
+    async def iter_all_by_condition(
+        self,
+        condition: TaskSearchCondition,
+        on_error: Callable[[Exception, dict], None],
+    ) -> AsyncIterator[TaskT]:
+        """指定した条件に一致する全てのタスクを、ページの取得に合わせて1件ずつ返す"""
+        async for data in self._iter_query_results(self._build_filter(condition)):
+            try:
+                yield self._to_task(data)
+            except Exception as e:
+                on_error(e, data)
+
+    async def find_all_by_condition(
+        self,
+        condition: TaskSearchCondition,
+        on_error: Callable[[Exception, dict], None],
+    ) -> List[TaskT]:
+        """指定した条件に一致する全てのタスクをページネーションを考慮して取得する"""
+        return [
+            task
+            async for task in self.iter_all_by_condition(
+                condition=condition, on_error=on_error
+            )
+        ]
+
+    async def iter_all_by_partitioned_conditions(
+        self,
+        conditions: List[TaskSearchCondition],
+        on_error: Callable[[Exception, dict], None],
+    ) -> AsyncIterator[TaskT]:
+        """分割した条件ごとに並列でページネーションし、取得したタスクを1件ずつ返す
+
+        条件ごとのカーソルは独立しているため、取得は分割数の分だけ並列になる。
+        同じページが複数の条件に含まれる場合は、最初に取得したものだけを返す。
+        同時実行数とレートはdispatcherで制御する。
+        """
+        # 読み込み側が遅い場合に取得を待たせ、保持する件数を抑える
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.PAGE_SIZE * len(conditions))
+
+        async def produce(condition: TaskSearchCondition):
+            try:
+                async for task in self.iter_all_by_condition(
+                    condition=condition, on_error=on_error
+                ):
+                    await queue.put(task)
+            finally:
+                await queue.put(_PARTITION_DONE)
+
+        producers = [
+            asyncio.ensure_future(produce(condition)) for condition in conditions
+        ]
+        try:
+            remaining_count = len(producers)
+            page_ids = set()
+            while remaining_count > 0:
+                task = await queue.get()
+                if task is _PARTITION_DONE:
+                    remaining_count -= 1
+                    continue
+                if task.page_id in page_ids:
+                    continue
+                page_ids.add(task.page_id)
+                yield task
+            # 取得に失敗した条件があれば例外を送出する
+            await asyncio.gather(*producers)
+        finally:
+            for producer in producers:
+                producer.cancel()
+
+    async def find_all_by_partitioned_conditions(
+        self,
+        conditions: List[TaskSearchCondition],
+        on_error: Callable[[Exception, dict], None],
+    ) -> List[TaskT]:
+        """分割した条件ごとに並列でページネーションし、結果をページIDで重複排除して結合する"""
+        return [
+            task
+            async for task in self.iter_all_by_partitioned_conditions(
+                conditions=conditions, on_error=on_error
+            )
+        ]
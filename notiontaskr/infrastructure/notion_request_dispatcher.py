@@ -0,0 +1,122 @@
+import asyncio
+import random
+from dataclasses import dataclass
+from typing import Awaitable, Callable, TypeVar
+
+from notion_client.errors import (
+    APIErrorCode,
+    APIResponseError,
+    HTTPResponseError,
+    RequestTimeoutError,
+)
+
+from notiontaskr.infrastructure.token_bucket import TokenBucket
+
+T = TypeVar("T")
+
+# リトライ対象のNotion APIエラーコード
+RETRYABLE_ERROR_CODES = (
+    APIErrorCode.RateLimited,
+    APIErrorCode.ConflictError,
+    APIErrorCode.InternalServerError,
+    APIErrorCode.ServiceUnavailable,
+)
+
+
+@dataclass
+class BatchResult:
+    """一括リクエストの成功件数と失敗件数"""
+
+    success_count: int = 0
+    failure_count: int = 0
+
+    @classmethod
+    def from_results(cls, results: list[bool]) -> "BatchResult":
+        """各リクエストの成否から生成する"""
+        success_count = sum(1 for result in results if result)
+        return cls(
+            success_count=success_count,
+            failure_count=len(results) - success_count,
+        )
+
+
+class NotionRequestDispatcher:
+    """Notion APIへのリクエストを流量制御しながら実行するクラス
+
+    - 同時実行数を`max_in_flight`件までに制限する(リトライ待機中は枠を解放する)
+    - トークンバケットで1秒あたりのリクエスト数を制限する
+    - 429や5xxはジッター付きの指数バックオフでリトライする(Retry-Afterがあれば優先する)
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int,
+        token_bucket: TokenBucket,
+        max_retries: int,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ):
+        if max_in_flight < 1:
+            raise ValueError(
+                f"max_in_flight`{max_in_flight}`は1以上でなければなりません。"
+            )
+        self.token_bucket = token_bucket
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._semaphore = asyncio.Semaphore(max_in_flight)
+        self._sleep = sleep
+
+    async def run(self, request: Callable[[], Awaitable[T]]) -> T:
+        """リクエストを実行する
+
+        :param request: 実行するたびに新しいリクエストを生成する関数
+        :raise Exception: リトライ対象外のエラー、もしくはリトライ上限に達した場合
+        """
+        attempt = 0
+        while True:
+            # 同時実行枠は1回の試行の間だけ保持し、バックオフ中は他のリクエストへ譲る
+            async with self._semaphore:
+                await self.token_bucket.acquire()
+                try:
+                    return await request()
+                except Exception as e:
+                    if attempt >= self.max_retries or not self._is_retryable(e):
+                        raise e
+                    delay = self._get_retry_delay(e, attempt)
+            attempt += 1
+            await self._sleep(delay)
+
+    @staticmethod
+    def _is_retryable(e: Exception) -> bool:
+        """リトライ対象のエラーかを判定する"""
+        if isinstance(e, RequestTimeoutError):
+            return True
+        if isinstance(e, APIResponseError):
+            return e.code in RETRYABLE_ERROR_CODES
+        if isinstance(e, HTTPResponseError):
+            return e.status == 429 or e.status >= 500
+        return False
+
+    def _get_retry_delay(self, e: Exception, attempt: int) -> float:
+        """リトライまでの待機秒数を取得する(Full Jitter)"""
+        backoff = min(self.max_delay, self.base_delay * (2**attempt))
+        delay = random.uniform(0, backoff)
+
+        retry_after = self._get_retry_after(e)
+        if retry_after is not None:
+            # 他のリクエストも含めて、Retry-Afterの間は送信を止める
+            self.token_bucket.pause(retry_after)
+            delay = max(delay, retry_after)
+        return delay
+
+    @staticmethod
+    def _get_retry_after(e: Exception) -> float | None:
+        """Retry-Afterヘッダーの秒数を取得する"""
+        if not isinstance(e, HTTPResponseError):
+            return None
+        try:
+            return float(e.headers["Retry-After"])
+        except (KeyError, TypeError, ValueError):
+            return None
@@ -0,0 +1,151 @@
+import asyncio
+import json
+import os
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+from notiontaskr.domain.value_objects.page_id import PageId
+from notiontaskr.infrastructure.notion_request_dispatcher import BatchResult
+
+
+@dataclass
+class PendingPageUpdate:
+    """書き込み待ちのページ更新
+
+    :param properties: 統合済みの更新するプロパティ(プロパティ名をキーとする)
+    :param enqueued_at: 最初に積まれた時刻(UNIX時間)
+    """
+
+    properties: dict
+    enqueued_at: float
+
+
+class PageUpdateQueue:
+    """ページ更新の書き込み待ちキュー(write-behind)
+
+    同じページへの更新はプロパティ単位で統合し、後から積まれた値で上書きする。
+    最初に積まれてから一定時間が経過したページのみ書き込むため、
+    連続する実行で同じページが何度も変更されても、書き込むのは最終的な状態の1回のみになる。
+    書き込みに失敗したページはキューに残し、次回の書き込みで再送する。
+    実行をまたいで保持するため、JSONで保存する。
+    """
+
+    def __init__(self, save_path: str, clock: Callable[[], float] = time.time):
+        self.save_path = save_path
+        self._clock = clock
+        self._updates: dict[str, PendingPageUpdate] = {}
+
+    def __len__(self) -> int:
+        return len(self._updates)
+
+    def __contains__(self, page_id: PageId) -> bool:
+        return str(page_id) in self._updates
+
+    def get_properties(self, page_id: PageId) -> dict | None:
+        """統合済みの更新するプロパティを取得する(キューにない場合None)"""
+        pending = self._updates.get(str(page_id))
+        return dict(pending.properties) if pending else None
+
+    def enqueue(self, page_id: PageId, properties: dict) -> None:
+        """ページの更新を積む(同じページの更新があれば統合する)"""
+        if not properties:
+            return
+        pending = self._updates.get(str(page_id))
+        if pending is None:
+            self._updates[str(page_id)] = PendingPageUpdate(
+                properties=dict(properties), enqueued_at=self._clock()
+            )
+            return
+        pending.properties.update(properties)
+
+    def merge(self, other: "PageUpdateQueue") -> None:
+        """他の処理が保存したキューを統合する
+
+        同じページの更新はプロパティ単位で統合し、このキューの値を優先する。
+        """
+        for page_id, pending in other._updates.items():
+            own = self._updates.get(page_id)
+            if own is None:
+                self._updates[page_id] = PendingPageUpdate(
+                    properties=dict(pending.properties),
+                    enqueued_at=pending.enqueued_at,
+                )
+                continue
+            own.properties = {**pending.properties, **own.properties}
+            own.enqueued_at = min(own.enqueued_at, pending.enqueued_at)
+
+    async def flush(
+        self,
+        update: Callable[[PageId, dict], Awaitable[None]],
+        on_error: Callable[[Exception, PageId], None],
+        max_concurrency: int,
+        delay: float = 0.0,
+    ) -> BatchResult:
+        """最初に積まれてから`delay`秒以上経過したページの更新を書き込む
+
+        :param update: ページを更新する関数(失敗時は例外を送出する)
+        :param max_concurrency: 同時に書き込むページ数の上限
+        :param delay: 書き込みを待つ秒数(0の場合は全て書き込む)
+        :return: 書き込みの成功件数と失敗件数
+        """
+        now = self._clock()
+        due_updates = [
+            (page_id, pending)
+            for page_id, pending in self._updates.items()
+            if now - pending.enqueued_at >= delay
+        ]
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def flush_one(page_id: str, pending: PendingPageUpdate) -> bool:
+            properties = dict(pending.properties)
+            async with semaphore:
+                try:
+                    await update(PageId(page_id), properties)
+                except Exception as e:
+                    on_error(e, PageId(page_id))
+                    return False
+            # 書き込み中に積まれた更新は、次回の書き込みのために残す
+            if (
+                self._updates.get(page_id) is pending
+                and pending.properties == properties
+            ):
+                del self._updates[page_id]
+            return True
+
+        results = await asyncio.gather(
+            *(flush_one(page_id, pending) for page_id, pending in due_updates)
+        )
+        return BatchResult.from_results(list(results))
+
+    def save(self) -> None:
+        """キューをファイルに保存する"""
+        os.makedirs(os.path.dirname(self.save_path), exist_ok=True)
+        with open(self.save_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    page_id: {
+                        "properties": pending.properties,
+                        "enqueued_at": pending.enqueued_at,
+                    }
+                    for page_id, pending in self._updates.items()
+                },
+                f,
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+
+    def load(self) -> None:
+        """ファイルからキューを読み込む(ファイルがない場合は空にする)"""
+        if not os.path.exists(self.save_path):
+            self._updates = {}
+            return
+        with open(self.save_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        self._updates = {
+            page_id: PendingPageUpdate(
+                properties=record["properties"],
+                enqueued_at=record["enqueued_at"],
+            )
+            for page_id, record in data.items()
+        }
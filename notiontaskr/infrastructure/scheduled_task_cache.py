@@ -1,33 +1,167 @@
 import os
 import pickle
+import uuid
+from datetime import datetime, timezone
 from typing import List
 
 from notiontaskr.domain.scheduled_task import ScheduledTask
+from notiontaskr.domain.value_objects.notion_id import NotionId
+from notiontaskr.infrastructure.scheduled_task_serializer import (
+    ScheduledTaskSerializer,
+)
 
 
 class ScheduledTaskCache:
-    def __init__(self, save_path: str):
+    """予定タスクのキャッシュ
+
+    1日1回保存する全件のスナップショットと、実行ごとに追記する差分で構成する。
+    読み込み時はスナップショットに差分をファイル名順(=保存順)に適用する。
+    保存形式はScheduledTaskSerializerによるもので、旧形式(pickle)のファイルも読み込める。
+    """
+
+    DELTA_EXTENSION = ".pkl"
+
+    def __init__(self, save_path: str, delta_dir: str):
         self.save_path = save_path
+        self.delta_dir = delta_dir
+
+    @property
+    def generation_path(self) -> str:
+        """スナップショットのGCS上の世代を記録するファイルのパス"""
+        return self.save_path + ".generation"
+
+    def get_generation(self) -> int | None:
+        """ローカルのスナップショットに対応するGCS上の世代を取得する"""
+        if not os.path.exists(self.save_path) or not os.path.exists(
+            self.generation_path
+        ):
+            return None
+        try:
+            with open(self.generation_path, "r") as f:
+                return int(f.read().strip())
+        except ValueError:
+            return None
+
+    def save_generation(self, generation: int | None) -> None:
+        """ローカルのスナップショットに対応するGCS上の世代を記録する"""
+        if generation is None:
+            self._clear_generation()
+            return
+        with open(self.generation_path, "w") as f:
+            f.write(str(generation))
+
+    def _clear_generation(self) -> None:
+        if os.path.exists(self.generation_path):
+            os.remove(self.generation_path)
 
     def save(
         self,
         tasks: List[ScheduledTask],
     ) -> None:
-        """Task一覧をファイルに保存する"""
+        """Task一覧をファイルに保存する(スナップショット)
+
+        ローカルの内容がGCSと一致しなくなるため、記録済みの世代は破棄する。
+        """
+        self._clear_generation()
         try:
             with open(self.save_path, "wb") as f:
-                pickle.dump(tasks, f)
+                f.write(ScheduledTaskSerializer.serialize(tasks))
+        except Exception as e:
+            raise e
+
+    def save_delta(
+        self,
+        tasks: List[ScheduledTask],
+    ) -> str:
+        """変更されたTask一覧を差分ファイルとして保存する
+
+        ファイル名は保存日時から始まるため、名前順に並べると保存順になる。
+
+        :return: 保存した差分ファイルのパス
+        """
+        os.makedirs(self.delta_dir, exist_ok=True)
+        file_name = (
+            datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+            + f"_{uuid.uuid4().hex[:8]}"
+            + self.DELTA_EXTENSION
+        )
+        path = os.path.join(self.delta_dir, file_name)
+        try:
+            with open(path, "wb") as f:
+                f.write(ScheduledTaskSerializer.serialize(tasks))
         except Exception as e:
             raise e
+        return path
+
+    def get_delta_names(self) -> List[str]:
+        """ローカルにある差分ファイル名を保存順に取得する"""
+        if not os.path.exists(self.delta_dir):
+            return []
+        return sorted(
+            name
+            for name in os.listdir(self.delta_dir)
+            if name.endswith(self.DELTA_EXTENSION)
+        )
+
+    def delete_deltas(self, names: List[str]) -> None:
+        """指定した差分ファイルを削除する"""
+        for name in names:
+            path = os.path.join(self.delta_dir, name)
+            if os.path.exists(path):
+                os.remove(path)
 
     def load(
         self,
     ) -> List[ScheduledTask]:
-        """ファイルからTask一覧を読み込む"""
+        """ファイルからTask一覧を読み込む(スナップショット + 差分)"""
         try:
             if not os.path.exists(self.save_path):
                 raise FileNotFoundError(f"Cache file not found: {self.save_path}")
-            with open(self.save_path, "rb") as f:
-                return pickle.load(f)
+            entries = self._read(self.save_path)
         except Exception as e:
             raise e
+
+        tasks_by_id: dict[NotionId, ScheduledTask] = {}
+        sub_task_ids_by_id: dict[NotionId, List[NotionId]] = {}
+        for name in [None] + self.get_delta_names():
+            if name is not None:
+                entries = self._read(os.path.join(self.delta_dir, name))
+            for task, sub_task_ids in entries:
+                tasks_by_id[task.id] = task
+                sub_task_ids_by_id[task.id] = sub_task_ids
+
+        self._link_sub_tasks(tasks_by_id, sub_task_ids_by_id)
+        return list(tasks_by_id.values())
+
+    @staticmethod
+    def _read(path: str) -> List[tuple[ScheduledTask, List[NotionId]]]:
+        """ファイルから予定タスクとサブアイテムのIDの組を読み込む"""
+        with open(path, "rb") as f:
+            data = f.read()
+        if ScheduledTaskSerializer.is_serialized(data):
+            return ScheduledTaskSerializer.deserialize(data)
+
+        # 旧形式(予定タスクの一覧をそのままpickleしたもの)
+        tasks: List[ScheduledTask] = pickle.loads(data)
+        for task in tasks:
+            # 旧形式ではリストで保存されているため、TaskCollectionに変換する
+            task.update_executed_tasks(getattr(task, "executed_tasks", []))
+        return [(task, [sub_task.id for sub_task in task.sub_tasks]) for task in tasks]
+
+    @staticmethod
+    def _link_sub_tasks(
+        tasks_by_id: dict[NotionId, ScheduledTask],
+        sub_task_ids_by_id: dict[NotionId, List[NotionId]],
+    ) -> None:
+        """サブアイテムを最新の予定タスクに紐づける
+
+        差分で置き換えられた予定タスクを、親が古いインスタンスのまま参照しないようにする。
+        """
+        for id, sub_task_ids in sub_task_ids_by_id.items():
+            tasks_by_id[id].update_sub_tasks(
+                [
+                    tasks_by_id[sub_task_id]
+                    for sub_task_id in sub_task_ids
+                    if sub_task_id in tasks_by_id
+                ]
+            )
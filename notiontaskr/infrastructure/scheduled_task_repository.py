@@ -1,22 +1,30 @@
 from typing import Callable, List
-from notiontaskr.domain.value_objects.page_id import PageId
 from notiontaskr.infrastructure.scheduled_task_update_properties import (
     ScheduledTaskUpdateProperties,
 )
-from notion_client import Client
 
 from notiontaskr.domain.scheduled_task import ScheduledTask
+from notiontaskr.infrastructure.notion_repository import NotionRepository
 from notiontaskr.infrastructure.operator import CheckboxOperator
 from notiontaskr.infrastructure.task_search_condition import TaskSearchCondition
 
 
-class ScheduledTaskRepository:
-    def __init__(self, token, db_id):
-        self.client = Client(
-            auth=token,
+class ScheduledTaskRepository(NotionRepository[ScheduledTask]):
+    is_scheduled = True
+    property_names = ScheduledTask.PROPERTY_NAMES
+
+    @staticmethod
+    def _to_task(data: dict) -> ScheduledTask:
+        return ScheduledTask.from_response_data(data)
+
+    @staticmethod
+    def build_update_properties(scheduled_task: ScheduledTask) -> dict:
+        """変更されたプロパティのみの更新内容を生成する"""
+        return (
+            ScheduledTaskUpdateProperties(task=scheduled_task)
+            .set_updated_fields()
+            .build()
         )
-        self.db_id = db_id
-        self.filter = TaskSearchCondition()
 
     async def find_all(
         self, on_error: Callable[[Exception, dict], None]
@@ -32,8 +40,9 @@ class ScheduledTaskRepository:
             .build()
         )
 
-        response_data = self.client.databases.query(
-            **{"database_id": self.db_id, "filter": filter}
+        query_params = await self._build_query_params(filter)
+        response_data = await self._request(
+            lambda: self.client.databases.query(**query_params)
         )
 
         # response_dataをScheduledTaskのリストに変換する
@@ -64,8 +73,9 @@ class ScheduledTaskRepository:
             .build()
         )
 
-        response_data = self.client.databases.query(
-            **{"database_id": self.db_id, "filter": filter}
+        query_params = await self._build_query_params(filter)
+        response_data = await self._request(
+            lambda: self.client.databases.query(**query_params)
         )
 
         # response_dataをScheduledTaskのリストに変換する
@@ -79,89 +89,31 @@ class ScheduledTaskRepository:
 
         return scheduled_tasks
 
-    async def find_all_by_condition(
-        self,
-        condition: TaskSearchCondition,
-        on_error: Callable[[Exception, dict], None],
-    ) -> List[ScheduledTask]:
-        """指定した条件に一致する全ての予定タスクをページネーションを考慮して取得する"""
-        all_tasks = []
-        start_cursor = None
-        has_more = True
-        while has_more:
-            tasks, next_cursor, has_more = await self._find_by_condition_with_cursor(
-                condition=condition,
-                on_error=on_error,
-                start_cursor=start_cursor,  # type: ignore
-            )
-            all_tasks.extend(tasks)
-            start_cursor = next_cursor
-        return all_tasks
-
-    async def _find_by_condition_with_cursor(
-        self,
-        condition: TaskSearchCondition,
-        on_error: Callable[[Exception, dict], None],
-        start_cursor: str = None,  # type: ignore
-    ) -> tuple[list[ScheduledTask], str, bool]:
-        """タスクDBの指定タグの予定を全て取得する（ページネーション対応）"""
-        filter = (
-            TaskSearchCondition()
-            .and_(
-                TaskSearchCondition().where_scheduled_flag(
-                    operator=CheckboxOperator.EQUALS, is_scheduled=True
-                ),
-                condition,
-            )
-            .build()
-        )
-        query_params = {"database_id": self.db_id, "filter": filter}
-        if start_cursor:
-            query_params["start_cursor"] = start_cursor
-
-        response_data = self.client.databases.query(**query_params)
-        scheduled_tasks = []
-        for data in response_data["results"]:  # type: ignore
-            try:
-                scheduled_tasks.append(ScheduledTask.from_response_data(data))
-            except Exception as e:
-                on_error(e, data)
-        next_cursor = response_data.get("next_cursor")  # type: ignore
-        has_more = response_data.get("has_more", False)  # type: ignore
-        return scheduled_tasks, next_cursor, has_more
-
-    async def find_by_page_id(self, page_id: PageId) -> ScheduledTask:
-        """ページIDから1件のページ情報を取得する"""
-        try:
-            response_data = self.client.pages.retrieve(page_id=str(page_id))
-            task = ScheduledTask.from_response_data(response_data)  # type: ignore
-            return task
-
-        except Exception as e:
-            raise RuntimeError(f"ページ取得失敗: {e}")
-
     async def update(
         self,
         scheduled_task: ScheduledTask,
         on_success: Callable[[ScheduledTask], None],
         on_error: Callable[[Exception, ScheduledTask], None],
-    ):
-        """予定タスクを更新する"""
+    ) -> bool:
+        """予定タスクを更新する
 
-        try:
-            properties = (
-                ScheduledTaskUpdateProperties(task=scheduled_task)
-                .set_name()
-                .set_status()
-                .set_scheduled_man_hours()
-                .set_executed_man_hours()
-                .set_progress_rate()
-                .build()
-            )
+        :return: 更新に成功した場合True
+        """
 
-            self.client.pages.update(
-                **{"page_id": str(scheduled_task.page_id), "properties": properties}
+        try:
+            # 変更されたプロパティのみ更新する
+            properties = self.build_update_properties(scheduled_task)
+            if not properties:
+                on_success(scheduled_task)
+                return True
+
+            await self._request(
+                lambda: self.client.pages.update(
+                    **{"page_id": str(scheduled_task.page_id), "properties": properties}
+                )
             )
             on_success(scheduled_task)
+            return True
         except Exception as e:
             on_error(e, scheduled_task)
+            return False
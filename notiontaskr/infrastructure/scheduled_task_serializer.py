@@ -0,0 +1,225 @@
+import json
+import zlib
+from datetime import datetime
+from typing import Optional
+
+from notiontaskr.domain.executed_task import ExecutedTask
+from notiontaskr.domain.name_labels.id_label import IdLabel
+from notiontaskr.domain.name_labels.man_hours_label import ManHoursLabel
+from notiontaskr.domain.name_labels.parent_id_label import ParentIdLabel
+from notiontaskr.domain.scheduled_task import ScheduledTask
+from notiontaskr.domain.task_name import TaskName
+from notiontaskr.domain.value_objects.man_hours import ManHours
+from notiontaskr.domain.value_objects.notion_date import NotionDate
+from notiontaskr.domain.value_objects.notion_id import NotionId
+from notiontaskr.domain.value_objects.page_id import PageId
+from notiontaskr.domain.value_objects.progress_rate import ProgressRate
+from notiontaskr.domain.value_objects.status import Status
+
+try:
+    import zstandard  # type: ignore
+except ImportError:  # zstdは任意の依存関係
+    zstandard = None
+
+# ファイル先頭の識別子。これで始まらないファイルは旧形式(pickle)として扱う
+MAGIC = b"NTSC"
+# スキーマのバージョン。レコードの項目を変更したら上げ、読み込み処理を追加する
+SCHEMA_VERSION = 1
+
+COMPRESSION_NONE = 0
+COMPRESSION_ZLIB = 1
+COMPRESSION_ZSTD = 2
+
+
+class ScheduledTaskSerializer:
+    """予定タスクをキャッシュ用のバイト列に変換するクラス
+
+    ドメインクラスをそのままpickleせず、必要な項目のみをスキーマ付きのレコードとして保存する。
+    ドメインクラスをリファクタリングしてもキャッシュが読めなくならないようにするため。
+
+    フォーマット: MAGIC(4byte) + スキーマバージョン(1byte) + 圧縮方式(1byte) + 本体(JSON)
+    サブアイテムはIDで参照し、読み込み側で張り直す。
+    """
+
+    @staticmethod
+    def is_serialized(data: bytes) -> bool:
+        """本クラスで変換したバイト列かを判定する"""
+        return data[: len(MAGIC)] == MAGIC
+
+    @classmethod
+    def serialize(cls, tasks: list[ScheduledTask]) -> bytes:
+        """予定タスクの一覧をバイト列に変換する
+
+        zstandardがインストールされている場合はzstd、それ以外はzlibで圧縮する。
+        """
+        body = json.dumps(
+            [cls._to_scheduled_record(task) for task in tasks],
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+        if zstandard is not None:
+            compression = COMPRESSION_ZSTD
+            body = zstandard.ZstdCompressor().compress(body)
+        else:
+            compression = COMPRESSION_ZLIB
+            body = zlib.compress(body)
+
+        return MAGIC + bytes([SCHEMA_VERSION, compression]) + body
+
+    @classmethod
+    def deserialize(cls, data: bytes) -> list[tuple[ScheduledTask, list[NotionId]]]:
+        """バイト列から予定タスクとサブアイテムのIDの組を復元する
+
+        :raise ValueError: 未対応のフォーマットの場合
+        """
+        if not cls.is_serialized(data):
+            raise ValueError("キャッシュの形式が不正です。")
+        version, compression = data[len(MAGIC)], data[len(MAGIC) + 1]
+        if version != SCHEMA_VERSION:
+            raise ValueError(f"未対応のスキーマバージョンです: {version}")
+
+        body = data[len(MAGIC) + 2 :]
+        if compression == COMPRESSION_ZSTD:
+            if zstandard is None:
+                raise ValueError("zstdの展開にはzstandardのインストールが必要です。")
+            body = zstandard.ZstdDecompressor().decompress(body)
+        elif compression == COMPRESSION_ZLIB:
+            body = zlib.decompress(body)
+        elif compression != COMPRESSION_NONE:
+            raise ValueError(f"未対応の圧縮方式です: {compression}")
+
+        return [
+            (
+                cls._from_scheduled_record(record),
+                [NotionId(number) for number in record["sub_task_ids"]],
+            )
+            for record in json.loads(body)
+        ]
+
+    @classmethod
+    def _to_scheduled_record(cls, task: ScheduledTask) -> dict:
+        return {
+            "page_id": str(task.page_id),
+            "name": cls._to_name_record(task.name),
+            "tags": [str(tag) for tag in task.tags],
+            "id": [task.id.number, task.id.prefix],
+            "status": task.status.value,
+            "parent_task_page_id": cls._to_optional_str(task.parent_task_page_id),
+            "scheduled_man_hours": task.scheduled_man_hours.value,
+            "executed_man_hours": task.executed_man_hours.value,
+            "executed_tasks": [
+                cls._to_executed_record(executed_task)
+                for executed_task in task.executed_tasks
+            ],
+            "sub_task_page_ids": [str(page_id) for page_id in task.sub_task_page_ids],
+            "sub_task_ids": [sub_task.id.number for sub_task in task.sub_tasks],
+            "progress_rate": task.progress_rate.value,
+        }
+
+    @classmethod
+    def _from_scheduled_record(cls, record: dict) -> ScheduledTask:
+        return ScheduledTask(
+            page_id=PageId(record["page_id"]),
+            name=cls._from_name_record(record["name"]),
+            tags=record["tags"],
+            id=NotionId(number=record["id"][0], prefix=record["id"][1]),
+            status=Status.from_str(record["status"]),
+            parent_task_page_id=cls._to_optional_page_id(record["parent_task_page_id"]),
+            scheduled_man_hours=ManHours(record["scheduled_man_hours"]),
+            executed_man_hours=ManHours(record["executed_man_hours"]),
+            executed_tasks=[
+                cls._from_executed_record(executed_record)
+                for executed_record in record["executed_tasks"]
+            ],
+            sub_task_page_ids=[
+                PageId(page_id) for page_id in record["sub_task_page_ids"]
+            ],
+            sub_tasks=[],
+            progress_rate=ProgressRate(record["progress_rate"]),
+        )
+
+    @classmethod
+    def _to_executed_record(cls, task: ExecutedTask) -> dict:
+        return {
+            "page_id": str(task.page_id),
+            "name": cls._to_name_record(task.name),
+            "tags": [str(tag) for tag in task.tags],
+            "id": [task.id.number, task.id.prefix],
+            "status": task.status.value,
+            "parent_task_page_id": cls._to_optional_str(task.parent_task_page_id),
+            "date": (
+                [task.date.start.isoformat(), task.date.end.isoformat()]
+                if task.date
+                else None
+            ),
+            "man_hours": task.man_hours.value,
+            "scheduled_task_id": (
+                task.scheduled_task_id.number if task.scheduled_task_id else None
+            ),
+            "scheduled_task_page_id": cls._to_optional_str(task.scheduled_task_page_id),
+        }
+
+    @classmethod
+    def _from_executed_record(cls, record: dict) -> ExecutedTask:
+        return ExecutedTask(
+            page_id=PageId(record["page_id"]),
+            name=cls._from_name_record(record["name"]),
+            tags=record["tags"],
+            id=NotionId(number=record["id"][0], prefix=record["id"][1]),
+            status=Status.from_str(record["status"]),
+            parent_task_page_id=cls._to_optional_page_id(record["parent_task_page_id"]),
+            date=(
+                NotionDate(
+                    start=datetime.fromisoformat(record["date"][0]),
+                    end=datetime.fromisoformat(record["date"][1]),
+                )
+                if record["date"]
+                else None
+            ),
+            man_hours=ManHours(record["man_hours"]),
+            scheduled_task_id=(
+                NotionId(record["scheduled_task_id"])
+                if record["scheduled_task_id"]
+                else None
+            ),
+            scheduled_task_page_id=cls._to_optional_page_id(
+                record["scheduled_task_page_id"]
+            ),
+        )
+
+    @staticmethod
+    def _to_name_record(name: TaskName) -> dict:
+        def to_label_record(label) -> Optional[list[str]]:
+            return [label.key, label.value] if label else None
+
+        return {
+            "task_name": name.task_name,
+            "id_label": to_label_record(name.id_label),
+            "man_hours_label": to_label_record(name.man_hours_label),
+            "parent_id_label": to_label_record(name.parent_id_label),
+        }
+
+    @staticmethod
+    def _from_name_record(record: dict) -> TaskName:
+        id_label = record["id_label"]
+        man_hours_label = record["man_hours_label"]
+        parent_id_label = record["parent_id_label"]
+        return TaskName(
+            task_name=record["task_name"],
+            id_label=IdLabel(*id_label) if id_label else None,
+            man_hours_label=(
+                ManHoursLabel(*man_hours_label) if man_hours_label else None
+            ),
+            parent_id_label=(
+                ParentIdLabel(*parent_id_label) if parent_id_label else None
+            ),
+        )
+
+    @staticmethod
+    def _to_optional_str(value) -> Optional[str]:
+        return str(value) if value else None
+
+    @staticmethod
+    def _to_optional_page_id(value: Optional[str]) -> Optional[PageId]:
+        return PageId(value) if value else None
@@ -1,4 +1,7 @@
+from typing import Callable
+
 from notiontaskr.domain.scheduled_task import ScheduledTask
+from notiontaskr.domain.task_field import TaskField
 from notiontaskr.infrastructure.task_update_properties import TaskUpdateProperties
 
 
@@ -9,6 +12,14 @@ class ScheduledTaskUpdateProperties(TaskUpdateProperties):
         super().__init__(task)
         self.task = task
 
+    def _get_setters_by_field(self) -> dict[TaskField, Callable[[], object]]:
+        return {
+            **super()._get_setters_by_field(),
+            TaskField.SCHEDULED_MAN_HOURS: self.set_scheduled_man_hours,
+            TaskField.EXECUTED_MAN_HOURS: self.set_executed_man_hours,
+            TaskField.PROGRESS_RATE: self.set_progress_rate,
+        }
+
     def set_executed_man_hours(self):
         """実際の人日数の更新"""
         self.properties["人時(実)"] = {"number": self.task.executed_man_hours.value}
@@ -0,0 +1,48 @@
+import json
+import os
+from datetime import datetime
+
+from notiontaskr.domain.sync_cursor import SyncCursor
+
+
+class SyncCursorCache:
+    """レギュラータスクの処理済みの最終更新日時のキャッシュ
+
+    日時のみのため、JSONで保存する。
+    """
+
+    def __init__(self, save_path: str):
+        self.save_path = save_path
+
+    def save(self, cursor: SyncCursor) -> None:
+        """カーソルをファイルに保存する"""
+        os.makedirs(os.path.dirname(self.save_path), exist_ok=True)
+        with open(self.save_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "last_edited_time": cursor.last_edited_time.isoformat(),
+                    "processed_pages": {
+                        page_id: edited_time.isoformat()
+                        for page_id, edited_time in cursor.processed_pages.items()
+                    },
+                },
+                f,
+                separators=(",", ":"),
+            )
+
+    def load(self) -> SyncCursor:
+        """ファイルからカーソルを読み込む
+
+        :raise FileNotFoundError: ファイルが存在しない場合
+        """
+        if not os.path.exists(self.save_path):
+            raise FileNotFoundError(f"Cache file not found: {self.save_path}")
+        with open(self.save_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return SyncCursor(
+            last_edited_time=datetime.fromisoformat(data["last_edited_time"]),
+            processed_pages={
+                page_id: datetime.fromisoformat(edited_time)
+                for page_id, edited_time in data["processed_pages"].items()
+            },
+        )
@@ -0,0 +1,27 @@
+from notiontaskr.domain.executed_task import ExecutedTask
+from notiontaskr.domain.scheduled_task import ScheduledTask
+from notiontaskr.domain.task import Task
+from notiontaskr.infrastructure.notion_repository import NotionRepository
+
+
+class TaskRepository(NotionRepository[Task]):
+    """予定タスクと実績タスクをまとめて取得するリポジトリ
+
+    予定フラグで絞り込まずに1回の問い合わせで取得し、予定フラグに応じて
+    ScheduledTaskまたはExecutedTaskに変換する。
+    更新は予定タスク・実績タスクそれぞれのリポジトリで行う。
+    """
+
+    is_scheduled = None
+    # 予定フラグで変換先を判定するため、予定フラグも取得する
+    property_names = tuple(
+        dict.fromkeys(
+            ("予定フラグ",) + ScheduledTask.PROPERTY_NAMES + ExecutedTask.PROPERTY_NAMES
+        )
+    )
+
+    @staticmethod
+    def _to_task(data: dict) -> Task:
+        if data["properties"]["予定フラグ"]["checkbox"]:
+            return ScheduledTask.from_response_data(data)
+        return ExecutedTask.from_response_data(data)
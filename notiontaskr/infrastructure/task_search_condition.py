@@ -1,5 +1,8 @@
+from datetime import datetime
+
 from notiontaskr.domain.value_objects.status import Status
 from notiontaskr.infrastructure.operator import *
+from notiontaskr.util.converter import to_isoformat
 
 
 class TaskSearchCondition:
@@ -8,6 +11,42 @@ class TaskSearchCondition:
     def __init__(self):
         self.conditions = {}
 
+    @classmethod
+    def split_last_edited_time(
+        cls, from_: datetime, to: datetime, partition_count: int
+    ) -> list["TaskSearchCondition"]:
+        """最終更新日時の期間を重ならない複数の期間に分割したフィルターを生成する
+
+        最後の期間は終わりを指定しない(取得中に更新されたページも含めるため)。
+
+        :param from_: 期間の開始日時(UTC)
+        :param to: 分割幅の計算に使う期間の終了日時(UTC)
+        :param partition_count: 分割数
+        """
+        if partition_count < 1:
+            raise ValueError("partition_count must be 1 or more")
+        width = (to - from_) / partition_count
+        starts = [from_ + width * i for i in range(partition_count)]
+
+        conditions = []
+        for i, start in enumerate(starts):
+            on_or_after = cls().where_last_edited_time(
+                operator=DateOperator.ON_OR_AFTER, date=to_isoformat(start)
+            )
+            if i == partition_count - 1:
+                conditions.append(on_or_after)
+                continue
+            conditions.append(
+                cls().and_(
+                    on_or_after,
+                    cls().where_last_edited_time(
+                        operator=DateOperator.BEFORE,
+                        date=to_isoformat(starts[i + 1]),
+                    ),
+                )
+            )
+        return conditions
+
     def build(self):
         """最終的な条件を返す"""
         return self.conditions
@@ -30,6 +69,19 @@ class TaskSearchCondition:
         self.conditions = {"property": "タグ", "multi_select": {operator.value: tag}}
         return self
 
+    def where_any_tag(self, tags: list[str]):
+        """いずれかのタグを含むページのフィルターを生成する"""
+        if not tags:
+            raise ValueError("tags is empty")
+        return self.or_(
+            *[
+                TaskSearchCondition().where_tag(
+                    operator=MultiSelectOperator.CONTAINS, tag=tag
+                )
+                for tag in tags
+            ]
+        )
+
     def where_status(
         self,
         operator: StatusOperator,
@@ -1,6 +1,8 @@
 from abc import ABC
+from typing import Callable
 
 from notiontaskr.domain.task import Task
+from notiontaskr.domain.task_field import TaskField
 
 
 class TaskUpdateProperties(ABC):
@@ -40,6 +42,21 @@ class TaskUpdateProperties(ABC):
         self.properties["Price"] = {"number": price}
         return self
 
+    def _get_setters_by_field(self) -> dict[TaskField, Callable[[], object]]:
+        """変更された項目と、対応するプロパティを設定するメソッドの対応"""
+        return {
+            TaskField.NAME: self.set_name,
+            TaskField.STATUS: self.set_status,
+        }
+
+    def set_updated_fields(self):
+        """タスクで変更された項目のプロパティのみを設定する"""
+        updated_fields = getattr(self.task, "updated_fields", set())
+        for field, setter in self._get_setters_by_field().items():
+            if field in updated_fields:
+                setter()
+        return self
+
     def build(self):
         """更新用の最終プロパティを返す"""
         return self.properties if self.properties else {}
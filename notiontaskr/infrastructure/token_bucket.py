@@ -0,0 +1,65 @@
+import asyncio
+import time
+from typing import Awaitable, Callable
+
+# 浮動小数点の誤差でトークンが1に届かず待機し続けることを防ぐための許容誤差
+_EPSILON = 1e-9
+
+
+class TokenBucket:
+    """トークンバケット方式でリクエストの流量を制限するクラス
+
+    1秒あたり`rate`個のトークンが補充され、最大`capacity`個まで貯められる。
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ):
+        if rate <= 0:
+            raise ValueError(f"rate`{rate}`は正の数でなければなりません。")
+        if capacity < 1:
+            raise ValueError(f"capacity`{capacity}`は1以上でなければなりません。")
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(capacity)
+        self._updated_at = clock()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """トークンを1つ取得する。トークンがない場合は補充されるまで待機する"""
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= 1 - _EPSILON:
+                    self._tokens = max(0.0, self._tokens - 1)
+                    return
+                await self._sleep(self._get_wait_time())
+
+    def pause(self, seconds: float) -> None:
+        """指定秒数の間、トークンの補充を停止する
+
+        429(Retry-After)を受け取った際に、他のリクエストも含めて送信を止めるために使用する。
+        """
+        self._tokens = 0.0
+        self._updated_at = max(self._updated_at, self._clock() + seconds)
+
+    def _refill(self) -> None:
+        """経過時間に応じてトークンを補充する"""
+        now = self._clock()
+        if now <= self._updated_at:
+            return
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+
+    def _get_wait_time(self) -> float:
+        """次のトークンが補充されるまでの秒数を返す"""
+        paused_seconds = max(0.0, self._updated_at - self._clock())
+        return paused_seconds + (1 - self._tokens) / self.rate
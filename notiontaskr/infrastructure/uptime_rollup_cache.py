@@ -0,0 +1,57 @@
+import json
+import os
+from datetime import date
+
+from notiontaskr.domain.uptime_rollup import UptimeRollup
+
+
+class UptimeRollupCache:
+    """タグ・日ごとの実績工数の集計のキャッシュ
+
+    数値と日付のみのため、JSONで保存する。
+    """
+
+    def __init__(self, save_path: str):
+        self.save_path = save_path
+
+    def save(self, rollup: UptimeRollup) -> None:
+        """集計をファイルに保存する"""
+        os.makedirs(os.path.dirname(self.save_path), exist_ok=True)
+        with open(self.save_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "covered_from": rollup.covered_from.isoformat(),
+                    "closed_until": rollup.closed_until.isoformat(),
+                    "man_hours_by_tag_day": {
+                        tag: {
+                            day.isoformat(): man_hours
+                            for day, man_hours in man_hours_by_day.items()
+                        }
+                        for tag, man_hours_by_day in rollup.man_hours_by_tag_day.items()
+                    },
+                },
+                f,
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+
+    def load(self) -> UptimeRollup:
+        """ファイルから集計を読み込む
+
+        :raise FileNotFoundError: ファイルが存在しない場合
+        """
+        if not os.path.exists(self.save_path):
+            raise FileNotFoundError(f"Cache file not found: {self.save_path}")
+        with open(self.save_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return UptimeRollup(
+            covered_from=date.fromisoformat(data["covered_from"]),
+            closed_until=date.fromisoformat(data["closed_until"]),
+            man_hours_by_tag_day={
+                tag: {
+                    date.fromisoformat(day): man_hours
+                    for day, man_hours in man_hours_by_day.items()
+                }
+                for tag, man_hours_by_day in data["man_hours_by_tag_day"].items()
+            },
+        )
@@ -2,11 +2,14 @@ import asyncio
 from notiontaskr.application.task_application_service import TaskApplicationService
 
 
+async def _run():
+    async with TaskApplicationService() as service:
+        await service.regular_task()
+
+
 def main():
     """一分ごとに実行する処理"""
-    service = TaskApplicationService()
-
-    asyncio.run(service.regular_task())
+    asyncio.run(_run())
 
 
 if __name__ == "__main__":
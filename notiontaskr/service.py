@@ -1,16 +1,42 @@
 import asyncio
+import threading
 from datetime import datetime
+from typing import Any, Coroutine, TypeVar
 from flask import Flask, render_template, request
 
+import notiontaskr.config as config
+from notiontaskr.application.page_change_worker import PageChangeWorker
 from notiontaskr.application.task_application_service import TaskApplicationService
 
-from notiontaskr.util.converter import dt_to_month_start_end
+from notiontaskr.domain.uptime_series import UptimeBucket
+from notiontaskr.util.converter import date_str_to_start_end, dt_to_month_start_end
+from notiontaskr.util.validator import is_valid_signature
+
+T = TypeVar("T")
+
+# Notionクライアントのコネクションプールと流量制御はイベントループに紐づくため、
+# ワーカープロセスごとに1つのイベントループを専用スレッドで動かし、全リクエストで共有する
+_loop = asyncio.new_event_loop()
+threading.Thread(target=_loop.run_forever, daemon=True).start()
 
 service = TaskApplicationService()
 
+# Webhookで通知されたページは、共有イベントループ上のワーカーがまとめて同期する
+page_change_worker = PageChangeWorker(
+    sync=service.sync_pages,
+    batch_seconds=config.WEBHOOK_BATCH_SECONDS,
+    logger=service.logger,
+)
+asyncio.run_coroutine_threadsafe(page_change_worker.run(), _loop)
+
 app = Flask(__name__)
 
 
+def _run(coro: Coroutine[Any, Any, T]) -> T:
+    """共有イベントループ上でコルーチンを実行し、結果を待つ"""
+    return asyncio.run_coroutine_threadsafe(coro, _loop).result()
+
+
 @app.route("/")
 def index():
     return render_template("index.html")
@@ -20,11 +46,37 @@ def index():
 def update_executed_task_id():
     """dayly_taskを実行するエンドポイント"""
 
-    asyncio.run(service.daily_task())
+    _run(service.daily_task())
 
     return "dayly task executed successfully!"
 
 
+@app.route("/notion-webhook", methods=["POST"])
+def receive_notion_webhook():
+    """NotionのWebhookを受け取るエンドポイント
+
+    変更されたページIDをワーカーに渡してすぐに応答し、同期はワーカーで行う。
+    """
+    event = request.get_json(silent=True) or {}
+
+    token = config.NOTION_WEBHOOK_VERIFICATION_TOKEN
+    # 購読作成時の検証リクエスト。通知されたトークンを環境変数に設定する
+    # (署名できないため、トークンを設定するまでのみ受け付ける)
+    if not token and "verification_token" in event:
+        service.logger.info(f"Webhookの検証トークン: {event['verification_token']}")
+        return "", 200
+
+    signature = request.headers.get("X-Notion-Signature", "")
+    if not token or not is_valid_signature(request.get_data(), signature, token):
+        return "Invalid signature", 401
+
+    page_id = PageChangeWorker.parse_page_id(event)
+    if page_id is not None:
+        _loop.call_soon_threadsafe(page_change_worker.notify, page_id)
+
+    return "", 200
+
+
 @app.route("/uptime_from_start_end", methods=["GET"])
 def get_uptime_from_start_end():
     """uptimeを取得するエンドポイント
@@ -45,7 +97,7 @@ def get_uptime_from_start_end():
     end_dt = datetime(year=int(end_year), month=int(end_month), day=1)
     _, end_of_month = dt_to_month_start_end(end_dt)
 
-    uptime_data_by_tag = asyncio.run(
+    uptime_data_by_tag = _run(
         service.get_uptime(from_=start_of_month, to=end_of_month, tags=tags)
     )
 
@@ -70,7 +122,7 @@ def get_uptime_from_month():
     dt = datetime(year=int(year), month=int(month), day=1)
     start, end = dt_to_month_start_end(dt)
 
-    uptime_data_by_tag = asyncio.run(
+    uptime_data_by_tag = _run(
         service.get_uptime(
             from_=start,
             to=end,
@@ -82,5 +134,33 @@ def get_uptime_from_month():
     return uptime_data_by_tag.to_json(), 200
 
 
+@app.route("/uptime_series", methods=["GET"])
+def get_uptime_series():
+    """uptimeを区間ごとの時系列で取得するエンドポイント
+
+    タグ配列、開始日、終了日(YYYY-MM-DD)、区間の単位(month/week、省略時はmonth)をクエリパラメータとして受け取る
+    例: https://example.com/uptime_series?tags=tag1&from=2025-01-01&to=2025-12-31&bucket=month
+    """
+    tags = request.args.getlist("tags")
+    from_ = request.args.get("from")
+    to = request.args.get("to")
+
+    if not tags or not from_ or not to:
+        return "Invalid parameters", 400
+
+    try:
+        start, end = date_str_to_start_end(from_, to)
+        bucket = UptimeBucket.from_str(request.args.get("bucket", "month"))
+    except ValueError:
+        return "Invalid parameters", 400
+
+    uptime_series_by_tag = _run(
+        service.get_uptime_series(from_=start, to=end, tags=tags, bucket=bucket)
+    )
+
+    # レスポンスをJSON形式で返す
+    return uptime_series_by_tag.to_json(), 200
+
+
 if __name__ == "__main__":
     app.run(host="0.0.0.0", port=5000, debug=True)
@@ -0,0 +1,32 @@
+import asyncio
+import signal
+
+import notiontaskr.config as config
+from notiontaskr.application.task_application_service import TaskApplicationService
+
+
+async def _run():
+    async with TaskApplicationService() as service:
+        daemon = asyncio.ensure_future(
+            service.run_sync_daemon(
+                interval=config.SYNC_DAEMON_INTERVAL_SECONDS,
+                checkpoint_interval=config.SYNC_DAEMON_CHECKPOINT_SECONDS,
+            )
+        )
+        # 停止シグナルを受けたら、チェックポイントを保存してから終了する
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, daemon.cancel)
+        try:
+            await daemon
+        except asyncio.CancelledError:
+            pass
+
+
+def main():
+    """常駐してレギュラータスクを一定間隔で実行する"""
+    asyncio.run(_run())
+
+
+if __name__ == "__main__":
+    main()
@@ -23,11 +23,15 @@ def truncate_decimal(num: float) -> str:
     return str(result_str)
 
 
+# 絵文字のバリアントセレクタ(U+FE00〜U+FE0F)を削除する変換表
+VARIANT_SELECTORS_TABLE = dict.fromkeys(range(0xFE00, 0xFE10))
+
+
 def remove_variant_selectors(text: str) -> str:
     """絵文字のバリアントセレクタを削除する
     例: ⏲️ -> ⏲
     """
-    return "".join(c for c in text if not (0xFE00 <= ord(c) <= 0xFE0F))
+    return text.translate(VARIANT_SELECTORS_TABLE)
 
 
 def dt_to_month_start_end(dt: datetime) -> tuple[datetime, datetime]:
@@ -42,3 +46,13 @@ def dt_to_month_start_end(dt: datetime) -> tuple[datetime, datetime]:
 
     end_date = next_month - timedelta(minutes=1)
     return start_date, end_date
+
+
+def date_str_to_start_end(from_: str, to: str) -> tuple[datetime, datetime]:
+    """YYYY-MM-DD形式の開始日と終了日を、開始日の0時0分と終了日の23:59に変換する
+
+    :raise ValueError: 形式が不正な場合
+    """
+    start_date = datetime.strptime(from_, "%Y-%m-%d")
+    end_date = datetime.strptime(to, "%Y-%m-%d") + timedelta(days=1, minutes=-1)
+    return start_date, end_date
@@ -1,3 +1,6 @@
+import hashlib
+import hmac
+
 import emoji
 
 
@@ -11,3 +14,10 @@ def is_emoji_matches(emoji1: str, emoji2: str) -> bool:
     """絵文字が一致するかを判定する関数"""
 
     return emoji.demojize(emoji1) == emoji.demojize(emoji2)
+
+
+def is_valid_signature(body: bytes, signature: str, secret: str) -> bool:
+    """Webhookの署名(`sha256=<HMAC-SHA256>`)がリクエストボディと一致するかを判定する関数"""
+
+    expected = "sha256=" + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature)
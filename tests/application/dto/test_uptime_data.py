@@ -1,6 +1,10 @@
 from datetime import datetime
 import json
-from notiontaskr.application.dto.uptime_data import UptimeData, UptimeDataByTag
+from notiontaskr.application.dto.uptime_data import (
+    UptimeData,
+    UptimeDataByTag,
+    UptimeSeriesByTag,
+)
 import pytest
 
 
@@ -122,3 +126,36 @@ class TestUptimeData:
         )
 
         assert uptime_data_by_tag.to_json() == expected_json
+
+
+class TestUptimeSeriesByTag:
+    def test_タグごとの時系列をJSON形式で出力できること(self):
+        uptime_series_by_tag = UptimeSeriesByTag.from_empty()
+        uptime_series_by_tag.insert_series(
+            tag="tag1",
+            series=[
+                UptimeData(
+                    tag="tag1",
+                    uptime=1.5,
+                    from_=datetime(2025, 1, 1),
+                    to=datetime(2025, 1, 31),
+                ),
+                UptimeData(
+                    tag="tag1",
+                    uptime=0.0,
+                    from_=datetime(2025, 2, 1),
+                    to=datetime(2025, 2, 28),
+                ),
+            ],
+        )
+
+        assert json.loads(uptime_series_by_tag.to_json()) == {
+            "tag1": [
+                {"合計工数": "1.5h", "対象期間": "2025/01/01 - 2025/01/31"},
+                {"合計工数": "0.0h", "対象期間": "2025/02/01 - 2025/02/28"},
+            ]
+        }
+
+    def test_存在しないタグを指定した場合エラーが発生すること(self):
+        with pytest.raises(ValueError):
+            UptimeSeriesByTag.from_empty().get_series("tag1")
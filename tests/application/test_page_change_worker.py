@@ -0,0 +1,60 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+from notiontaskr.application.page_change_worker import PageChangeWorker
+from notiontaskr.domain.value_objects.page_id import PageId
+
+
+class TestPageChangeWorker:
+    class Test_parse_page_id:
+        def test_ページのプロパティ更新イベントからページIDを取得すること(self):
+            event = {
+                "type": "page.properties_updated",
+                "entity": {"id": "page1", "type": "page"},
+            }
+
+            assert PageChangeWorker.parse_page_id(event) == PageId("page1")
+
+        def test_削除イベントとページ以外のイベントは対象外とすること(self):
+            deleted_event = {
+                "type": "page.deleted",
+                "entity": {"id": "page1", "type": "page"},
+            }
+            database_event = {
+                "type": "database.schema_updated",
+                "entity": {"id": "db1", "type": "database"},
+            }
+
+            assert PageChangeWorker.parse_page_id(deleted_event) is None
+            assert PageChangeWorker.parse_page_id(database_event) is None
+
+    class Test_run_once:
+        def test_待ち時間中の通知を重複を除いてまとめて同期すること(self):
+            sync = AsyncMock()
+            worker = PageChangeWorker(sync=sync, batch_seconds=0, logger=Mock())
+
+            async def run():
+                worker.notify(PageId("page1"))
+                worker.notify(PageId("page2"))
+                worker.notify(PageId("page1"))
+                await worker.run_once()
+
+            asyncio.run(run())
+
+            sync.assert_awaited_once_with([PageId("page1"), PageId("page2")])
+
+        def test_同期に失敗してもエラーを記録して続行すること(self):
+            logger = Mock()
+            worker = PageChangeWorker(
+                sync=AsyncMock(side_effect=Exception("error")),
+                batch_seconds=0,
+                logger=logger,
+            )
+
+            async def run():
+                worker.notify(PageId("page1"))
+                await worker.run_once()
+
+            asyncio.run(run())
+
+            logger.error.assert_called_once()
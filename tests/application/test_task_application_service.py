@@ -1,7 +1,25 @@
 # 動作確認用
 import asyncio
-from datetime import datetime
+import os
+from datetime import date, datetime, timedelta
+from unittest.mock import ANY, AsyncMock, Mock, patch
+
+import notiontaskr.config as config
+
+from notiontaskr.application.dto.uptime_data import UptimeDataByTag
 from notiontaskr.application.task_application_service import TaskApplicationService
+from notiontaskr.domain.executed_task import ExecutedTask
+from notiontaskr.domain.scheduled_task import ScheduledTask
+from notiontaskr.domain.sync_cursor import SyncCursor
+from notiontaskr.domain.uptime_rollup import UptimeRollup
+from notiontaskr.domain.uptime_series import UptimeBucket
+from notiontaskr.domain.value_objects.man_hours import ManHours
+from notiontaskr.domain.value_objects.notion_date import NotionDate
+from notiontaskr.domain.value_objects.page_id import PageId
+from notiontaskr.infrastructure.notion_request_dispatcher import BatchResult
+from notiontaskr.gcs_handler import GenerationMismatchError
+from notiontaskr.infrastructure.page_update_queue import PageUpdateQueue
+from notiontaskr.infrastructure.scheduled_task_cache import ScheduledTaskCache
 
 from notiontaskr.util.converter import dt_to_month_start_end
 
@@ -29,5 +47,830 @@ def _get_uptime():
     print(uptime_data_by_tag.to_json())
 
 
+class TestTaskApplicationService:
+    class Test__update_scheduled_tasks:
+        def test_更新されたタスクのみ更新し成功件数と失敗件数を返すこと(self):
+            logger = Mock()
+            app_service = TaskApplicationService(logger=logger)
+            app_service.scheduled_task_repo = Mock(
+                update=AsyncMock(side_effect=[True, False])
+            )
+            tasks = [
+                Mock(is_updated=True),
+                Mock(is_updated=False),
+                Mock(is_updated=True),
+            ]
+
+            result = asyncio.run(app_service._update_scheduled_tasks(tasks))  # type: ignore
+
+            assert result == BatchResult(success_count=1, failure_count=1)
+            assert app_service.scheduled_task_repo.update.await_count == 2
+            logger.info.assert_called_with("予定タスクの更新結果: 成功1件, 失敗1件")
+
+    class Test__update_executed_tasks:
+        def test_更新されたタスクのみ更新し成功件数と失敗件数を返すこと(self):
+            logger = Mock()
+            app_service = TaskApplicationService(logger=logger)
+            app_service.executed_task_repo = Mock(
+                update=AsyncMock(side_effect=[True, True])
+            )
+            tasks = [Mock(is_updated=True), Mock(is_updated=True)]
+
+            result = asyncio.run(app_service._update_executed_tasks(tasks))  # type: ignore
+
+            assert result == BatchResult(success_count=2, failure_count=0)
+            logger.info.assert_called_with("実績タスクの更新結果: 成功2件, 失敗0件")
+
+    class Test_daily_task:
+        def test_予定タスクより先に取得した実績タスクも名前で照合して紐づけること(
+            self, page_data
+        ):
+            scheduled_task = ScheduledTask.from_response_data(
+                page_data(1, is_scheduled=True, name="タスク1")
+            )
+            executed_task = ExecutedTask.from_response_data(
+                page_data(2, is_scheduled=False, name="タスク1")
+            )
+
+            async def iter_tasks(**kwargs):
+                yield executed_task
+                yield scheduled_task
+
+            app_service = TaskApplicationService(logger=Mock())
+            app_service.task_repo = Mock(iter_all_by_partitioned_conditions=iter_tasks)
+            app_service._load_page_update_queue = Mock()
+            app_service._flush_page_updates = AsyncMock()
+            app_service._list_delta_paths = Mock(return_value=[])
+            app_service._save_uptime_rollup = Mock()
+            app_service._save_pickle = AsyncMock(return_value=False)
+            app_service._update_scheduled_tasks = AsyncMock()
+            app_service._update_executed_tasks = AsyncMock()
+
+            with patch("notiontaskr.application.task_application_service.GCSHandler"):
+                asyncio.run(app_service.daily_task())
+
+            assert scheduled_task.executed_tasks == [executed_task]
+            assert executed_task.scheduled_task_id == scheduled_task.id
+            app_service._update_executed_tasks.assert_awaited_once_with([executed_task])
+
+        def test_書き込み中にキャッシュされた実績タスクの日を含む稼働実績を破棄すること(
+            self, page_data
+        ):
+            scheduled_task = ScheduledTask.from_response_data(
+                page_data(1, is_scheduled=True, name="タスク1")
+            )
+            executed_task = ExecutedTask.from_response_data(
+                page_data(2, is_scheduled=False, name="タスク1")
+            )
+
+            async def iter_tasks(**kwargs):
+                yield scheduled_task
+                yield executed_task
+
+            app_service = TaskApplicationService(logger=Mock())
+
+            async def update_executed_tasks(tasks):
+                # 書き込み中の問い合わせで、書き込み前の実績がキャッシュされる
+                app_service.uptime_cache.set(
+                    ["タグ1"],
+                    datetime(2025, 5, 1),
+                    datetime(2025, 5, 31),
+                    UptimeDataByTag.from_empty(),
+                )
+
+            app_service.task_repo = Mock(iter_all_by_partitioned_conditions=iter_tasks)
+            app_service._load_page_update_queue = Mock()
+            app_service._flush_page_updates = AsyncMock()
+            app_service._list_delta_paths = Mock(return_value=[])
+            app_service._save_uptime_rollup = Mock()
+            app_service._save_pickle = AsyncMock(return_value=False)
+            app_service._update_scheduled_tasks = AsyncMock()
+            app_service._update_executed_tasks = update_executed_tasks
+
+            with patch("notiontaskr.application.task_application_service.GCSHandler"):
+                asyncio.run(app_service.daily_task())
+
+            assert executed_task.is_updated
+            assert len(app_service.uptime_cache) == 0
+
+    class Test_regular_task:
+        def test_取得したタスクがない場合も待ち時間を過ぎた更新を書き込むこと(self):
+            app_service = TaskApplicationService(logger=Mock())
+            app_service.task_repo = Mock(
+                find_all_by_condition=AsyncMock(return_value=[])
+            )
+            app_service._load_sync_cursor = Mock(return_value=None)
+            app_service._load_page_update_queue = Mock()
+            app_service._flush_page_updates = AsyncMock()
+
+            with patch("notiontaskr.application.task_application_service.GCSHandler"):
+                asyncio.run(app_service.regular_task())
+
+            app_service._flush_page_updates.assert_awaited_once_with(
+                gcs_handler=ANY, delay=config.PAGE_UPDATE_FLUSH_DELAY_SECONDS
+            )
+
+        def test_カーソルから取得し処理済みのページを除いてカーソルを進めること(
+            self, page_data
+        ):
+            processed_task = ScheduledTask.from_response_data(
+                page_data(
+                    1, is_scheduled=True, last_edited_time="2025-05-01T12:05:00.000Z"
+                )
+            )
+            new_task = ScheduledTask.from_response_data(
+                page_data(
+                    2, is_scheduled=True, last_edited_time="2025-05-01T12:06:00.000Z"
+                )
+            )
+            cursor = SyncCursor.from_tasks(
+                [processed_task],
+                overlap=timedelta(seconds=config.REGULAR_TASK_OVERLAP_SECONDS),
+            )
+            app_service = TaskApplicationService(logger=Mock())
+            app_service.task_repo = Mock(
+                find_all_by_condition=AsyncMock(return_value=[processed_task, new_task])
+            )
+            app_service._load_sync_cursor = Mock(return_value=cursor)
+            app_service._save_sync_cursor = Mock()
+            app_service._apply_fetched_tasks = AsyncMock(return_value=True)
+            app_service._load_page_update_queue = Mock()
+            app_service._flush_page_updates = AsyncMock()
+
+            with patch("notiontaskr.application.task_application_service.GCSHandler"):
+                asyncio.run(app_service.regular_task())
+
+            condition = app_service.task_repo.find_all_by_condition.await_args.kwargs[
+                "condition"
+            ]
+            assert condition.build()["and"][0] == {
+                "property": "最終更新日時",
+                "last_edited_time": {"on_or_after": "2025-05-01T12:03:00.000Z"},
+            }
+            app_service._apply_fetched_tasks.assert_awaited_once_with(
+                fetched_tasks=[new_task], gcs_handler=ANY
+            )
+            saved_cursor = app_service._save_sync_cursor.call_args.kwargs["cursor"]
+            assert saved_cursor.last_edited_time == new_task.last_edited_time
+
+        def test_処理に失敗した場合はカーソルを進めないこと(self, page_data):
+            app_service = TaskApplicationService(logger=Mock())
+            app_service.task_repo = Mock(
+                find_all_by_condition=AsyncMock(
+                    return_value=[
+                        ScheduledTask.from_response_data(
+                            page_data(1, is_scheduled=True)
+                        )
+                    ]
+                )
+            )
+            app_service._load_sync_cursor = Mock(return_value=None)
+            app_service._save_sync_cursor = Mock()
+            app_service._apply_fetched_tasks = AsyncMock(return_value=False)
+            app_service._load_page_update_queue = Mock()
+            app_service._flush_page_updates = AsyncMock()
+
+            with patch("notiontaskr.application.task_application_service.GCSHandler"):
+                asyncio.run(app_service.regular_task())
+
+            app_service._save_sync_cursor.assert_not_called()
+
+        def test_予定タスクの差分を保存できなかった場合はカーソルを進めないこと(
+            self, page_data, tmp_path
+        ):
+            scheduled_task = ScheduledTask.from_response_data(
+                page_data(1, is_scheduled=True)
+            )
+            executed_task = ExecutedTask.from_response_data(
+                page_data(2, is_scheduled=False, name="[1]")
+            )
+            app_service = TaskApplicationService(logger=Mock())
+            app_service.scheduled_task_cache = ScheduledTaskCache(
+                save_path=os.path.join(tmp_path, "scheduled_task.pkl"),
+                delta_dir=str(tmp_path),
+            )
+            app_service.page_update_queue = PageUpdateQueue(
+                save_path=os.path.join(tmp_path, "queue.json")
+            )
+            app_service.task_repo = Mock(
+                find_all_by_condition=AsyncMock(return_value=[executed_task])
+            )
+            app_service._load_sync_cursor = Mock(return_value=None)
+            app_service._save_sync_cursor = Mock()
+            app_service._load_pickle = AsyncMock(return_value=[scheduled_task])
+            app_service._load_page_update_queue = Mock()
+            app_service._flush_page_updates = AsyncMock()
+
+            with patch(
+                "notiontaskr.application.task_application_service.GCSHandler"
+            ) as gcs_handler_class:
+                gcs_handler_class.return_value.upload.side_effect = Exception("error")
+                asyncio.run(app_service.regular_task())
+
+            gcs_handler_class.return_value.upload.assert_called_once()
+            app_service._save_sync_cursor.assert_not_called()
+
+    class Test_run_sync_daemon:
+        def test_指定回数同期し終了時にチェックポイントを保存すること(self):
+            app_service = TaskApplicationService(logger=Mock())
+            app_service._load_page_update_queue = Mock()
+            app_service._sync_edited_tasks = AsyncMock(
+                side_effect=[Exception("error"), None]
+            )
+            app_service._flush_page_updates = AsyncMock()
+            app_service._checkpoint = AsyncMock()
+
+            with patch("notiontaskr.application.task_application_service.GCSHandler"):
+                asyncio.run(
+                    app_service.run_sync_daemon(
+                        interval=0, checkpoint_interval=3600, max_ticks=2
+                    )
+                )
+
+            # 失敗した回も書き込み待ちの更新は書き込み、次の回も続行する
+            assert app_service.keep_warm is True
+            assert app_service._sync_edited_tasks.await_count == 2
+            assert app_service._flush_page_updates.await_count == 2
+            app_service._checkpoint.assert_awaited_once()
+
+        def test_変更のない次の回では同じ更新を積み直さないこと(
+            self, page_data, tmp_path
+        ):
+            scheduled_task = ScheduledTask.from_response_data(
+                page_data(1, is_scheduled=True)
+            )
+            executed_task = ExecutedTask.from_response_data(
+                page_data(2, is_scheduled=False, name="[1]")
+            )
+            app_service = TaskApplicationService(logger=Mock())
+            app_service.page_update_queue = PageUpdateQueue(
+                save_path=os.path.join(tmp_path, "queue.json")
+            )
+            app_service._load_page_update_queue = Mock()
+            app_service._load_sync_cursor = Mock(return_value=None)
+            app_service._save_sync_cursor = Mock()
+            app_service._load_pickle = AsyncMock(return_value=[scheduled_task])
+            app_service._is_remote_cache_updated = Mock(return_value=False)
+            app_service._checkpoint = AsyncMock()
+            # 2回目は1回目に処理したタスクを変更なしで再取得する
+            app_service.task_repo = Mock(
+                find_all_by_condition=AsyncMock(return_value=[executed_task])
+            )
+            queue_sizes = []
+
+            async def flush_page_updates(gcs_handler, delay):
+                queue_sizes.append(len(app_service.page_update_queue))
+                await app_service.page_update_queue.flush(
+                    update=AsyncMock(), on_error=Mock(), max_concurrency=1
+                )
+
+            app_service._flush_page_updates = flush_page_updates
+
+            with patch("notiontaskr.application.task_application_service.GCSHandler"):
+                asyncio.run(
+                    app_service.run_sync_daemon(
+                        interval=0, checkpoint_interval=3600, max_ticks=2
+                    )
+                )
+
+            assert queue_sizes == [2, 0]
+            assert scheduled_task.is_updated is False
+            assert scheduled_task.update_contents == []
+            assert executed_task.updated_fields == set()
+
+    class Test__checkpoint:
+        def test_予定タスクを保存できなかった場合はカーソルを保存しないこと(
+            self, page_data
+        ):
+            app_service = TaskApplicationService(logger=Mock())
+            app_service._sync_cursor = SyncCursor.from_tasks(
+                [ScheduledTask.from_response_data(page_data(1, is_scheduled=True))],
+                overlap=timedelta(seconds=config.REGULAR_TASK_OVERLAP_SECONDS),
+            )
+            app_service._save_dirty_scheduled_tasks = AsyncMock(return_value=False)
+            app_service._save_page_update_queue = Mock()
+            app_service._upload_sync_cursor = Mock()
+
+            asyncio.run(app_service._checkpoint(gcs_handler=Mock()))
+
+            # 書き込み待ちの更新は保存する
+            app_service._save_page_update_queue.assert_called_once()
+            app_service._upload_sync_cursor.assert_not_called()
+
+    class Test__get_scheduled_tasks_by_id:
+        def test_常駐時はGCSが更新されていなければメモリ上のキャッシュを使うこと(
+            self, page_data
+        ):
+            scheduled_task = ScheduledTask.from_response_data(
+                page_data(1, is_scheduled=True)
+            )
+            app_service = TaskApplicationService(logger=Mock())
+            app_service.keep_warm = True
+            app_service._load_pickle = AsyncMock(return_value=[scheduled_task])
+            app_service._is_remote_cache_updated = Mock(return_value=False)
+            gcs_handler = Mock()
+
+            first = asyncio.run(app_service._get_scheduled_tasks_by_id(gcs_handler))
+            second = asyncio.run(app_service._get_scheduled_tasks_by_id(gcs_handler))
+
+            assert first is second
+            assert second == {scheduled_task.id: scheduled_task}
+            app_service._load_pickle.assert_awaited_once()
+
+        def test_常駐時にGCSが更新された場合は未保存の変更を保存してから読み直すこと(
+            self, page_data
+        ):
+            scheduled_task = ScheduledTask.from_response_data(
+                page_data(1, is_scheduled=True)
+            )
+            app_service = TaskApplicationService(logger=Mock())
+            app_service.keep_warm = True
+            app_service._scheduled_tasks_by_id = {scheduled_task.id: scheduled_task}
+            app_service._dirty_scheduled_tasks = {scheduled_task.id: scheduled_task}
+            app_service._is_remote_cache_updated = Mock(return_value=True)
+            app_service._save_scheduled_tasks = AsyncMock()
+            app_service._load_pickle = AsyncMock(return_value=[scheduled_task])
+            gcs_handler = Mock()
+
+            asyncio.run(app_service._get_scheduled_tasks_by_id(gcs_handler))
+
+            app_service._save_scheduled_tasks.assert_awaited_once_with(
+                scheduled_tasks_by_id={scheduled_task.id: scheduled_task},
+                changed_tasks=[scheduled_task],
+                gcs_handler=gcs_handler,
+            )
+            assert app_service._dirty_scheduled_tasks == {}
+            app_service._load_pickle.assert_awaited_once()
+
+    class Test__get_scheduled_task_name_index:
+        def test_キャッシュを読み直すまで同じ索引を使うこと(self, page_data):
+            scheduled_task = ScheduledTask.from_response_data(
+                page_data(1, is_scheduled=True, name="タスク1")
+            )
+            app_service = TaskApplicationService(logger=Mock())
+            app_service._load_pickle = AsyncMock(return_value=[scheduled_task])
+            gcs_handler = Mock()
+
+            scheduled_tasks_by_id = asyncio.run(
+                app_service._get_scheduled_tasks_by_id(gcs_handler)
+            )
+            first = app_service._get_scheduled_task_name_index(scheduled_tasks_by_id)  # type: ignore
+            second = app_service._get_scheduled_task_name_index(scheduled_tasks_by_id)  # type: ignore
+            scheduled_tasks_by_id = asyncio.run(
+                app_service._get_scheduled_tasks_by_id(gcs_handler)
+            )
+            reloaded = app_service._get_scheduled_task_name_index(scheduled_tasks_by_id)  # type: ignore
+
+            assert first is second
+            assert first.get("タスク1") == scheduled_task
+            assert reloaded is not first
+
+    class Test_sync_pages:
+        def test_取得できたページのみ紐づけて待たずに書き込むこと(self, page_data):
+            scheduled_task = ScheduledTask.from_response_data(
+                page_data(1, is_scheduled=True)
+            )
+            logger = Mock()
+            app_service = TaskApplicationService(logger=logger)
+            app_service.task_repo = Mock(
+                find_by_page_id=AsyncMock(
+                    side_effect=[scheduled_task, RuntimeError("error")]
+                )
+            )
+            app_service._load_page_update_queue = Mock()
+            app_service._apply_fetched_tasks = AsyncMock()
+            app_service._flush_page_updates = AsyncMock()
+
+            with patch("notiontaskr.application.task_application_service.GCSHandler"):
+                asyncio.run(
+                    app_service.sync_pages([PageId("page_id_1"), PageId("page_id_2")])
+                )
+
+            app_service._apply_fetched_tasks.assert_awaited_once_with(
+                fetched_tasks=[scheduled_task], gcs_handler=ANY
+            )
+            app_service._flush_page_updates.assert_awaited_once_with(
+                gcs_handler=ANY, delay=0
+            )
+            logger.error.assert_called_once()
+
+    class Test__get_previous_executed_tasks:
+        def test_キャッシュの予定タスクから編集前の実績タスクを取得すること(
+            self, page_data
+        ):
+            scheduled_task = ScheduledTask.from_response_data(
+                page_data(1, is_scheduled=True)
+            )
+            previous_task = ExecutedTask.from_response_data(
+                page_data(
+                    2,
+                    is_scheduled=False,
+                    name="[1]",
+                    start="2025-04-10T10:00:00.000Z",
+                    end="2025-04-10T11:00:00.000Z",
+                )
+            )
+            scheduled_task.update_executed_tasks([previous_task])
+            edited_task = ExecutedTask.from_response_data(
+                page_data(
+                    2,
+                    is_scheduled=False,
+                    name="[1]",
+                    start="2025-05-10T10:00:00.000Z",
+                    end="2025-05-10T11:00:00.000Z",
+                )
+            )
+            new_task = ExecutedTask.from_response_data(
+                page_data(3, is_scheduled=False, name="[1]")
+            )
+
+            previous_tasks = TaskApplicationService._get_previous_executed_tasks(
+                executed_tasks=[edited_task, new_task],
+                scheduled_tasks_by_id={scheduled_task.id: scheduled_task},
+            )
+
+            assert previous_tasks == [previous_task]
+
+    class Test__invalidate_uptime_cache:
+        def test_実績タスクのタグを含み期間が実績タスクの日を含むキャッシュを破棄すること(
+            self, page_data
+        ):
+            executed_task = ExecutedTask.from_response_data(
+                page_data(
+                    2,
+                    is_scheduled=False,
+                    start="2025-05-10T10:00:00.000Z",
+                    end="2025-05-10T11:00:00.000Z",
+                )
+            )
+            app_service = TaskApplicationService(logger=Mock())
+            for tag, month in (("タグ1", 4), ("タグ1", 5), ("タグ2", 5)):
+                app_service.uptime_cache.set(
+                    [tag],
+                    datetime(2025, month, 1),
+                    datetime(2025, month, 28),
+                    UptimeDataByTag.from_empty(),
+                )
+
+            app_service._invalidate_uptime_cache(executed_tasks=[executed_task])
+
+            assert len(app_service.uptime_cache) == 2
+            assert (
+                app_service.uptime_cache.get(
+                    ["タグ1"], datetime(2025, 5, 1), datetime(2025, 5, 28)
+                )
+                is None
+            )
+
+    class Test__flush_page_updates:
+        def test_書き込まれた実績タスクの日を含む稼働実績のキャッシュを破棄すること(
+            self, page_data, tmp_path
+        ):
+            written_task = ExecutedTask.from_response_data(
+                page_data(2, is_scheduled=False, tags=["タグ1"])
+            )
+            failed_task = ExecutedTask.from_response_data(
+                page_data(3, is_scheduled=False, tags=["タグ2"])
+            )
+            app_service = TaskApplicationService(logger=Mock())
+            app_service.keep_warm = True
+            app_service.page_update_queue = PageUpdateQueue(
+                save_path=os.path.join(tmp_path, "queue.json")
+            )
+            app_service.task_repo = Mock(
+                update_page=AsyncMock(side_effect=[None, Exception("error")])
+            )
+            for task in (written_task, failed_task):
+                app_service.page_update_queue.enqueue(
+                    page_id=task.page_id, properties={"名前": {}}
+                )
+                app_service._executed_tasks_to_invalidate_by_page_id[task.page_id] = (
+                    task
+                )
+                app_service.uptime_cache.set(
+                    [str(task.tags[0])],
+                    datetime(2025, 5, 1),
+                    datetime(2025, 5, 31),
+                    UptimeDataByTag.from_empty(),
+                )
+
+            asyncio.run(app_service._flush_page_updates(gcs_handler=Mock(), delay=0))
+
+            # 書き込めなかった実績タスクは、次の書き込みまで破棄を待つ
+            assert app_service._executed_tasks_to_invalidate_by_page_id == {
+                failed_task.page_id: failed_task
+            }
+            assert len(app_service.uptime_cache) == 1
+            assert (
+                app_service.uptime_cache.get(
+                    ["タグ2"], datetime(2025, 5, 1), datetime(2025, 5, 31)
+                )
+                is not None
+            )
+
+    class Test__enqueue_updated_tasks:
+        def test_更新されたタスクの変更内容のみをページごとに積むこと(
+            self, page_data, tmp_path
+        ):
+            app_service = TaskApplicationService(logger=Mock())
+            app_service.page_update_queue = PageUpdateQueue(
+                save_path=os.path.join(tmp_path, "queue.json")
+            )
+            scheduled_task = ScheduledTask.from_response_data(
+                page_data(1, is_scheduled=True, name="タスク1")
+            )
+            not_updated_task = Mock(is_updated=False)
+            scheduled_task.update_executed_man_hours(ManHours(1.5))
+
+            app_service._enqueue_updated_tasks(
+                scheduled_tasks=[scheduled_task, not_updated_task], executed_tasks=[]
+            )
+
+            assert len(app_service.page_update_queue) == 1
+            properties = app_service.page_update_queue.get_properties(
+                scheduled_task.page_id
+            )
+            # 取得時に付与したIDラベルの名前と、実績人時のみを更新する
+            assert properties is not None
+            assert set(properties) == {"名前", "人時(実)"}
+            assert properties["人時(実)"] == {"number": 1.5}
+            # 積んだタスクの変更の記録は消去する
+            assert scheduled_task.is_updated is False
+            assert scheduled_task.update_contents == []
+
+    class Test__save_page_update_queue:
+        def test_読み込んだ世代を条件に保存し競合した場合は統合して保存し直すこと(
+            self, tmp_path
+        ):
+            app_service = TaskApplicationService(logger=Mock())
+            app_service.page_update_queue = PageUpdateQueue(
+                save_path=os.path.join(tmp_path, "queue.json")
+            )
+            app_service.page_update_queue.enqueue(
+                PageId("page1"), {"進捗率": {"number": 0.5}}
+            )
+            app_service._page_update_queue_generation = 10
+
+            def download_remote_queue(from_, to, generation):
+                # 他の処理が保存したキュー
+                remote_queue = PageUpdateQueue(save_path=to)
+                remote_queue.enqueue(PageId("page2"), {"進捗率": {"number": 0.1}})
+                remote_queue.save()
+                return 12
+
+            gcs_handler = Mock()
+            gcs_handler.upload.side_effect = [GenerationMismatchError("mismatch"), 13]
+            gcs_handler.download_if_updated.side_effect = download_remote_queue
+
+            app_service._save_page_update_queue(gcs_handler=gcs_handler)
+
+            assert [
+                call.kwargs["if_generation_match"]
+                for call in gcs_handler.upload.call_args_list
+            ] == [10, 12]
+            assert app_service._page_update_queue_generation == 13
+            saved_queue = PageUpdateQueue(
+                save_path=os.path.join(tmp_path, "queue.json")
+            )
+            saved_queue.load()
+            assert PageId("page1") in saved_queue
+            assert PageId("page2") in saved_queue
+
+    class Test__sync_deltas:
+        def test_未取得の差分のみダウンロードし集約済みの差分を削除すること(
+            self, tmp_path
+        ):
+            app_service = TaskApplicationService(logger=Mock())
+            app_service.scheduled_task_cache = ScheduledTaskCache(
+                save_path=os.path.join(tmp_path, "scheduled_task.pkl"),
+                delta_dir=str(tmp_path),
+            )
+            for name in ["1_a.pkl", "2_b.pkl"]:
+                open(os.path.join(tmp_path, name), "wb").close()
+            gcs_handler = Mock()
+            gcs_handler.list_names.return_value = ["/deltas/2_b.pkl", "/deltas/3_c.pkl"]
+
+            app_service._sync_deltas(gcs_handler=gcs_handler)
+
+            # 集約済みの差分(1_a)はローカルから削除される
+            assert app_service.scheduled_task_cache.get_delta_names() == ["2_b.pkl"]
+            # ローカルにない差分(3_c)のみダウンロードされる
+            gcs_handler.download.assert_called_once_with(
+                from_="/deltas/3_c.pkl", to=os.path.join(tmp_path, "3_c.pkl")
+            )
+
+    class Test_get_uptime:
+        def test_タグのor条件で全件取得しタグごとに工数を合計すること(self):
+            app_service = TaskApplicationService(logger=Mock())
+            app_service._load_uptime_rollup = Mock(return_value=None)
+            app_service.executed_task_repo = Mock(
+                find_all_by_condition=AsyncMock(
+                    return_value=[
+                        Mock(tags=["tag1"], man_hours=ManHours(1.5)),
+                        Mock(tags=["tag1", "tag2"], man_hours=ManHours(2)),
+                    ]
+                )
+            )
+
+            uptime_data_by_tag = asyncio.run(
+                app_service.get_uptime(
+                    from_=datetime(2025, 5, 1),
+                    to=datetime(2025, 5, 31),
+                    tags=["tag1", "tag2"],
+                )
+            )
+
+            condition = (
+                app_service.executed_task_repo.find_all_by_condition.call_args.kwargs[
+                    "condition"
+                ]
+            )
+            assert condition.build()["and"][2] == {
+                "or": [
+                    {"property": "タグ", "multi_select": {"contains": "tag1"}},
+                    {"property": "タグ", "multi_select": {"contains": "tag2"}},
+                ]
+            }
+            assert uptime_data_by_tag.get_data("tag1").uptime == 3.5
+            assert uptime_data_by_tag.get_data("tag2").uptime == 2
+
+        def test_同じタグと期間の2回目はNotionへ問い合わせないこと(self):
+            app_service = TaskApplicationService(logger=Mock())
+            app_service._load_uptime_rollup = Mock(return_value=None)
+            app_service.executed_task_repo = Mock(
+                find_all_by_condition=AsyncMock(
+                    return_value=[Mock(tags=["tag1"], man_hours=ManHours(1.5))]
+                )
+            )
+
+            async def get_uptime(tags):
+                return await app_service.get_uptime(
+                    from_=datetime(2025, 5, 1), to=datetime(2025, 5, 31), tags=tags
+                )
+
+            first = asyncio.run(get_uptime(["tag1", "tag2"]))
+            second = asyncio.run(get_uptime(["tag2", "tag1"]))
+
+            assert second is first
+            app_service.executed_task_repo.find_all_by_condition.assert_awaited_once()
+
+        def test_タグが空の場合はNotionへ問い合わせないこと(self):
+            app_service = TaskApplicationService(logger=Mock())
+            app_service.executed_task_repo = Mock(find_all_by_condition=AsyncMock())
+
+            uptime_data_by_tag = asyncio.run(
+                app_service.get_uptime(
+                    from_=datetime(2025, 5, 1), to=datetime(2025, 5, 31), tags=[]
+                )
+            )
+
+            assert uptime_data_by_tag.tag_uptimes_dict == {}
+            app_service.executed_task_repo.find_all_by_condition.assert_not_called()
+
+        def test_集計済みの期間は工数集計から取得し未集計の期間のみNotionから取得すること(
+            self,
+        ):
+            app_service = TaskApplicationService(logger=Mock())
+            app_service._load_uptime_rollup = Mock(
+                return_value=UptimeRollup(
+                    covered_from=date(2025, 1, 1),
+                    closed_until=date(2025, 5, 20),
+                    man_hours_by_tag_day={
+                        "tag1": {date(2025, 4, 30): 5.0, date(2025, 5, 1): 1.0}
+                    },
+                )
+            )
+            app_service.executed_task_repo = Mock(
+                find_all_by_condition=AsyncMock(
+                    return_value=[Mock(tags=["tag1"], man_hours=ManHours(2))]
+                )
+            )
+
+            uptime_data_by_tag = asyncio.run(
+                app_service.get_uptime(
+                    from_=datetime(2025, 5, 1),
+                    to=datetime(2025, 5, 31, 23, 59),
+                    tags=["tag1"],
+                )
+            )
+
+            assert uptime_data_by_tag.get_data("tag1").uptime == 3
+            condition = (
+                app_service.executed_task_repo.find_all_by_condition.call_args.kwargs[
+                    "condition"
+                ]
+            )
+            assert condition.build()["and"][0] == {
+                "property": "日付",
+                "date": {"on_or_after": "2025-05-20T00:00:00.000Z"},
+            }
+
+        def test_期間が集計済みの場合はNotionへ問い合わせないこと(self):
+            app_service = TaskApplicationService(logger=Mock())
+            app_service._load_uptime_rollup = Mock(
+                return_value=UptimeRollup(
+                    covered_from=date(2025, 1, 1),
+                    closed_until=date(2025, 6, 1),
+                    man_hours_by_tag_day={"tag1": {date(2025, 5, 1): 1.5}},
+                )
+            )
+            app_service.executed_task_repo = Mock(find_all_by_condition=AsyncMock())
+
+            uptime_data_by_tag = asyncio.run(
+                app_service.get_uptime(
+                    from_=datetime(2025, 5, 1),
+                    to=datetime(2025, 5, 31, 23, 59),
+                    tags=["tag1"],
+                )
+            )
+
+            assert uptime_data_by_tag.get_data("tag1").uptime == 1.5
+            app_service.executed_task_repo.find_all_by_condition.assert_not_called()
+
+    class Test_get_uptime_series:
+        def test_期間全体を1回で取得しタグと区間ごとに工数を合計すること(self):
+            app_service = TaskApplicationService(logger=Mock())
+            app_service._load_uptime_rollup = Mock(
+                return_value=UptimeRollup(
+                    covered_from=date(2025, 1, 1),
+                    closed_until=date(2025, 2, 10),
+                    man_hours_by_tag_day={
+                        "tag1": {date(2025, 1, 5): 1.0, date(2025, 2, 3): 2.0}
+                    },
+                )
+            )
+            app_service.executed_task_repo = Mock(
+                find_all_by_condition=AsyncMock(
+                    return_value=[
+                        Mock(
+                            tags=["tag1", "tag2"],
+                            date=NotionDate(
+                                start=datetime(2025, 2, 15, 10),
+                                end=datetime(2025, 2, 15, 11),
+                            ),
+                            man_hours=ManHours(1.5),
+                        ),
+                        Mock(
+                            tags=["tag2"],
+                            date=NotionDate(
+                                start=datetime(2025, 3, 1, 10),
+                                end=datetime(2025, 3, 1, 12),
+                            ),
+                            man_hours=ManHours(2),
+                        ),
+                    ]
+                )
+            )
+
+            uptime_series_by_tag = asyncio.run(
+                app_service.get_uptime_series(
+                    from_=datetime(2025, 1, 1),
+                    to=datetime(2025, 3, 31, 23, 59),
+                    tags=["tag1", "tag2"],
+                    bucket=UptimeBucket.MONTH,
+                )
+            )
+
+            assert [
+                data.uptime for data in uptime_series_by_tag.get_series("tag1")
+            ] == [1.0, 3.5, 0.0]
+            assert [
+                data.uptime for data in uptime_series_by_tag.get_series("tag2")
+            ] == [0.0, 1.5, 2.0]
+            assert uptime_series_by_tag.get_series("tag1")[1].from_ == datetime(
+                2025, 2, 1
+            )
+            assert uptime_series_by_tag.get_series("tag1")[1].to == datetime(
+                2025, 2, 28
+            )
+            # 未集計の期間のみ1回で取得する
+            app_service.executed_task_repo.find_all_by_condition.assert_awaited_once()
+            condition = (
+                app_service.executed_task_repo.find_all_by_condition.call_args.kwargs[
+                    "condition"
+                ]
+            )
+            assert condition.build()["and"][0] == {
+                "property": "日付",
+                "date": {"on_or_after": "2025-02-10T00:00:00.000Z"},
+            }
+
+        def test_タグが空の場合はNotionへ問い合わせないこと(self):
+            app_service = TaskApplicationService(logger=Mock())
+            app_service.executed_task_repo = Mock(find_all_by_condition=AsyncMock())
+
+            uptime_series_by_tag = asyncio.run(
+                app_service.get_uptime_series(
+                    from_=datetime(2025, 1, 1),
+                    to=datetime(2025, 3, 31),
+                    tags=[],
+                    bucket=UptimeBucket.WEEK,
+                )
+            )
+
+            assert uptime_series_by_tag.tag_series_dict == {}
+            app_service.executed_task_repo.find_all_by_condition.assert_not_called()
+
+
 if __name__ == "__main__":
     main()
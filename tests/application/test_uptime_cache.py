@@ -0,0 +1,119 @@
+from datetime import date, datetime
+from unittest.mock import Mock
+
+from notiontaskr.application.dto.uptime_data import UptimeDataByTag
+from notiontaskr.application.uptime_cache import UptimeCache
+
+
+def _cache(timer: Mock) -> UptimeCache:
+    return UptimeCache(
+        maxsize=2,
+        ttl=3600,
+        open_ttl=60,
+        timer=timer,
+        today=lambda: date(2025, 5, 20),
+    )
+
+
+class TestUptimeCache:
+    class Test_get:
+        def test_タグの順序と重複によらず同じキーで取得できること(self):
+            cache = _cache(Mock(return_value=0))
+            uptime_data_by_tag = UptimeDataByTag.from_empty()
+
+            cache.set(
+                ["tag2", "tag1"],
+                datetime(2025, 4, 1),
+                datetime(2025, 4, 30),
+                uptime_data_by_tag,
+            )
+
+            assert (
+                cache.get(
+                    ["tag1", "tag2", "tag1"],
+                    datetime(2025, 4, 1),
+                    datetime(2025, 4, 30),
+                )
+                is uptime_data_by_tag
+            )
+            assert (
+                cache.get(["tag1"], datetime(2025, 4, 1), datetime(2025, 4, 30)) is None
+            )
+
+        def test_当日を含む期間は短いTTLで期限切れになること(self):
+            timer = Mock(return_value=0)
+            cache = _cache(timer)
+            cache.set(
+                ["tag1"],
+                datetime(2025, 4, 1),
+                datetime(2025, 4, 30),
+                UptimeDataByTag.from_empty(),
+            )
+            cache.set(
+                ["tag1"],
+                datetime(2025, 5, 1),
+                datetime(2025, 5, 31),
+                UptimeDataByTag.from_empty(),
+            )
+
+            timer.return_value = 61
+
+            assert (
+                cache.get(["tag1"], datetime(2025, 4, 1), datetime(2025, 4, 30))
+                is not None
+            )
+            assert (
+                cache.get(["tag1"], datetime(2025, 5, 1), datetime(2025, 5, 31)) is None
+            )
+
+        def test_最大件数を超えた場合は最も使われていないものから破棄すること(self):
+            cache = _cache(Mock(return_value=0))
+            for month in (1, 2):
+                cache.set(
+                    ["tag1"],
+                    datetime(2025, month, 1),
+                    datetime(2025, month, 28),
+                    UptimeDataByTag.from_empty(),
+                )
+            cache.get(["tag1"], datetime(2025, 1, 1), datetime(2025, 1, 28))
+
+            cache.set(
+                ["tag1"],
+                datetime(2025, 3, 1),
+                datetime(2025, 3, 28),
+                UptimeDataByTag.from_empty(),
+            )
+
+            assert (
+                cache.get(["tag1"], datetime(2025, 1, 1), datetime(2025, 1, 28))
+                is not None
+            )
+            assert (
+                cache.get(["tag1"], datetime(2025, 2, 1), datetime(2025, 2, 28)) is None
+            )
+
+    class Test_invalidate:
+        def test_タグが重なり期間が日を含むもののみ破棄すること(self):
+            cache = UptimeCache(maxsize=10, ttl=3600, open_ttl=60)
+            for tags, month in ((["tag1"], 4), (["tag1"], 5), (["tag2"], 4)):
+                cache.set(
+                    tags,
+                    datetime(2025, month, 1),
+                    datetime(2025, month, 30),
+                    UptimeDataByTag.from_empty(),
+                )
+
+            invalidated_count = cache.invalidate(["tag1", "tag3"], [date(2025, 4, 15)])
+
+            assert invalidated_count == 1
+            assert (
+                cache.get(["tag1"], datetime(2025, 4, 1), datetime(2025, 4, 30)) is None
+            )
+            assert (
+                cache.get(["tag1"], datetime(2025, 5, 1), datetime(2025, 5, 30))
+                is not None
+            )
+            assert (
+                cache.get(["tag2"], datetime(2025, 4, 1), datetime(2025, 4, 30))
+                is not None
+            )
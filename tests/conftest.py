@@ -0,0 +1,52 @@
+import pytest
+
+
+def _make_page_data(
+    number: int,
+    is_scheduled: bool,
+    name: str = "",
+    tags: list[str] | None = None,
+    start: str = "2025-05-01T10:00:00.000+09:00",
+    end: str = "2025-05-01T12:00:00.000+09:00",
+    last_edited_time: str = "2025-05-01T12:00:00.000Z",
+) -> dict:
+    """Notion APIのページのレスポンスデータを生成する"""
+    properties = {
+        "名前": {"title": [{"plain_text": name or f"タスク{number}"}]},
+        "タグ": {"multi_select": [{"name": tag} for tag in (tags or ["タグ1"])]},
+        "ID": {"unique_id": {"number": number, "prefix": "ID"}},
+        "ステータス": {"status": {"name": "未着手"}},
+        "予定フラグ": {"checkbox": is_scheduled},
+    }
+    if is_scheduled:
+        properties.update(
+            {
+                "親アイテム": {"relation": []},
+                "人時(予)": {"number": 1},
+                "人時(実)": {"number": 0},
+                "サブアイテム": {"relation": []},
+                "進捗率": {"number": 0},
+            }
+        )
+    else:
+        properties.update(
+            {
+                "日付": {"date": {"start": start, "end": end}},
+                "親アイテム(予)": {"relation": []},
+                "予定タスク": {"relation": []},
+            }
+        )
+    return {
+        "id": f"page_id_{number}",
+        "last_edited_time": last_edited_time,
+        "properties": properties,
+    }
+
+
+@pytest.fixture
+def page_data():
+    """Notion APIのページのレスポンスデータを生成する関数を返すフィクスチャ
+
+    例: page_data(1, is_scheduled=True)
+    """
+    return _make_page_data
@@ -1,4 +1,4 @@
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 import emoji
 import pytest
 from notiontaskr.domain.name_labels.label_registerable import LabelRegisterable
@@ -51,6 +51,17 @@ class TestManHoursLabel:
             assert registered_label.key == emoji.emojize(":stopwatch:")
             assert registered_label.value == "1/2"
 
+        def test_バリアントセレクタのない工数の絵文字でもdelegateに値が登録されること(
+            self,
+        ):
+            mock_delegate = Mock(spec=LabelRegisterable)
+
+            with patch("emoji.demojize") as mock_demojize:
+                ManHoursLabel.parse_and_register("⏱", "1/2", mock_delegate)
+
+            mock_delegate.register_man_hours_label.assert_called_once()
+            mock_demojize.assert_not_called()
+
         def test_引数keyが工数の絵文字でないときValueErrorが発生すること(self):
             key = "1"
             value = "2"
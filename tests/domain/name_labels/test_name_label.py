@@ -0,0 +1,48 @@
+from unittest.mock import Mock
+
+from notiontaskr import config
+from notiontaskr.domain.name_labels.id_label import IdLabel
+from notiontaskr.domain.name_labels.label_registerable import LabelRegisterable
+from notiontaskr.domain.name_labels.man_hours_label import ManHoursLabel
+from notiontaskr.domain.name_labels.name_label import NameLabel
+from notiontaskr.domain.name_labels.parent_id_label import ParentIdLabel
+
+
+class TestNameLabel:
+    class Test_parse_labelsメソッド:
+        def test_先頭の文字に応じたラベルとしてdelegateに登録されること(self):
+            mock_delegate = Mock(spec=LabelRegisterable)
+
+            NameLabel.parse_labels("→12", mock_delegate)
+            NameLabel.parse_labels(f"{config.MAN_HOURS_EMOJI}1/2", mock_delegate)
+            NameLabel.parse_labels("親3", mock_delegate)
+
+            mock_delegate.register_id_label.assert_called_once_with(
+                IdLabel(key="→", value="12")
+            )
+            mock_delegate.register_man_hours_label.assert_called_once_with(
+                ManHoursLabel(key=config.MAN_HOURS_EMOJI, value="1/2")
+            )
+            mock_delegate.register_parent_id_label.assert_called_once_with(
+                ParentIdLabel(key="親", value="3")
+            )
+
+        def test_全角数字から始まるラベルはIDラベルとして登録されること(self):
+            mock_delegate = Mock(spec=LabelRegisterable)
+
+            NameLabel.parse_labels("１２", mock_delegate)
+
+            mock_delegate.register_id_label.assert_called_once_with(
+                IdLabel(key="", value="１２")
+            )
+
+        def test_未知のラベルや空のラベルは登録されないこと(self):
+            mock_delegate = Mock(spec=LabelRegisterable)
+
+            NameLabel.parse_labels("メモ", mock_delegate)
+            NameLabel.parse_labels("", mock_delegate)
+            NameLabel.parse_labels("️", mock_delegate)
+
+            mock_delegate.register_id_label.assert_not_called()
+            mock_delegate.register_man_hours_label.assert_not_called()
+            mock_delegate.register_parent_id_label.assert_not_called()
@@ -0,0 +1,62 @@
+from unittest.mock import Mock
+
+from notiontaskr.domain.scheduled_task_name_index import ScheduledTaskNameIndex
+from notiontaskr.domain.value_objects.notion_id import NotionId
+
+
+def _scheduled_task(number: str, task_name: str):
+    scheduled_task = Mock(id=NotionId(number))
+    scheduled_task.name.task_name = task_name
+    return scheduled_task
+
+
+class TestScheduledTaskNameIndex:
+    class Test_get:
+        def test_タスク名に一致する予定タスクを取得できること(self):
+            scheduled_task = _scheduled_task("1", "タスク1")
+            index = ScheduledTaskNameIndex.from_scheduled_tasks([scheduled_task])  # type: ignore
+
+            assert index.get("タスク1") == scheduled_task
+            assert index.get("タスク2") is None
+
+        def test_空白と全角半角の揺れを無視して一致すること(self):
+            scheduled_task = _scheduled_task("1", "タスク  ＡＢＣ")
+            index = ScheduledTaskNameIndex.from_scheduled_tasks([scheduled_task])  # type: ignore
+
+            assert index.get(" タスク ABC ") == scheduled_task
+
+    class Test_upsert:
+        def test_同じ名前の予定タスクはIDの番号が大きいものを採用すること(self):
+            old_task = _scheduled_task("9", "タスク1")
+            new_task = _scheduled_task("10", "タスク1")
+
+            index = ScheduledTaskNameIndex.from_scheduled_tasks([new_task, old_task])  # type: ignore
+
+            assert index.get("タスク1") == new_task
+
+        def test_同じIDの予定タスクは上書きすること(self):
+            task = _scheduled_task("1", "タスク1")
+            updated_task = _scheduled_task("1", "タスク1")
+            index = ScheduledTaskNameIndex.from_scheduled_tasks([task])  # type: ignore
+
+            index.upsert(updated_task)  # type: ignore
+
+            assert index.get("タスク1") == updated_task
+
+    class Test_remove:
+        def test_予定タスクを索引から削除できること(self):
+            task = _scheduled_task("1", "タスク1")
+            index = ScheduledTaskNameIndex.from_scheduled_tasks([task])  # type: ignore
+
+            index.remove(task)  # type: ignore
+
+            assert index.get("タスク1") is None
+
+        def test_同じ名前で別の予定タスクを採用している場合は削除しないこと(self):
+            old_task = _scheduled_task("9", "タスク1")
+            new_task = _scheduled_task("10", "タスク1")
+            index = ScheduledTaskNameIndex.from_scheduled_tasks([old_task, new_task])  # type: ignore
+
+            index.remove(old_task)  # type: ignore
+
+            assert index.get("タスク1") == new_task
@@ -2,6 +2,7 @@ from unittest.mock import Mock
 
 from notiontaskr.domain.value_objects.notion_id import NotionId
 
+from notiontaskr.domain.scheduled_task_name_index import ScheduledTaskNameIndex
 from notiontaskr.domain.scheduled_task_service import ScheduledTaskService
 
 
@@ -105,6 +106,30 @@ class TestScheduledTaskService:
             assert len(merged_tasks) == 1
             assert merged_tasks[scheduled_task.id].name.task_name == "タスク1"
 
+        def test_索引を渡した場合はマージした予定タスクの名前で引けるようにすること(
+            self,
+        ):
+            cached_task = Mock()
+            cached_task.id = NotionId("scheduled_id_1")
+            cached_task.name.task_name = "タスク1"
+            renamed_task = Mock()
+            renamed_task.id = NotionId("scheduled_id_1")
+            renamed_task.name.task_name = "タスク1改"
+            new_task = Mock()
+            new_task.id = NotionId("scheduled_id_2")
+            new_task.name.task_name = "タスク2"
+            name_index = ScheduledTaskNameIndex.from_scheduled_tasks([cached_task])  # type: ignore
+
+            ScheduledTaskService.merge_scheduled_tasks(
+                {cached_task.id: cached_task},  # type: ignore
+                [renamed_task, new_task],  # type: ignore
+                name_index=name_index,
+            )
+
+            assert name_index.get("タスク1") is None
+            assert name_index.get("タスク1改") == renamed_task
+            assert name_index.get("タスク2") == new_task
+
     class Test_指定タグ配列に一致する予定タスクを辞書型で取得する:
         def test_予定タスク配列とタグ配列を渡し指定タグに一致する予定タスクを辞書型で取得できること(
             self,
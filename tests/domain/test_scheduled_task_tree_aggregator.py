@@ -0,0 +1,53 @@
+from unittest.mock import patch
+
+from notiontaskr.domain.executed_task import ExecutedTask
+from notiontaskr.domain.scheduled_task import ScheduledTask
+from notiontaskr.domain.scheduled_task_tree_aggregator import (
+    ScheduledTaskTreeAggregator,
+)
+from notiontaskr.domain.value_objects.man_hours import ManHours
+from notiontaskr.domain.value_objects.status import Status
+
+
+class TestScheduledTaskTreeAggregator:
+    class Test_aggregate:
+        def test_子孫から順に一度ずつ集計し工数とステータスを親へ伝播すること(
+            self, page_data
+        ):
+            parent = ScheduledTask.from_response_data(page_data(1, is_scheduled=True))
+            child = ScheduledTask.from_response_data(page_data(2, is_scheduled=True))
+            grandchild = ScheduledTask.from_response_data(
+                page_data(3, is_scheduled=True)
+            )
+            grandchild.update_executed_tasks(
+                [ExecutedTask.from_response_data(page_data(4, is_scheduled=False))]
+            )
+            parent.update_sub_tasks([child])
+            child.update_sub_tasks([grandchild])
+
+            with patch.object(
+                ScheduledTaskTreeAggregator,
+                "_aggregate_task",
+                wraps=ScheduledTaskTreeAggregator._aggregate_task,
+            ) as aggregate_task:
+                aggregated_tasks = ScheduledTaskTreeAggregator.aggregate(
+                    [parent, child, grandchild]
+                )
+
+            assert aggregated_tasks == [grandchild, child, parent]
+            assert aggregate_task.call_count == 3
+            assert parent.executed_man_hours == ManHours(2)
+            assert parent.scheduled_man_hours == ManHours(1)
+            # 実績タスクの開始日時が過去のため、祖先まで進行中になる
+            assert grandchild.status == Status.IN_PROGRESS
+            assert parent.status == Status.IN_PROGRESS
+
+        def test_親子関係が循環していても停止すること(self, page_data):
+            task1 = ScheduledTask.from_response_data(page_data(1, is_scheduled=True))
+            task2 = ScheduledTask.from_response_data(page_data(2, is_scheduled=True))
+            task1.update_sub_tasks([task2])
+            task2.update_sub_tasks([task1])
+
+            aggregated_tasks = ScheduledTaskTreeAggregator.aggregate([task1])
+
+            assert aggregated_tasks == [task2, task1]
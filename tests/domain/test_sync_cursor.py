@@ -0,0 +1,79 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+from notiontaskr.domain.sync_cursor import SyncCursor
+from notiontaskr.domain.value_objects.page_id import PageId
+
+OVERLAP = timedelta(minutes=2)
+
+
+def _at(minute: int) -> datetime:
+    return datetime(2025, 5, 1, 12, minute, tzinfo=timezone.utc)
+
+
+def _task(page_id: str, last_edited_time: datetime | None):
+    return Mock(page_id=PageId(page_id), last_edited_time=last_edited_time)
+
+
+class TestSyncCursor:
+    class Test_from_tasks:
+        def test_最終更新日時の最大値を上限とし重なり期間内のページのみ記録すること(
+            self,
+        ):
+            cursor = SyncCursor.from_tasks(
+                [
+                    _task("page1", _at(0)),
+                    _task("page2", _at(5)),
+                    _task("page3", _at(4)),
+                ],
+                overlap=OVERLAP,
+            )
+
+            assert cursor == SyncCursor(
+                last_edited_time=_at(5),
+                processed_pages={"page2": _at(5), "page3": _at(4)},
+            )
+
+        def test_最終更新日時を持つタスクがない場合Noneを返すこと(self):
+            assert (
+                SyncCursor.from_tasks([_task("page1", None)], overlap=OVERLAP) is None
+            )
+
+    class Test_advance:
+        def test_処理したタスクで上限を進め同じページは新しい日時で上書きすること(
+            self,
+        ):
+            cursor = SyncCursor(
+                last_edited_time=_at(5),
+                processed_pages={"page1": _at(4), "page2": _at(5)},
+            )
+
+            next_cursor = cursor.advance(
+                [_task("page1", _at(7)), _task("page3", _at(6))], overlap=OVERLAP
+            )
+
+            assert next_cursor == SyncCursor(
+                last_edited_time=_at(7),
+                processed_pages={"page1": _at(7), "page2": _at(5), "page3": _at(6)},
+            )
+
+        def test_処理したタスクがない場合は同じカーソルを返すこと(self):
+            cursor = SyncCursor(last_edited_time=_at(5))
+
+            assert cursor.advance([], overlap=OVERLAP) == cursor
+
+    class Test_is_processed:
+        def test_同じ最終更新日時で処理済みのページのみTrueを返すこと(self):
+            cursor = SyncCursor(
+                last_edited_time=_at(5), processed_pages={"page1": _at(5)}
+            )
+
+            assert cursor.is_processed(_task("page1", _at(5))) is True
+            assert cursor.is_processed(_task("page1", _at(6))) is False
+            assert cursor.is_processed(_task("page2", _at(5))) is False
+
+    class Test_get_from:
+        def test_上限から重なり期間だけ遡った日時を返すこと(self):
+            cursor = SyncCursor(last_edited_time=_at(5))
+
+            assert cursor.get_from(OVERLAP) == _at(3)
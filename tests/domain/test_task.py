@@ -1,6 +1,8 @@
 from unittest.mock import Mock
 
+from notiontaskr.domain.name_labels.parent_id_label import ParentIdLabel
 from notiontaskr.domain.task import Task
+from notiontaskr.domain.task_name import TaskName
 import pytest
 
 
@@ -73,6 +75,22 @@ class TestTask:
 
             empty_task._toggle_is_updated.assert_called_once()
 
+    class Test_update_label:
+        def test_共有しているタスク名を変更せずに差し替えること(self):
+            shared_name = TaskName(task_name="タスク名")
+            task1 = Task(
+                page_id=Mock(), name=shared_name, tags=[], id=Mock(), status=Mock()
+            )
+            task2 = Task(
+                page_id=Mock(), name=shared_name, tags=[], id=Mock(), status=Mock()
+            )
+
+            task1.update_parent_id_label(ParentIdLabel(key="親", value="1"))
+
+            assert task1.name.parent_id_label == ParentIdLabel(key="親", value="1")
+            assert task2.name is shared_name
+            assert shared_name.parent_id_label is None
+
     class Test_update_name:
         def test_工数ラベルが異なる場合にis_updatedがTrueになること(
             self, empty_task: Task
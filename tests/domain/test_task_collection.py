@@ -0,0 +1,44 @@
+from unittest.mock import Mock
+
+from notiontaskr.domain.task_collection import TaskCollection
+from notiontaskr.domain.value_objects.notion_id import NotionId
+
+
+class TestTaskCollection:
+    class Test_upsert:
+        def test_タスクが存在しない場合は末尾に追加されること(self):
+            task1 = Mock(id=NotionId("1"))
+            task2 = Mock(id=NotionId("2"))
+            tasks = TaskCollection([task1])
+
+            tasks.upsert(task2)
+
+            assert tasks == [task1, task2]
+
+        def test_タスクが存在する場合は元の位置で上書きされること(self):
+            task1 = Mock(id=NotionId("1"))
+            task2 = Mock(id=NotionId("2"))
+            new_task1 = Mock(id=NotionId("1"))
+            tasks = TaskCollection([task1, task2])
+
+            tasks.upsert(new_task1)
+
+            assert tasks == [new_task1, task2]
+            assert tasks.get(NotionId("1")) is new_task1
+            assert len(tasks) == 2
+
+    class Test_from_tasks:
+        def test_TaskCollectionの場合はそのまま返すこと(self):
+            tasks = TaskCollection([Mock(id=NotionId("1"))])
+
+            assert TaskCollection.from_tasks(tasks) is tasks
+
+        def test_リストの場合は同じ順序のTaskCollectionを生成すること(self):
+            task1 = Mock(id=NotionId("1"))
+            task2 = Mock(id=NotionId("2"))
+
+            tasks = TaskCollection.from_tasks([task2, task1])
+
+            assert isinstance(tasks, TaskCollection)
+            assert tasks[0] is task2
+            assert tasks[1] is task1
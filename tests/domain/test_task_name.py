@@ -1,5 +1,10 @@
 import copy
-from unittest.mock import Mock, patch
+from dataclasses import FrozenInstanceError
+from unittest.mock import ANY, Mock, patch
+from notiontaskr import config
+from notiontaskr.domain.name_labels.id_label import IdLabel
+from notiontaskr.domain.name_labels.man_hours_label import ManHoursLabel
+from notiontaskr.domain.name_labels.parent_id_label import ParentIdLabel
 from notiontaskr.domain.task_name import TaskName
 from notiontaskr.domain.name_labels.name_label import NameLabel
 import pytest
@@ -20,8 +25,30 @@ class TestTaskName:
             ):
                 raw_task_name = " [ID1] タスク名 [親タスクID1] "
                 task_name = TaskName.from_raw_task_name(raw_task_name)
-                mock_parse_labels.assert_any_call("ID1", task_name)
-                mock_parse_labels.assert_any_call("親タスクID1", task_name)
+                mock_parse_labels.assert_any_call("ID1", ANY)
+                mock_parse_labels.assert_any_call("親タスクID1", ANY)
+
+            def test_ラベルを解析してタスク名に登録すること(self):
+                raw_task_name = (
+                    f"[✓12] タスク名 [{config.MAN_HOURS_EMOJI}1/2][親3][メモ]"
+                )
+                task_name = TaskName.from_raw_task_name(raw_task_name)
+                assert task_name.task_name == "タスク名"
+                assert task_name.id_label == IdLabel(key="✓", value="12")
+                assert task_name.man_hours_label == ManHoursLabel(
+                    key=config.MAN_HOURS_EMOJI, value="1/2"
+                )
+                assert task_name.parent_id_label == ParentIdLabel(key="親", value="3")
+
+            def test_全角数字のIDラベルを解析してタスク名に登録すること(self):
+                task_name = TaskName.from_raw_task_name("[１２] タスク名")
+                assert task_name.task_name == "タスク名"
+                assert task_name.id_label == IdLabel(key="", value="１２")
+
+            def test_空のラベルは無視すること(self):
+                task_name = TaskName.from_raw_task_name("タスク名 []")
+                assert task_name.task_name == "タスク名"
+                assert task_name.id_label is None
 
         class Test_タスク名にラベルが含まれていない場合:
             @patch.object(NameLabel, "parse_labels")
@@ -95,7 +122,7 @@ class TestTaskName:
             )
             assert task_name != "タスク名"
 
-    class TestRegister:
+    class TestWithLabel:
 
         @pytest.fixture
         def task_name(self) -> TaskName:
@@ -107,20 +134,49 @@ class TestTaskName:
                 parent_id_label=None,
             )
 
-        class Test_register_id_label:
-            def test_ラベルを登録できること(self, task_name: TaskName):
+        class Test_with_id_label:
+            def test_ラベルを差し替えた新しいインスタンスを返すこと(
+                self, task_name: TaskName
+            ):
                 mock_label = Mock()
-                task_name.register_id_label(mock_label)
-                assert task_name.id_label == mock_label
-
-        class Test_register_man_hours_label:
-            def test_ラベルを登録できること(self, task_name: TaskName):
+                new_task_name = task_name.with_id_label(mock_label)
+                assert new_task_name.id_label == mock_label
+                assert new_task_name.task_name == "タスク名"
+                assert task_name.id_label is None
+
+        class Test_with_man_hours_label:
+            def test_ラベルを差し替えた新しいインスタンスを返すこと(
+                self, task_name: TaskName
+            ):
                 mock_label = Mock()
-                task_name.register_man_hours_label(mock_label)
-                assert task_name.man_hours_label == mock_label
+                new_task_name = task_name.with_man_hours_label(mock_label)
+                assert new_task_name.man_hours_label == mock_label
+                assert task_name.man_hours_label is None
 
-        class Test_register_parent_id_label:
-            def test_ラベルを登録できること(self, task_name: TaskName):
+        class Test_with_parent_id_label:
+            def test_ラベルを差し替えた新しいインスタンスを返すこと(
+                self, task_name: TaskName
+            ):
                 mock_label = Mock()
-                task_name.register_parent_id_label(mock_label)
-                assert task_name.parent_id_label == mock_label
+                new_task_name = task_name.with_parent_id_label(mock_label)
+                assert new_task_name.parent_id_label == mock_label
+                assert task_name.parent_id_label is None
+
+    class TestImmutable:
+        def test_プロパティを変更できないこと(self):
+            task_name = TaskName(task_name="タスク名")
+            with pytest.raises(FrozenInstanceError):
+                task_name.task_name = "変更"  # type: ignore
+
+        def test_表示用の文字列は初回のみ生成すること(self):
+            id_label = Mock(get_display_str=Mock(return_value="[1]"))
+            task_name = TaskName(task_name="タスク名", id_label=id_label)
+
+            assert str(task_name) == "[1] タスク名"
+            assert str(task_name) == "[1] タスク名"
+            id_label.get_display_str.assert_called_once()
+
+        def test_タスク名の文字列をinternすること(self):
+            task_name1 = TaskName.from_raw_task_name("".join(["タスク", "名 [1]"]))
+            task_name2 = TaskName.from_raw_task_name("".join(["タスク", "名 [2]"]))
+            assert task_name1.task_name is task_name2.task_name
@@ -1,5 +1,6 @@
 from unittest.mock import Mock
 
+from notiontaskr.domain.task_collection import TaskCollection
 from notiontaskr.domain.task_service import TaskService
 
 
@@ -28,3 +29,11 @@ class TestTaskService:
             TaskService.upsert_tasks(tasks, task)
             assert len(tasks) == 1
             assert tasks[0] == task
+
+        def test_TaskCollectionの場合はIDで上書きされること(self):
+            task = Mock(id="task_id")
+            task2 = Mock(id="task_id")
+            tasks = TaskCollection([task])
+            TaskService.upsert_tasks(tasks, task2)
+            assert len(tasks) == 1
+            assert tasks[0] == task2
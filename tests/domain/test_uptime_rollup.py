@@ -0,0 +1,104 @@
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import Mock
+
+from notiontaskr.domain.uptime_rollup import UptimeRollup
+from notiontaskr.domain.value_objects.man_hours import ManHours
+from notiontaskr.domain.value_objects.notion_date import NotionDate
+
+
+def _executed_task(tags: list[str], start: datetime, man_hours: float):
+    return Mock(
+        tags=tags,
+        date=NotionDate(start=start, end=start),
+        man_hours=ManHours(man_hours),
+    )
+
+
+class TestUptimeRollup:
+    class Test_from_executed_tasks:
+        def test_集計済みの期間の工数をタグと日ごとに合計すること(self):
+            rollup = UptimeRollup.from_executed_tasks(
+                executed_tasks=[
+                    _executed_task(["tag1"], datetime(2025, 5, 1, 10), 1),
+                    _executed_task(["tag1", "tag2"], datetime(2025, 5, 1, 15), 2),
+                    # 集計済みの期間外
+                    _executed_task(["tag1"], datetime(2025, 5, 20), 4),
+                    _executed_task(["tag1"], datetime(2024, 12, 31), 8),
+                    Mock(tags=["tag1"], date=None, man_hours=ManHours(16)),
+                ],
+                covered_from=date(2025, 1, 1),
+                closed_until=date(2025, 5, 20),
+            )
+
+            assert rollup.man_hours_by_tag_day == {
+                "tag1": {date(2025, 5, 1): 3.0},
+                "tag2": {date(2025, 5, 1): 2.0},
+            }
+
+        def test_タイムゾーン付きの日時はUTCの日付で集計すること(self):
+            jst = timezone(timedelta(hours=9))
+            rollup = UptimeRollup.from_executed_tasks(
+                executed_tasks=[
+                    _executed_task(["tag1"], datetime(2025, 5, 2, 8, tzinfo=jst), 1)
+                ],
+                covered_from=date(2025, 1, 1),
+                closed_until=date(2025, 5, 20),
+            )
+
+            assert rollup.man_hours_by_tag_day == {"tag1": {date(2025, 5, 1): 1.0}}
+
+    class Test_get_man_hours_by_day:
+        def test_指定した期間の集計済みの工数を日ごとに取得すること(self):
+            rollup = UptimeRollup(
+                covered_from=date(2025, 1, 1),
+                closed_until=date(2025, 5, 20),
+                man_hours_by_tag_day={
+                    "tag1": {
+                        date(2025, 4, 30): 1.0,
+                        date(2025, 5, 1): 2.0,
+                        date(2025, 5, 20): 4.0,
+                    }
+                },
+            )
+
+            assert rollup.get_man_hours_by_day(
+                tag="tag1", from_=date(2025, 5, 1), to=date(2025, 5, 31)
+            ) == {date(2025, 5, 1): 2.0}
+            assert (
+                rollup.get_man_hours_by_day(
+                    tag="tag2", from_=date(2025, 5, 1), to=date(2025, 5, 31)
+                )
+                == {}
+            )
+
+    class Test_get_total_man_hours:
+        def test_指定した期間の集計済みの工数を合計すること(self):
+            rollup = UptimeRollup(
+                covered_from=date(2025, 1, 1),
+                closed_until=date(2025, 5, 20),
+                man_hours_by_tag_day={
+                    "tag1": {
+                        date(2025, 4, 30): 1.0,
+                        date(2025, 5, 1): 2.0,
+                        date(2025, 5, 31): 4.0,
+                    }
+                },
+            )
+
+            assert (
+                rollup.get_total_man_hours("tag1", date(2025, 5, 1), date(2025, 5, 31))
+                == 2.0
+            )
+            assert (
+                rollup.get_total_man_hours("tag2", date(2025, 5, 1), date(2025, 5, 31))
+                == 0.0
+            )
+
+    class Test_get_open_from:
+        def test_開始日時と集計済みの期間の終わりの遅い方を返すこと(self):
+            rollup = UptimeRollup(
+                covered_from=date(2025, 1, 1), closed_until=date(2025, 5, 20)
+            )
+
+            assert rollup.get_open_from(datetime(2025, 5, 1)) == datetime(2025, 5, 20)
+            assert rollup.get_open_from(datetime(2025, 5, 21)) == datetime(2025, 5, 21)
@@ -0,0 +1,90 @@
+from datetime import date
+
+import pytest
+
+from notiontaskr.domain.uptime_series import UptimeBucket, UptimeSeries
+
+
+class TestUptimeBucket:
+    class Test_from_str:
+        def test_有効な文字列を渡すと正しい集計単位を返すこと(self):
+            assert UptimeBucket.from_str("month") == UptimeBucket.MONTH
+            assert UptimeBucket.from_str("week") == UptimeBucket.WEEK
+
+        def test_無効な文字列を渡すとValueErrorを発生させること(self):
+            with pytest.raises(ValueError):
+                UptimeBucket.from_str("day")
+
+    class Test_get_next_start:
+        def test_月の場合は翌月の月初を返すこと(self):
+            assert UptimeBucket.MONTH.get_next_start(date(2024, 12, 15)) == date(
+                2025, 1, 1
+            )
+
+        def test_週の場合は翌週の月曜日を返すこと(self):
+            # 2025/05/01は木曜日
+            assert UptimeBucket.WEEK.get_next_start(date(2025, 5, 1)) == date(
+                2025, 5, 5
+            )
+
+
+class TestUptimeSeries:
+    class Test_get_bucket_ranges:
+        def test_期間を月ごとに区切り両端を期間に切り詰めること(self):
+            assert UptimeSeries.get_bucket_ranges(
+                UptimeBucket.MONTH, date(2025, 1, 15), date(2025, 3, 10)
+            ) == [
+                (date(2025, 1, 15), date(2025, 1, 31)),
+                (date(2025, 2, 1), date(2025, 2, 28)),
+                (date(2025, 3, 1), date(2025, 3, 10)),
+            ]
+
+        def test_期間を月曜始まりの週ごとに区切ること(self):
+            assert UptimeSeries.get_bucket_ranges(
+                UptimeBucket.WEEK, date(2025, 5, 1), date(2025, 5, 12)
+            ) == [
+                (date(2025, 5, 1), date(2025, 5, 4)),
+                (date(2025, 5, 5), date(2025, 5, 11)),
+                (date(2025, 5, 12), date(2025, 5, 12)),
+            ]
+
+    class Test_add:
+        def test_日の工数を区間ごとに合計し工数のない区間は0とすること(self):
+            series = UptimeSeries.from_empty(
+                tags=["tag1", "tag2"],
+                bucket=UptimeBucket.MONTH,
+                from_=date(2025, 1, 1),
+                to=date(2025, 3, 31),
+            )
+
+            series.add(tag="tag1", day=date(2025, 1, 5), man_hours=1.5)
+            series.add(tag="tag1", day=date(2025, 1, 31), man_hours=2)
+            series.add(tag="tag1", day=date(2025, 3, 1), man_hours=1)
+
+            assert series.get_man_hours("tag1") == [
+                (date(2025, 1, 1), date(2025, 1, 31), 3.5),
+                (date(2025, 2, 1), date(2025, 2, 28), 0.0),
+                (date(2025, 3, 1), date(2025, 3, 31), 1.0),
+            ]
+            assert [man_hours for _, _, man_hours in series.get_man_hours("tag2")] == [
+                0.0,
+                0.0,
+                0.0,
+            ]
+
+        def test_対象外のタグや期間外の日は無視すること(self):
+            series = UptimeSeries.from_empty(
+                tags=["tag1"],
+                bucket=UptimeBucket.WEEK,
+                from_=date(2025, 5, 1),
+                to=date(2025, 5, 11),
+            )
+
+            series.add(tag="tag2", day=date(2025, 5, 1), man_hours=1)
+            series.add(tag="tag1", day=date(2025, 4, 30), man_hours=1)
+            series.add(tag="tag1", day=date(2025, 5, 12), man_hours=1)
+
+            assert [man_hours for _, _, man_hours in series.get_man_hours("tag1")] == [
+                0.0,
+                0.0,
+            ]
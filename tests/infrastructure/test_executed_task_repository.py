@@ -0,0 +1,121 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+from notiontaskr.infrastructure.executed_task_repository import ExecutedTaskRepository
+from notiontaskr.infrastructure.operator import StatusOperator
+from notiontaskr.infrastructure.task_search_condition import TaskSearchCondition
+
+
+class TestExecutedTaskRepository:
+    class Test_find_all_by_condition:
+        def test_次のカーソルがなくなるまで非同期に取得を繰り返すこと(self, page_data):
+            client = Mock()
+            client.databases.query = AsyncMock(
+                side_effect=[
+                    {
+                        "results": [page_data(1, is_scheduled=False)],
+                        "next_cursor": "cursor_1",
+                        "has_more": True,
+                    },
+                    {
+                        "results": [page_data(2, is_scheduled=False)],
+                        "next_cursor": None,
+                        "has_more": False,
+                    },
+                ]
+            )
+            repo = ExecutedTaskRepository("token", "db_id", client=client)
+
+            tasks = asyncio.run(
+                repo.find_all_by_condition(
+                    condition=TaskSearchCondition().where_id("1"),
+                    on_error=lambda e, data: None,
+                )
+            )
+
+            assert [task.id.number for task in tasks] == ["1", "2"]
+            assert client.databases.query.await_count == 2
+            assert (
+                client.databases.query.await_args_list[1].kwargs["start_cursor"]
+                == "cursor_1"
+            )
+            assert float(tasks[0].man_hours) == 2.0
+
+    class Test_find_all_by_partitioned_conditions:
+        def test_条件ごとに並列で取得しページIDで重複を除いて結合すること(
+            self, page_data
+        ):
+            async def query(**kwargs):
+                # 取得中の更新で、ページ2が両方の期間に含まれた場合を想定
+                is_first = kwargs["filter"]["and"][1]["property"] == "ID"
+                return {
+                    "results": (
+                        [
+                            page_data(1, is_scheduled=False),
+                            page_data(2, is_scheduled=False),
+                        ]
+                        if is_first
+                        else [
+                            page_data(2, is_scheduled=False),
+                            page_data(3, is_scheduled=False),
+                        ]
+                    ),
+                    "next_cursor": None,
+                    "has_more": False,
+                }
+
+            client = Mock()
+            client.databases.query = AsyncMock(side_effect=query)
+            repo = ExecutedTaskRepository("token", "db_id", client=client)
+
+            tasks = asyncio.run(
+                repo.find_all_by_partitioned_conditions(
+                    conditions=[
+                        TaskSearchCondition().where_id("1"),
+                        TaskSearchCondition().where_status(
+                            operator=StatusOperator.EQUALS, status="未着手"
+                        ),
+                    ],
+                    on_error=lambda e, data: None,
+                )
+            )
+
+            assert [task.id.number for task in tasks] == ["1", "2", "3"]
+            assert client.databases.query.await_count == 2
+
+    class Test_iter_all_by_condition:
+        def test_現在のページを返す間に次のページの取得を開始すること(self, page_data):
+            client = Mock()
+            client.databases.query = AsyncMock(
+                side_effect=[
+                    {
+                        "results": [page_data(1, is_scheduled=False)],
+                        "next_cursor": "cursor_1",
+                        "has_more": True,
+                    },
+                    {
+                        "results": [page_data(2, is_scheduled=False)],
+                        "next_cursor": None,
+                        "has_more": False,
+                    },
+                ]
+            )
+            repo = ExecutedTaskRepository("token", "db_id", client=client)
+
+            async def consume():
+                numbers = []
+                query_counts = []
+                async for task in repo.iter_all_by_condition(
+                    condition=TaskSearchCondition().where_id("1"),
+                    on_error=lambda e, data: None,
+                ):
+                    await asyncio.sleep(0)
+                    numbers.append(task.id.number)
+                    query_counts.append(client.databases.query.await_count)
+                return numbers, query_counts
+
+            numbers, query_counts = asyncio.run(consume())
+
+            assert numbers == ["1", "2"]
+            # 1ページ目を処理している時点で2ページ目を取得している
+            assert query_counts == [2, 2]
@@ -0,0 +1,23 @@
+from notiontaskr.domain.executed_task import ExecutedTask
+from notiontaskr.domain.value_objects.page_id import PageId
+from notiontaskr.domain.value_objects.status import Status
+from notiontaskr.infrastructure.executed_task_update_properties import (
+    ExecutedTaskUpdateProperties,
+)
+
+
+class TestExecutedTaskUpdateProperties:
+    class Test_set_updated_fields:
+        def test_変更された項目のプロパティのみを設定すること(self, page_data):
+            task = ExecutedTask.from_response_data(page_data(1, is_scheduled=False))
+            task.update_status(Status.COMPLETED)
+            task.update_scheduled_task_page_id(PageId("scheduled_page_id"))
+
+            properties = (
+                ExecutedTaskUpdateProperties(task=task).set_updated_fields().build()
+            )
+
+            assert properties == {
+                "ステータス": {"status": {"name": str(Status.COMPLETED)}},
+                "予定タスク": {"relation": [{"id": "scheduled_page_id"}]},
+            }
@@ -0,0 +1,160 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import httpx
+from notion_client.errors import (
+    APIErrorCode,
+    APIResponseError,
+    HTTPResponseError,
+    RequestTimeoutError,
+)
+
+from notiontaskr.infrastructure.notion_request_dispatcher import (
+    BatchResult,
+    NotionRequestDispatcher,
+)
+import pytest
+
+
+def _api_error(status: int, code: APIErrorCode, headers: dict | None = None):
+    return APIResponseError(
+        response=httpx.Response(status_code=status, headers=headers or {}),
+        message="error",
+        code=code,
+    )
+
+
+def _dispatcher(max_in_flight: int = 3, max_retries: int = 3):
+    sleep = AsyncMock()
+    dispatcher = NotionRequestDispatcher(
+        max_in_flight=max_in_flight,
+        token_bucket=Mock(acquire=AsyncMock()),
+        max_retries=max_retries,
+        sleep=sleep,
+    )
+    return dispatcher, sleep
+
+
+class TestNotionRequestDispatcher:
+    class Test_run:
+        def test_成功した場合はリクエストの結果を返すこと(self):
+            dispatcher, _ = _dispatcher()
+            request = AsyncMock(return_value="ok")
+
+            assert asyncio.run(dispatcher.run(request)) == "ok"
+            dispatcher.token_bucket.acquire.assert_awaited_once()
+
+        def test_429の場合はRetryAfterの秒数以上待機してリトライすること(self):
+            dispatcher, sleep = _dispatcher()
+            request = AsyncMock(
+                side_effect=[
+                    _api_error(429, APIErrorCode.RateLimited, {"Retry-After": "2"}),
+                    "ok",
+                ]
+            )
+
+            assert asyncio.run(dispatcher.run(request)) == "ok"
+            assert request.await_count == 2
+            assert sleep.await_args.args[0] >= 2
+            dispatcher.token_bucket.pause.assert_called_once_with(2.0)
+
+        def test_リトライ上限に達した場合は例外を送出すること(self):
+            dispatcher, _ = _dispatcher(max_retries=2)
+            request = AsyncMock(
+                side_effect=_api_error(503, APIErrorCode.ServiceUnavailable)
+            )
+
+            with pytest.raises(APIResponseError):
+                asyncio.run(dispatcher.run(request))
+            assert request.await_count == 3
+
+        def test_リトライ対象外のエラーはリトライせずに送出すること(self):
+            dispatcher, _ = _dispatcher()
+            request = AsyncMock(
+                side_effect=_api_error(400, APIErrorCode.ValidationError)
+            )
+
+            with pytest.raises(APIResponseError):
+                asyncio.run(dispatcher.run(request))
+            assert request.await_count == 1
+
+        def test_タイムアウトの場合はリトライすること(self):
+            dispatcher, _ = _dispatcher()
+            request = AsyncMock(side_effect=[RequestTimeoutError(), "ok"])
+
+            assert asyncio.run(dispatcher.run(request)) == "ok"
+            assert request.await_count == 2
+
+        def test_NotionのエラーコードがないHTTPの5xxの場合はリトライすること(self):
+            dispatcher, _ = _dispatcher()
+            request = AsyncMock(
+                side_effect=[
+                    HTTPResponseError(httpx.Response(status_code=502)),
+                    "ok",
+                ]
+            )
+
+            assert asyncio.run(dispatcher.run(request)) == "ok"
+            assert request.await_count == 2
+
+        def test_HTTPの4xxの場合はリトライしないこと(self):
+            dispatcher, _ = _dispatcher()
+            request = AsyncMock(
+                side_effect=HTTPResponseError(httpx.Response(status_code=404))
+            )
+
+            with pytest.raises(HTTPResponseError):
+                asyncio.run(dispatcher.run(request))
+            assert request.await_count == 1
+
+        def test_リトライ待機中は同時実行枠を解放すること(self):
+            sleep_started = asyncio.Event()
+            release_sleep = asyncio.Event()
+
+            async def sleep(seconds: float):
+                sleep_started.set()
+                await release_sleep.wait()
+
+            dispatcher = NotionRequestDispatcher(
+                max_in_flight=1,
+                token_bucket=Mock(acquire=AsyncMock()),
+                max_retries=1,
+                sleep=sleep,
+            )
+            failing_request = AsyncMock(side_effect=[RequestTimeoutError(), "ok"])
+            other_request = AsyncMock(return_value="other")
+
+            async def run():
+                retrying = asyncio.create_task(dispatcher.run(failing_request))
+                await sleep_started.wait()
+                # 待機中のリクエストがあっても、枠が1つでも他のリクエストを実行できる
+                other = await asyncio.wait_for(dispatcher.run(other_request), 1)
+                release_sleep.set()
+                return other, await retrying
+
+            assert asyncio.run(run()) == ("other", "ok")
+
+        def test_同時実行数が上限を超えないこと(self):
+            dispatcher, _ = _dispatcher(max_in_flight=2)
+            in_flight = 0
+            max_in_flight = 0
+
+            async def request():
+                nonlocal in_flight, max_in_flight
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                await asyncio.sleep(0)
+                in_flight -= 1
+
+            async def run():
+                await asyncio.gather(*[dispatcher.run(request) for _ in range(10)])
+
+            asyncio.run(run())
+
+            assert max_in_flight == 2
+
+
+class TestBatchResult:
+    def test_成否のリストから成功件数と失敗件数を集計すること(self):
+        result = BatchResult.from_results([True, False, True])
+        assert result == BatchResult(success_count=2, failure_count=1)
@@ -0,0 +1,175 @@
+import asyncio
+import os
+from unittest.mock import AsyncMock, Mock
+
+from notiontaskr.domain.value_objects.page_id import PageId
+from notiontaskr.infrastructure.notion_request_dispatcher import BatchResult
+from notiontaskr.infrastructure.page_update_queue import PageUpdateQueue
+
+
+def _name_property(name: str) -> dict:
+    return {"名前": {"title": [{"text": {"content": name}}]}}
+
+
+def _progress_property(rate: float) -> dict:
+    return {"進捗率": {"number": rate}}
+
+
+class TestPageUpdateQueue:
+    class Test_enqueue:
+        def test_同じページの更新はプロパティ単位で統合し後の値で上書きすること(
+            self, tmp_path
+        ):
+            queue = PageUpdateQueue(save_path=os.path.join(tmp_path, "queue.json"))
+
+            queue.enqueue(
+                PageId("page1"), {**_name_property("a"), **_progress_property(0.1)}
+            )
+            queue.enqueue(PageId("page1"), _progress_property(0.5))
+
+            assert len(queue) == 1
+            assert queue.get_properties(PageId("page1")) == {
+                **_name_property("a"),
+                **_progress_property(0.5),
+            }
+
+        def test_空の更新は積まないこと(self, tmp_path):
+            queue = PageUpdateQueue(save_path=os.path.join(tmp_path, "queue.json"))
+
+            queue.enqueue(PageId("page1"), {})
+
+            assert PageId("page1") not in queue
+
+    class Test_merge:
+        def test_他のキューの更新を統合し同じページはこのキューの値を優先すること(
+            self, tmp_path
+        ):
+            queue = PageUpdateQueue(
+                save_path=os.path.join(tmp_path, "queue.json"), clock=lambda: 20
+            )
+            other = PageUpdateQueue(
+                save_path=os.path.join(tmp_path, "other.json"), clock=lambda: 10
+            )
+            queue.enqueue(PageId("page1"), _progress_property(0.5))
+            other.enqueue(
+                PageId("page1"), {**_name_property("a"), **_progress_property(0.1)}
+            )
+            other.enqueue(PageId("page2"), _name_property("b"))
+
+            queue.merge(other)
+
+            assert len(queue) == 2
+            assert queue.get_properties(PageId("page1")) == {
+                **_name_property("a"),
+                **_progress_property(0.5),
+            }
+            assert queue.get_properties(PageId("page2")) == _name_property("b")
+            # 待ち時間は先に積まれたものから数える
+            result = asyncio.run(
+                queue.flush(
+                    update=AsyncMock(), on_error=Mock(), max_concurrency=1, delay=5
+                )
+            )
+            assert result.success_count == 2
+
+    class Test_flush:
+        def test_待ち時間を過ぎたページの最終的な状態のみを1回書き込むこと(
+            self, tmp_path
+        ):
+            clock = Mock(return_value=0.0)
+            queue = PageUpdateQueue(
+                save_path=os.path.join(tmp_path, "queue.json"), clock=clock
+            )
+            queue.enqueue(PageId("page1"), _progress_property(0.1))
+            clock.return_value = 60.0
+            queue.enqueue(PageId("page1"), _progress_property(0.5))
+            queue.enqueue(PageId("page2"), _progress_property(0.2))
+            clock.return_value = 120.0
+            update = AsyncMock()
+
+            result = asyncio.run(
+                queue.flush(
+                    update=update, on_error=Mock(), max_concurrency=2, delay=120
+                )
+            )
+
+            assert result == BatchResult(success_count=1, failure_count=0)
+            update.assert_awaited_once_with(PageId("page1"), _progress_property(0.5))
+            # 待ち時間を過ぎていないページは残る
+            assert PageId("page1") not in queue
+            assert PageId("page2") in queue
+
+        def test_書き込みに失敗したページはキューに残すこと(self, tmp_path):
+            queue = PageUpdateQueue(save_path=os.path.join(tmp_path, "queue.json"))
+            queue.enqueue(PageId("page1"), _progress_property(0.1))
+            error = Exception("error")
+            on_error = Mock()
+
+            result = asyncio.run(
+                queue.flush(
+                    update=AsyncMock(side_effect=error),
+                    on_error=on_error,
+                    max_concurrency=1,
+                )
+            )
+
+            assert result == BatchResult(success_count=0, failure_count=1)
+            on_error.assert_called_once_with(error, PageId("page1"))
+            assert queue.get_properties(PageId("page1")) == _progress_property(0.1)
+
+        def test_書き込み中に積まれた更新はキューに残すこと(self, tmp_path):
+            queue = PageUpdateQueue(save_path=os.path.join(tmp_path, "queue.json"))
+            queue.enqueue(PageId("page1"), _progress_property(0.1))
+
+            async def update(page_id, properties):
+                queue.enqueue(page_id, _progress_property(0.9))
+
+            asyncio.run(queue.flush(update=update, on_error=Mock(), max_concurrency=1))
+
+            assert queue.get_properties(PageId("page1")) == _progress_property(0.9)
+
+        def test_同時に書き込むページ数が上限を超えないこと(self, tmp_path):
+            queue = PageUpdateQueue(save_path=os.path.join(tmp_path, "queue.json"))
+            for i in range(5):
+                queue.enqueue(PageId(f"page{i}"), _progress_property(0.1))
+            in_flight = 0
+            max_in_flight = 0
+
+            async def update(page_id, properties):
+                nonlocal in_flight, max_in_flight
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                await asyncio.sleep(0)
+                in_flight -= 1
+
+            result = asyncio.run(
+                queue.flush(update=update, on_error=Mock(), max_concurrency=2)
+            )
+
+            assert result == BatchResult(success_count=5, failure_count=0)
+            assert max_in_flight == 2
+            assert len(queue) == 0
+
+    class Test_save:
+        def test_保存したキューを読み込めること(self, tmp_path):
+            save_path = os.path.join(tmp_path, "queue.json")
+            queue = PageUpdateQueue(save_path=save_path, clock=Mock(return_value=10.0))
+            queue.enqueue(PageId("page1"), _name_property("タスク"))
+
+            queue.save()
+            loaded_queue = PageUpdateQueue(
+                save_path=save_path, clock=Mock(return_value=10.0)
+            )
+            loaded_queue.load()
+
+            assert loaded_queue.get_properties(PageId("page1")) == _name_property(
+                "タスク"
+            )
+
+        def test_ファイルがない場合は空のキューになること(self, tmp_path):
+            queue = PageUpdateQueue(save_path=os.path.join(tmp_path, "queue.json"))
+            queue.enqueue(PageId("page1"), _progress_property(0.1))
+
+            queue.load()
+
+            assert len(queue) == 0
@@ -0,0 +1,133 @@
+import os
+import pickle
+
+from notiontaskr.domain.scheduled_task import ScheduledTask
+from notiontaskr.domain.value_objects.notion_id import NotionId
+from notiontaskr.infrastructure.scheduled_task_cache import ScheduledTaskCache
+import pytest
+
+
+@pytest.fixture
+def cache(tmp_path) -> ScheduledTaskCache:
+    return ScheduledTaskCache(
+        save_path=os.path.join(tmp_path, "scheduled_task.pkl"),
+        delta_dir=os.path.join(tmp_path, "deltas"),
+    )
+
+
+class TestScheduledTaskCache:
+    class Test_load:
+        def test_スナップショットがない場合FileNotFoundErrorが発生すること(
+            self, cache: ScheduledTaskCache
+        ):
+            with pytest.raises(FileNotFoundError):
+                cache.load()
+
+        def test_スナップショットに差分を保存順に適用すること(
+            self, cache: ScheduledTaskCache, page_data
+        ):
+            cache.save(
+                [
+                    ScheduledTask.from_response_data(page_data(1, is_scheduled=True)),
+                    ScheduledTask.from_response_data(page_data(2, is_scheduled=True)),
+                ]
+            )
+            cache.save_delta(
+                [
+                    ScheduledTask.from_response_data(
+                        page_data(2, is_scheduled=True, name="変更1")
+                    )
+                ]
+            )
+            cache.save_delta(
+                [
+                    ScheduledTask.from_response_data(
+                        page_data(2, is_scheduled=True, name="変更2")
+                    ),
+                    ScheduledTask.from_response_data(page_data(3, is_scheduled=True)),
+                ]
+            )
+
+            tasks_by_id = {task.id: task for task in cache.load()}
+
+            # 差分に含まれないタスクも失われないこと
+            assert len(tasks_by_id) == 3
+            assert tasks_by_id[NotionId("1")].name.task_name == "タスク1"
+            assert tasks_by_id[NotionId("2")].name.task_name == "変更2"
+
+        def test_親タスクのサブアイテムが差分の予定タスクに張り替えられること(
+            self, cache: ScheduledTaskCache, page_data
+        ):
+            parent = ScheduledTask.from_response_data(page_data(1, is_scheduled=True))
+            child = ScheduledTask.from_response_data(page_data(2, is_scheduled=True))
+            parent.update_sub_tasks([child])
+            cache.save([parent, child])
+            cache.save_delta(
+                [
+                    ScheduledTask.from_response_data(
+                        page_data(2, is_scheduled=True, name="変更")
+                    )
+                ]
+            )
+
+            tasks_by_id = {task.id: task for task in cache.load()}
+
+            sub_task = tasks_by_id[NotionId("1")].sub_tasks[0]
+            assert sub_task is tasks_by_id[NotionId("2")]
+            assert sub_task.name.task_name == "変更"
+
+        def test_旧形式のpickleのスナップショットも読み込めること(
+            self, cache: ScheduledTaskCache, page_data
+        ):
+            parent = ScheduledTask.from_response_data(page_data(1, is_scheduled=True))
+            child = ScheduledTask.from_response_data(page_data(2, is_scheduled=True))
+            parent.update_sub_tasks([child])
+            with open(cache.save_path, "wb") as f:
+                pickle.dump([parent, child], f)
+
+            tasks_by_id = {task.id: task for task in cache.load()}
+
+            assert len(tasks_by_id) == 2
+            assert tasks_by_id[NotionId("1")].sub_tasks[0] is tasks_by_id[NotionId("2")]
+
+    class Test_delete_deltas:
+        def test_削除した差分は読み込み時に適用されないこと(
+            self, cache: ScheduledTaskCache, page_data
+        ):
+            cache.save(
+                [ScheduledTask.from_response_data(page_data(1, is_scheduled=True))]
+            )
+            path = cache.save_delta(
+                [
+                    ScheduledTask.from_response_data(
+                        page_data(1, is_scheduled=True, name="変更")
+                    )
+                ]
+            )
+
+            cache.delete_deltas([os.path.basename(path)])
+
+            assert cache.get_delta_names() == []
+            assert cache.load()[0].name.task_name == "タスク1"
+
+    class Test_generation:
+        def test_記録した世代を取得できること(
+            self, cache: ScheduledTaskCache, page_data
+        ):
+            cache.save(
+                [ScheduledTask.from_response_data(page_data(1, is_scheduled=True))]
+            )
+            cache.save_generation(10)
+
+            assert cache.get_generation() == 10
+
+        def test_スナップショットを保存すると記録した世代が破棄されること(
+            self, cache: ScheduledTaskCache, page_data
+        ):
+            tasks = [ScheduledTask.from_response_data(page_data(1, is_scheduled=True))]
+            cache.save(tasks)
+            cache.save_generation(10)
+
+            cache.save(tasks)
+
+            assert cache.get_generation() is None
@@ -0,0 +1,117 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+from notiontaskr.domain.scheduled_task import ScheduledTask
+from notiontaskr.infrastructure.scheduled_task_repository import (
+    ScheduledTaskRepository,
+)
+from notiontaskr.infrastructure.task_search_condition import TaskSearchCondition
+
+
+class TestScheduledTaskRepository:
+    class Test_find_by_condition:
+        def test_非同期クライアントのレスポンスを予定タスクに変換すること(
+            self, page_data
+        ):
+            client = Mock()
+            client.databases.query = AsyncMock(
+                return_value={
+                    "results": [
+                        page_data(1, is_scheduled=True),
+                        page_data(2, is_scheduled=True),
+                    ]
+                }
+            )
+            repo = ScheduledTaskRepository("token", "db_id", client=client)
+
+            tasks = asyncio.run(
+                repo.find_by_condition(
+                    condition=TaskSearchCondition().where_id("1"),
+                    on_error=lambda e, data: None,
+                )
+            )
+
+            assert [task.id.number for task in tasks] == ["1", "2"]
+            client.databases.query.assert_awaited_once()
+
+        def test_gatherした複数のクエリが並行して実行されること(self, page_data):
+            in_flight = 0
+            both_in_flight = asyncio.Event()
+
+            async def query(**kwargs):
+                nonlocal in_flight
+                in_flight += 1
+                if in_flight == 2:
+                    both_in_flight.set()
+                # 逐次実行の場合は2件目が開始されずタイムアウトする
+                await asyncio.wait_for(both_in_flight.wait(), timeout=1)
+                return {"results": [page_data(1, is_scheduled=True)]}
+
+            client = Mock()
+            client.databases.query = query
+            repo = ScheduledTaskRepository("token", "db_id", client=client)
+
+            async def run():
+                return await asyncio.gather(
+                    repo.find_by_condition(
+                        condition=TaskSearchCondition().where_id("1"),
+                        on_error=lambda e, data: None,
+                    ),
+                    repo.find_by_condition(
+                        condition=TaskSearchCondition().where_id("1"),
+                        on_error=lambda e, data: None,
+                    ),
+                )
+
+            results = asyncio.run(run())
+
+            assert len(results) == 2
+
+    class Test_update:
+        def test_ページ更新がawaitされon_successが呼び出されること(self, page_data):
+            client = Mock()
+            client.databases.query = AsyncMock(
+                return_value={"results": [page_data(1, is_scheduled=True)]}
+            )
+            client.pages.update = AsyncMock()
+            repo = ScheduledTaskRepository("token", "db_id", client=client)
+            task = asyncio.run(
+                repo.find_by_condition(
+                    condition=TaskSearchCondition().where_id("1"),
+                    on_error=lambda e, data: None,
+                )
+            )[0]
+            on_success = Mock()
+
+            asyncio.run(
+                repo.update(
+                    scheduled_task=task,
+                    on_success=on_success,
+                    on_error=lambda e, t: None,
+                )
+            )
+
+            client.pages.update.assert_awaited_once()
+            on_success.assert_called_once_with(task)
+
+        def test_変更されたプロパティがない場合はページを更新しないこと(
+            self, page_data
+        ):
+            client = Mock()
+            client.pages.update = AsyncMock()
+            repo = ScheduledTaskRepository("token", "db_id", client=client)
+            task = ScheduledTask.from_response_data(page_data(1, is_scheduled=True))
+            task.updated_fields.clear()
+            on_success = Mock()
+
+            result = asyncio.run(
+                repo.update(
+                    scheduled_task=task,
+                    on_success=on_success,
+                    on_error=lambda e, t: None,
+                )
+            )
+
+            assert result is True
+            client.pages.update.assert_not_awaited()
+            on_success.assert_called_once_with(task)
@@ -0,0 +1,65 @@
+import zlib
+
+from notiontaskr.domain.executed_task import ExecutedTask
+from notiontaskr.domain.name_labels.man_hours_label import ManHoursLabel
+from notiontaskr.domain.name_labels.parent_id_label import ParentIdLabel
+from notiontaskr.domain.scheduled_task import ScheduledTask
+from notiontaskr.domain.value_objects.man_hours import ManHours
+from notiontaskr.domain.value_objects.notion_id import NotionId
+from notiontaskr.infrastructure.scheduled_task_serializer import (
+    MAGIC,
+    ScheduledTaskSerializer,
+)
+import pytest
+
+
+class TestScheduledTaskSerializer:
+    class Test_serialize:
+        def test_変換したバイト列から同じ内容の予定タスクを復元できること(
+            self, page_data
+        ):
+            parent = ScheduledTask.from_response_data(
+                page_data(1, is_scheduled=True, tags=["タグ1", "タグ2"])
+            )
+            child = ScheduledTask.from_response_data(page_data(2, is_scheduled=True))
+            executed_task = ExecutedTask.from_response_data(
+                page_data(3, is_scheduled=False)
+            )
+            parent.update_sub_tasks([child])
+            parent.update_executed_tasks([executed_task])
+            parent.update_man_hours_label(
+                ManHoursLabel.from_man_hours(
+                    scheduled_man_hours=ManHours(1), executed_man_hours=ManHours(2)
+                )
+            )
+            child.update_parent_id_label(ParentIdLabel.from_property(parent.id))
+
+            entries = ScheduledTaskSerializer.deserialize(
+                ScheduledTaskSerializer.serialize([parent, child])
+            )
+
+            (restored_parent, sub_task_ids), (restored_child, _) = entries
+            assert restored_parent.name == parent.name
+            assert restored_parent.tags == ["タグ1", "タグ2"]
+            assert restored_parent.page_id == parent.page_id
+            assert restored_parent.scheduled_man_hours == parent.scheduled_man_hours
+            assert restored_parent.executed_tasks[0].name == executed_task.name
+            assert restored_parent.executed_tasks[0].date == executed_task.date
+            assert restored_parent.executed_tasks[0].man_hours == ManHours(2)
+            assert sub_task_ids == [NotionId("2")]
+            assert restored_child.name == child.name
+            # サブアイテムは読み込み側で張り直す
+            assert restored_parent.sub_tasks == []
+
+    class Test_deserialize:
+        def test_未対応のスキーマバージョンの場合ValueErrorが発生すること(self):
+            data = MAGIC + bytes([99, 1]) + zlib.compress(b"[]")
+
+            with pytest.raises(ValueError):
+                ScheduledTaskSerializer.deserialize(data)
+
+        def test_本クラスで変換していないバイト列の場合ValueErrorが発生すること(
+            self,
+        ):
+            with pytest.raises(ValueError):
+                ScheduledTaskSerializer.deserialize(b"not serialized")
@@ -0,0 +1,34 @@
+from notiontaskr.domain.scheduled_task import ScheduledTask
+from notiontaskr.domain.value_objects.man_hours import ManHours
+from notiontaskr.domain.value_objects.progress_rate import ProgressRate
+from notiontaskr.infrastructure.scheduled_task_update_properties import (
+    ScheduledTaskUpdateProperties,
+)
+
+
+class TestScheduledTaskUpdateProperties:
+    class Test_set_updated_fields:
+        def test_変更された項目のプロパティのみを設定すること(self, page_data):
+            task = ScheduledTask.from_response_data(page_data(1, is_scheduled=True))
+            task.updated_fields.clear()
+            task.update_executed_man_hours(ManHours(3))
+            task.update_progress_rate(ProgressRate(0.5))
+
+            properties = (
+                ScheduledTaskUpdateProperties(task=task).set_updated_fields().build()
+            )
+
+            assert properties == {
+                "人時(実)": {"number": 3.0},
+                "進捗率": {"number": 0.5},
+            }
+
+        def test_変更がない場合は空の辞書を返すこと(self, page_data):
+            task = ScheduledTask.from_response_data(page_data(1, is_scheduled=True))
+            task.updated_fields.clear()
+
+            properties = (
+                ScheduledTaskUpdateProperties(task=task).set_updated_fields().build()
+            )
+
+            assert properties == {}
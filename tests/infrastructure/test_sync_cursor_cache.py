@@ -0,0 +1,28 @@
+import os
+from datetime import datetime, timezone
+
+import pytest
+
+from notiontaskr.domain.sync_cursor import SyncCursor
+from notiontaskr.infrastructure.sync_cursor_cache import SyncCursorCache
+
+
+class TestSyncCursorCache:
+    def test_保存したカーソルを読み込めること(self, tmp_path):
+        cache = SyncCursorCache(save_path=os.path.join(tmp_path, "cursor.json"))
+        cursor = SyncCursor(
+            last_edited_time=datetime(2025, 5, 1, 12, 5, tzinfo=timezone.utc),
+            processed_pages={
+                "page1": datetime(2025, 5, 1, 12, 5, tzinfo=timezone.utc),
+            },
+        )
+
+        cache.save(cursor)
+
+        assert cache.load() == cursor
+
+    def test_ファイルがない場合FileNotFoundErrorが発生すること(self, tmp_path):
+        cache = SyncCursorCache(save_path=os.path.join(tmp_path, "cursor.json"))
+
+        with pytest.raises(FileNotFoundError):
+            cache.load()
@@ -0,0 +1,161 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from notiontaskr.domain.executed_task import ExecutedTask
+from notiontaskr.domain.scheduled_task import ScheduledTask
+from notiontaskr.domain.value_objects.page_id import PageId
+from notiontaskr.infrastructure.task_repository import TaskRepository
+from notiontaskr.infrastructure.task_search_condition import TaskSearchCondition
+
+
+class TestTaskRepository:
+    class Test_find_all_by_condition:
+        def test_予定フラグで絞り込まずに取得し予定フラグに応じて変換すること(
+            self, page_data
+        ):
+            client = Mock()
+            client.databases.query = AsyncMock(
+                return_value={
+                    "results": [
+                        page_data(1, is_scheduled=True),
+                        page_data(2, is_scheduled=False),
+                    ],
+                    "next_cursor": None,
+                    "has_more": False,
+                }
+            )
+            repo = TaskRepository("token", "db_id", client=client)
+
+            tasks = asyncio.run(
+                repo.find_all_by_condition(
+                    condition=TaskSearchCondition().where_id("1"),
+                    on_error=lambda e, data: None,
+                )
+            )
+
+            assert isinstance(tasks[0], ScheduledTask)
+            assert isinstance(tasks[1], ExecutedTask)
+            assert client.databases.query.await_args.kwargs["filter"] == {
+                "property": "ID",
+                "unique_id": {"equals": "1"},
+            }
+
+    class Test_find_by_page_id:
+        def test_予定フラグに応じて変換すること(self, page_data):
+            client = Mock()
+            client.pages.retrieve = AsyncMock(
+                return_value=page_data(2, is_scheduled=False)
+            )
+            client.databases.retrieve = AsyncMock(side_effect=Exception("error"))
+            repo = TaskRepository("token", "db_id", client=client)
+
+            task = asyncio.run(repo.find_by_page_id(PageId("page_id_2")))
+
+            assert isinstance(task, ExecutedTask)
+            client.pages.retrieve.assert_awaited_once_with(page_id="page_id_2")
+
+        def test_取得に失敗した場合RuntimeErrorが発生すること(self):
+            client = Mock()
+            client.pages.retrieve = AsyncMock(side_effect=Exception("error"))
+            client.databases.retrieve = AsyncMock(side_effect=Exception("error"))
+            repo = TaskRepository("token", "db_id", client=client)
+
+            with pytest.raises(RuntimeError):
+                asyncio.run(repo.find_by_page_id(PageId("page_id_1")))
+
+    class Test_filter_properties:
+        def test_読み込むプロパティのIDのみを指定しスキーマの取得は一度だけ行うこと(
+            self, page_data
+        ):
+            client = Mock()
+            client.databases.retrieve = AsyncMock(
+                return_value={
+                    "properties": {
+                        name: {"id": f"id_{i}"}
+                        for i, name in enumerate(
+                            list(TaskRepository.property_names) + ["未使用"]
+                        )
+                    }
+                }
+            )
+            client.databases.query = AsyncMock(
+                side_effect=[
+                    {
+                        "results": [page_data(1, is_scheduled=True)],
+                        "next_cursor": "cursor_1",
+                        "has_more": True,
+                    },
+                    {
+                        "results": [page_data(2, is_scheduled=False)],
+                        "next_cursor": None,
+                        "has_more": False,
+                    },
+                ]
+            )
+            repo = TaskRepository("token", "db_id", client=client)
+
+            asyncio.run(
+                repo.find_all_by_condition(
+                    condition=TaskSearchCondition().where_id("1"),
+                    on_error=lambda e, data: None,
+                )
+            )
+
+            client.databases.retrieve.assert_awaited_once_with(database_id="db_id")
+            for await_args in client.databases.query.await_args_list:
+                assert await_args.kwargs["filter_properties"] == [
+                    f"id_{i}" for i in range(len(TaskRepository.property_names))
+                ]
+
+        def test_スキーマの取得に失敗した場合は全てのプロパティを取得すること(
+            self, page_data
+        ):
+            client = Mock()
+            client.databases.retrieve = AsyncMock(side_effect=Exception("error"))
+            client.databases.query = AsyncMock(
+                return_value={"results": [], "next_cursor": None, "has_more": False}
+            )
+            repo = TaskRepository("token", "db_id", client=client)
+
+            asyncio.run(
+                repo.find_all_by_condition(
+                    condition=TaskSearchCondition().where_id("1"),
+                    on_error=lambda e, data: None,
+                )
+            )
+
+            assert "filter_properties" not in client.databases.query.await_args.kwargs
+
+        def test_スキーマの取得に失敗した場合は以降の取得で問い合わせ直さないこと(
+            self,
+        ):
+            client = Mock()
+            client.databases.retrieve = AsyncMock(side_effect=Exception("error"))
+            client.databases.query = AsyncMock(
+                return_value={"results": [], "next_cursor": None, "has_more": False}
+            )
+            repo = TaskRepository("token", "db_id", client=client)
+
+            for _ in range(2):
+                asyncio.run(
+                    repo.find_all_by_condition(
+                        condition=TaskSearchCondition().where_id("1"),
+                        on_error=lambda e, data: None,
+                    )
+                )
+
+            client.databases.retrieve.assert_awaited_once_with(database_id="db_id")
+            for await_args in client.databases.query.await_args_list:
+                assert "filter_properties" not in await_args.kwargs
+
+    class Test_property_names:
+        def test_予定タスクと実績タスクの変換に必要なプロパティを全て含むこと(
+            self, page_data
+        ):
+            properties = set(page_data(1, is_scheduled=True)["properties"]) | set(
+                page_data(2, is_scheduled=False)["properties"]
+            )
+
+            assert set(TaskRepository.property_names) == properties
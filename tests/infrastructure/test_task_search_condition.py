@@ -0,0 +1,59 @@
+from datetime import datetime
+
+import pytest
+
+from notiontaskr.infrastructure.task_search_condition import TaskSearchCondition
+
+
+class TestTaskSearchCondition:
+    class Test_where_any_tag:
+        def test_タグごとのcontains条件をorで結合すること(self):
+            condition = TaskSearchCondition().where_any_tag(["tag1", "tag2"])
+
+            assert condition.build() == {
+                "or": [
+                    {"property": "タグ", "multi_select": {"contains": "tag1"}},
+                    {"property": "タグ", "multi_select": {"contains": "tag2"}},
+                ]
+            }
+
+        def test_タグが空の場合はValueErrorを送出すること(self):
+            with pytest.raises(ValueError):
+                TaskSearchCondition().where_any_tag([])
+
+    class Test_split_last_edited_time:
+        def test_重ならない期間に分割し最後の期間は終わりを指定しないこと(self):
+            conditions = TaskSearchCondition.split_last_edited_time(
+                from_=datetime(2025, 1, 1),
+                to=datetime(2025, 1, 3),
+                partition_count=2,
+            )
+
+            assert [condition.build() for condition in conditions] == [
+                {
+                    "and": [
+                        {
+                            "property": "最終更新日時",
+                            "last_edited_time": {
+                                "on_or_after": "2025-01-01T00:00:00.000Z"
+                            },
+                        },
+                        {
+                            "property": "最終更新日時",
+                            "last_edited_time": {"before": "2025-01-02T00:00:00.000Z"},
+                        },
+                    ]
+                },
+                {
+                    "property": "最終更新日時",
+                    "last_edited_time": {"on_or_after": "2025-01-02T00:00:00.000Z"},
+                },
+            ]
+
+        def test_分割数が1未満の場合はValueErrorを送出すること(self):
+            with pytest.raises(ValueError):
+                TaskSearchCondition.split_last_edited_time(
+                    from_=datetime(2025, 1, 1),
+                    to=datetime(2025, 1, 3),
+                    partition_count=0,
+                )
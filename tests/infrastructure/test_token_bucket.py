@@ -0,0 +1,62 @@
+import asyncio
+
+from notiontaskr.infrastructure.token_bucket import TokenBucket
+import pytest
+
+
+class FakeClock:
+    """sleepした分だけ時間が進む時計"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestTokenBucket:
+    class Test___init__:
+        def test_rateが0以下の場合ValueErrorが発生すること(self):
+            with pytest.raises(ValueError):
+                TokenBucket(rate=0, capacity=1)
+
+    class Test_acquire:
+        def test_容量分のトークンは待機せずに取得できること(self):
+            clock = FakeClock()
+            bucket = TokenBucket(rate=3, capacity=3, clock=clock, sleep=clock.sleep)
+
+            async def run():
+                for _ in range(3):
+                    await bucket.acquire()
+
+            asyncio.run(run())
+
+            assert clock.sleeps == []
+
+        def test_容量を超えるとレートに応じて待機すること(self):
+            clock = FakeClock()
+            bucket = TokenBucket(rate=3, capacity=3, clock=clock, sleep=clock.sleep)
+
+            async def run():
+                for _ in range(9):
+                    await bucket.acquire()
+
+            asyncio.run(run())
+
+            # 3件は即時、残り6件は1/3秒ごとに取得される
+            assert clock.now == pytest.approx(2.0)
+
+    class Test_pause:
+        def test_停止した秒数が経過するまでトークンを取得できないこと(self):
+            clock = FakeClock()
+            bucket = TokenBucket(rate=3, capacity=3, clock=clock, sleep=clock.sleep)
+            bucket.pause(5)
+
+            asyncio.run(bucket.acquire())
+
+            assert clock.now == pytest.approx(5 + 1 / 3)
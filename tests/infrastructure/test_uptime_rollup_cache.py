@@ -0,0 +1,27 @@
+import os
+from datetime import date
+
+import pytest
+
+from notiontaskr.domain.uptime_rollup import UptimeRollup
+from notiontaskr.infrastructure.uptime_rollup_cache import UptimeRollupCache
+
+
+class TestUptimeRollupCache:
+    def test_保存した集計を読み込めること(self, tmp_path):
+        cache = UptimeRollupCache(save_path=os.path.join(tmp_path, "rollup.json"))
+        rollup = UptimeRollup(
+            covered_from=date(2025, 1, 1),
+            closed_until=date(2025, 5, 20),
+            man_hours_by_tag_day={"タグ": {date(2025, 5, 1): 1.5}},
+        )
+
+        cache.save(rollup)
+
+        assert cache.load() == rollup
+
+    def test_ファイルがない場合FileNotFoundErrorが発生すること(self, tmp_path):
+        cache = UptimeRollupCache(save_path=os.path.join(tmp_path, "rollup.json"))
+
+        with pytest.raises(FileNotFoundError):
+            cache.load()
@@ -0,0 +1,175 @@
+import hashlib
+import hmac
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from starlette.testclient import TestClient
+
+from notiontaskr.application.dto.uptime_data import (
+    UptimeDataByTag,
+    UptimeSeriesByTag,
+)
+from notiontaskr.asgi_service import app
+from notiontaskr.domain.uptime_series import UptimeBucket
+from notiontaskr.domain.value_objects.page_id import PageId
+
+
+@pytest.fixture
+def client():
+    with TestClient(app) as client:
+        yield client
+
+
+class TestAsgiService:
+    class Test_get_uptime_from_month:
+        def test_共有のサービスで稼働実績を取得しJSONで返すこと(self, client):
+            service = app.state.service
+            service.get_uptime = AsyncMock(return_value=UptimeDataByTag.from_empty())
+
+            response = client.get(
+                "/uptime_from_month",
+                params={"tags": ["tag1"], "year": 2025, "month": 5},
+            )
+
+            assert response.status_code == 200
+            assert response.headers["content-type"] == "application/json"
+            assert response.text == UptimeDataByTag.from_empty().to_json()
+            assert service.get_uptime.await_args.kwargs["tags"] == ["tag1"]
+            # リクエストをまたいで同じサービス(コネクションプール)を使う
+            client.get(
+                "/uptime_from_month",
+                params={"tags": ["tag1"], "year": 2025, "month": 6},
+            )
+            assert app.state.service is service
+            assert service.get_uptime.await_count == 2
+
+        def test_パラメータが不足している場合は400を返すこと(self, client):
+            response = client.get("/uptime_from_month", params={"tags": ["tag1"]})
+
+            assert response.status_code == 400
+
+    class Test_get_uptime_series:
+        def test_期間と区間の単位を渡して時系列をJSONで返すこと(self, client):
+            service = app.state.service
+            service.get_uptime_series = AsyncMock(
+                return_value=UptimeSeriesByTag.from_empty()
+            )
+
+            response = client.get(
+                "/uptime_series",
+                params={
+                    "tags": ["tag1", "tag2"],
+                    "from": "2025-01-01",
+                    "to": "2025-12-31",
+                    "bucket": "week",
+                },
+            )
+
+            assert response.status_code == 200
+            assert response.text == UptimeSeriesByTag.from_empty().to_json()
+            service.get_uptime_series.assert_awaited_once_with(
+                from_=datetime(2025, 1, 1),
+                to=datetime(2025, 12, 31, 23, 59),
+                tags=["tag1", "tag2"],
+                bucket=UptimeBucket.WEEK,
+            )
+
+        def test_区間の単位を省略した場合は月ごとに集計すること(self, client):
+            service = app.state.service
+            service.get_uptime_series = AsyncMock(
+                return_value=UptimeSeriesByTag.from_empty()
+            )
+
+            client.get(
+                "/uptime_series",
+                params={"tags": ["tag1"], "from": "2025-01-01", "to": "2025-12-31"},
+            )
+
+            assert (
+                service.get_uptime_series.await_args.kwargs["bucket"]
+                == UptimeBucket.MONTH
+            )
+
+        @pytest.mark.parametrize(
+            "params",
+            [
+                {"tags": ["tag1"], "from": "2025-01-01"},
+                {"tags": ["tag1"], "from": "2025/01/01", "to": "2025-12-31"},
+                {
+                    "tags": ["tag1"],
+                    "from": "2025-01-01",
+                    "to": "2025-12-31",
+                    "bucket": "day",
+                },
+            ],
+        )
+        def test_パラメータが不正な場合は400を返すこと(self, client, params):
+            response = client.get("/uptime_series", params=params)
+
+            assert response.status_code == 400
+
+    class Test_receive_notion_webhook:
+        def test_署名が正しい場合はページIDをワーカーに通知すること(self, client):
+            app.state.page_change_worker.notify = Mock()
+            body = b'{"type":"page.properties_updated","entity":{"id":"page1","type":"page"}}'
+            signature = (
+                "sha256=" + hmac.new(b"secret", body, hashlib.sha256).hexdigest()
+            )
+
+            with patch(
+                "notiontaskr.asgi_service.config.NOTION_WEBHOOK_VERIFICATION_TOKEN",
+                "secret",
+            ):
+                response = client.post(
+                    "/notion-webhook",
+                    content=body,
+                    headers={"X-Notion-Signature": signature},
+                )
+
+            assert response.status_code == 200
+            app.state.page_change_worker.notify.assert_called_once_with(PageId("page1"))
+
+        def test_署名が不正な場合は401を返すこと(self, client):
+            app.state.page_change_worker.notify = Mock()
+
+            with patch(
+                "notiontaskr.asgi_service.config.NOTION_WEBHOOK_VERIFICATION_TOKEN",
+                "secret",
+            ):
+                response = client.post(
+                    "/notion-webhook",
+                    content=b'{"type":"page.created"}',
+                    headers={"X-Notion-Signature": "sha256=invalid"},
+                )
+
+            assert response.status_code == 401
+            app.state.page_change_worker.notify.assert_not_called()
+
+        def test_トークンが未設定の場合は検証リクエストのトークンを記録すること(
+            self, client
+        ):
+            with patch(
+                "notiontaskr.asgi_service.config.NOTION_WEBHOOK_VERIFICATION_TOKEN",
+                None,
+            ), patch.object(app.state.service, "logger") as logger:
+                response = client.post(
+                    "/notion-webhook", json={"verification_token": "token1"}
+                )
+
+            assert response.status_code == 200
+            logger.info.assert_called_once_with("Webhookの検証トークン: token1")
+
+        def test_トークンが設定済みの場合は署名のない検証リクエストに401を返すこと(
+            self, client
+        ):
+            with patch(
+                "notiontaskr.asgi_service.config.NOTION_WEBHOOK_VERIFICATION_TOKEN",
+                "secret",
+            ), patch.object(app.state.service, "logger") as logger:
+                response = client.post(
+                    "/notion-webhook", json={"verification_token": "token1"}
+                )
+
+            assert response.status_code == 401
+            logger.info.assert_not_called()
@@ -0,0 +1,107 @@
+import os
+from unittest.mock import Mock, patch
+
+from google.api_core.exceptions import PreconditionFailed
+
+from notiontaskr.gcs_handler import GCSHandler, GenerationMismatchError
+import pytest
+
+
+@pytest.fixture
+def gcs_handler() -> GCSHandler:
+    with patch("notiontaskr.gcs_handler.storage.Client"):
+        handler = GCSHandler(bucket_name="bucket", on_error=lambda e: None)
+    handler.bucket = Mock()
+    return handler
+
+
+class TestGCSHandler:
+    class Test_upload:
+        def test_指定した世代の場合のみアップロードし新しい世代を返すこと(
+            self, gcs_handler: GCSHandler, tmp_path
+        ):
+            path = os.path.join(tmp_path, "queue.json")
+            open(path, "w").close()
+            blob = gcs_handler.bucket.blob.return_value  # type: ignore
+            blob.generation = 11
+
+            assert gcs_handler.upload(path, "/queue.json", if_generation_match=10) == 11
+            blob.upload_from_filename.assert_called_once_with(
+                path, if_generation_match=10
+            )
+
+        def test_世代が一致しない場合GenerationMismatchErrorが発生すること(
+            self, gcs_handler: GCSHandler, tmp_path
+        ):
+            path = os.path.join(tmp_path, "queue.json")
+            open(path, "w").close()
+            blob = gcs_handler.bucket.blob.return_value  # type: ignore
+            blob.upload_from_filename.side_effect = PreconditionFailed("mismatch")
+
+            with pytest.raises(GenerationMismatchError):
+                gcs_handler.upload(path, "/queue.json", if_generation_match=10)
+
+    class Test_download_if_updated:
+        def test_世代が一致しローカルにファイルがある場合はダウンロードしないこと(
+            self, gcs_handler: GCSHandler, tmp_path
+        ):
+            to = os.path.join(tmp_path, "cache.pkl")
+            open(to, "wb").close()
+            blob = Mock(generation=10)
+            gcs_handler.bucket.get_blob.return_value = blob  # type: ignore
+
+            generation = gcs_handler.download_if_updated(
+                from_="/cache.pkl", to=to, generation=10
+            )
+
+            assert generation == 10
+            blob.download_to_filename.assert_not_called()
+
+        def test_世代が異なる場合は比較した世代をダウンロードすること(
+            self, gcs_handler: GCSHandler, tmp_path
+        ):
+            to = os.path.join(tmp_path, "cache.pkl")
+            open(to, "wb").close()
+            blob = Mock(generation=11)
+            gcs_handler.bucket.get_blob.return_value = blob  # type: ignore
+
+            generation = gcs_handler.download_if_updated(
+                from_="/cache.pkl", to=to, generation=10
+            )
+
+            assert generation == 11
+            blob.download_to_filename.assert_called_once_with(
+                to, if_generation_match=11
+            )
+
+        def test_ローカルにファイルがない場合は世代が一致してもダウンロードすること(
+            self, gcs_handler: GCSHandler, tmp_path
+        ):
+            to = os.path.join(tmp_path, "cache.pkl")
+            blob = Mock(generation=10)
+            gcs_handler.bucket.get_blob.return_value = blob  # type: ignore
+
+            gcs_handler.download_if_updated(from_="/cache.pkl", to=to, generation=10)
+
+            blob.download_to_filename.assert_called_once()
+
+        def test_GCSにファイルがない場合FileNotFoundErrorが発生すること(
+            self, gcs_handler: GCSHandler, tmp_path
+        ):
+            gcs_handler.bucket.get_blob.return_value = None  # type: ignore
+
+            with pytest.raises(FileNotFoundError):
+                gcs_handler.download_if_updated(
+                    from_="/cache.pkl",
+                    to=os.path.join(tmp_path, "cache.pkl"),
+                    generation=None,
+                )
+
+    class Test_get_generation:
+        def test_ファイルの世代を返しファイルがない場合はNoneを返すこと(
+            self, gcs_handler: GCSHandler
+        ):
+            gcs_handler.bucket.get_blob.side_effect = [Mock(generation=10), None]  # type: ignore
+
+            assert gcs_handler.get_generation("/cache.pkl") == 10
+            assert gcs_handler.get_generation("/cache.pkl") is None
@@ -1,6 +1,7 @@
 from datetime import datetime
 
 from notiontaskr.util.converter import (
+    date_str_to_start_end,
     dt_to_month_start_end,
     remove_variant_selectors,
     to_isoformat,
@@ -39,6 +40,11 @@ class Test_remove_variant_selectors:
         result = remove_variant_selectors(text)
         assert result == "⏲"
 
+    def test_バリアントセレクタ以外の文字は変更しないこと(self):
+        text = "⏱\ufe0e1/2 タスク名\ufe0f"
+        result = remove_variant_selectors(text)
+        assert result == "⏱1/2 タスク名"
+
 
 class Test_dt_to_month_start_end:
     def test_引数で年月を指定すると月初と月末を取得できること(self):
@@ -52,3 +58,14 @@ class Test_dt_to_month_start_end:
         start, end = dt_to_month_start_end(dt)
         assert start == datetime(2023, 10, 1, 0, 0)
         assert end == datetime(2023, 10, 31, 23, 59)
+
+
+class Test_date_str_to_start_end:
+    def test_開始日の0時0分と終了日の23時59分を取得できること(self):
+        start, end = date_str_to_start_end("2025-01-01", "2025-12-31")
+        assert start == datetime(2025, 1, 1, 0, 0)
+        assert end == datetime(2025, 12, 31, 23, 59)
+
+    def test_形式が不正な場合はValueErrorが発生すること(self):
+        with pytest.raises(ValueError):
+            date_str_to_start_end("2025/01/01", "2025-12-31")
@@ -1,4 +1,11 @@
-from notiontaskr.util.validator import has_emoji, is_emoji_matches
+import hashlib
+import hmac
+
+from notiontaskr.util.validator import (
+    has_emoji,
+    is_emoji_matches,
+    is_valid_signature,
+)
 
 
 class Test_has_emoji:
@@ -25,3 +32,17 @@ class Test_is_emoji_matches:
         emoji2 = "🌎"
         result = is_emoji_matches(emoji1, emoji2)
         assert result is False
+
+
+class Test_is_valid_signature:
+    def test_署名がボディのHMACと一致する場合にTrueを返すこと(self):
+        body = b'{"type":"page.properties_updated"}'
+        signature = "sha256=" + hmac.new(b"secret", body, hashlib.sha256).hexdigest()
+        result = is_valid_signature(body, signature, "secret")
+        assert result is True
+
+    def test_ボディが改ざんされた場合にFalseを返すこと(self):
+        body = b'{"type":"page.properties_updated"}'
+        signature = "sha256=" + hmac.new(b"secret", body, hashlib.sha256).hexdigest()
+        result = is_valid_signature(body + b" ", signature, "secret")
+        assert result is False